@@ -0,0 +1,75 @@
+"""
+여러 사용자가 서로 다른 플레이트를 동시에 분석할 때: 순서대로 처리 vs 작업 풀 (JobPool) 벤치마크
+플레이트마다 파싱 -> blank 보정 -> group 통계, 합성 SpectraMax 파일 (기본: 4개, 72시간, 30초 간격, 384 well)
+
+    python benchmarks/bench_jobs.py --plates 4 --workers 1 2 4
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_parse_time import best_of
+from synthetic import PLATE_SHAPES, write_run
+from od_jobs import Job, JobPool
+from od_processing import correct_blanks, group_stats, read_plate
+
+STAGES = ["parse", "blank", "stats"]
+
+
+def analyze(job, layout_path, data_path, engine):
+    job.advance("parse")
+    with open(data_path, "rb") as data_file:
+        plate = read_plate(layout_path, data_file, engine)
+    job.advance("blank")
+    plate, _ = correct_blanks(plate)
+    job.advance("stats")
+    return group_stats(plate)
+
+
+def run_pool(runs, workers, engine):
+    """플레이트마다 새 key로 제출 (결과 캐시 없이) -> 전체 시간"""
+    pool = JobPool(workers)
+    start = time.perf_counter()
+    jobs = [pool.submit((i, start), analyze, STAGES, *run, engine) for i, run in enumerate(runs)]
+    for job in jobs:
+        pool.wait(job)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--plates", type=int, default=4)
+    parser.add_argument("--hours", type=float, default=72)
+    parser.add_argument("--interval", type=int, default=30, help="측정 간격 (초)")
+    parser.add_argument("--wells", type=int, choices=sorted(PLATE_SHAPES), default=384)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--engine", default="c", choices=["c", "pyarrow"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = []
+        for i in range(args.plates):
+            layout_path = os.path.join(tmp, f"p{i}_layout.csv")
+            data_path = os.path.join(tmp, f"p{i}_data.csv")
+            info = write_run(layout_path, data_path, args.wells, args.hours, args.interval, seed=i)
+            runs.append((layout_path, data_path))
+
+        print(f"{args.plates} plates x {info['timepoints']:,} rows x {info['wells']} wells "
+              f"({info['bytes'] / 1e6:.1f} MB each), {os.cpu_count()} CPUs")
+
+        def sequential():
+            return [analyze(Job(i, STAGES), *run, args.engine) for i, run in enumerate(runs)]
+
+        t_seq, _ = best_of(sequential, args.repeat)
+        print(f"sequential:          {t_seq:8.3f} s")
+        for workers in args.workers:
+            t_pool = min(run_pool(runs, workers, args.engine) for _ in range(args.repeat))
+            print(f"JobPool({workers} workers): {t_pool:8.3f} s  ({t_seq / t_pool:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+parse_time (행 단위 apply) vs parse_time_series (벡터화) 벤치마크
+합성 멀티데이 SpectraMax 파일(기본: 72시간, 2분 간격, 384 well)로 측정
+
+    python benchmarks/bench_parse_time.py --hours 72 --interval 120 --wells 384
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from synthetic import PLATE_SHAPES, write_run
+from od_processing import parse_time, parse_time_series
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hours", type=float, default=72)
+    parser.add_argument("--interval", type=int, default=120, help="측정 간격 (초)")
+    parser.add_argument("--wells", type=int, choices=sorted(PLATE_SHAPES), default=384)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.csv")
+        n_rows = write_run(os.path.join(tmp, "layout.csv"), path, args.wells, args.hours, args.interval)["timepoints"]
+        times = pd.read_csv(path, skiprows=3, encoding="latin1", usecols=["Time"])["Time"]
+
+    t_apply, expected = best_of(lambda: times.apply(parse_time).astype(float), args.repeat)
+    t_vec, result = best_of(lambda: parse_time_series(times), args.repeat)
+
+    np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
+    print(f"rows: {n_rows:,} (max {expected.max():.2f} h)")
+    print(f"apply(parse_time):    {t_apply * 1000:8.2f} ms")
+    print(f"parse_time_series:    {t_vec * 1000:8.2f} ms  ({t_apply / t_vec:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+OD plotter 처리 함수 헤드리스 벤치마크 (Streamlit 없이)
+합성 플레이트를 여러 크기로 만들어 단계별 시간 / 처리량 / tracemalloc 최대 메모리를 기록
+
+    python benchmarks/bench_pipeline.py --wells 96 384 1536 --hours 24 72 --output bench.json
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_parse_time import best_of
+from synthetic import write_run
+from od_growth import growth_summary
+from od_plot import downsample_stats
+from od_processing import BLANK_MODES, CSV_ENGINES, correct_blanks, group_stats, read_plate
+from od_profile import Profiler
+
+
+def run_size(n_wells, hours, interval, repeat, memory, tmp):
+    """
+    플레이트 하나를 만들어 read -> blank 보정 -> 통계 -> 성장 파라미터 -> downsample 순서로 측정
+    """
+    layout_path = os.path.join(tmp, f"w{n_wells}_h{hours}_layout.csv")
+    data_path = os.path.join(tmp, f"w{n_wells}_h{hours}_data.csv")
+    info = write_run(layout_path, data_path, n_wells, hours, interval)
+    cells = info["timepoints"] * info["wells"]
+    rows = []
+
+    def measure(stage, func, file_bytes=None):
+        seconds, result = best_of(func, repeat)
+        peak_mb = None
+        if memory:
+            profiler = Profiler(trace_memory=True)
+            with profiler.activate(), profiler.stage(stage):
+                func()
+            peak_mb = profiler.records[0]["peak_mb"]
+        rows.append({
+            "wells": info["wells"],
+            "hours": hours,
+            "timepoints": info["timepoints"],
+            "file_mb": info["bytes"] / 1e6,
+            "stage": stage,
+            "seconds": seconds,
+            "mcells_per_s": cells / seconds / 1e6,
+            "mb_per_s": file_bytes / seconds / 1e6 if file_bytes else None,
+            "peak_mb": peak_mb,
+        })
+        return result
+
+    def read(engine):
+        with open(data_path, "rb") as data_file:
+            return read_plate(layout_path, data_file, engine)
+
+    for engine in CSV_ENGINES:
+        plate = measure(f"read_plate[{engine}]", lambda: read(engine), info["bytes"])
+    corrected = {
+        mode: measure(f"correct_blanks[{mode}]", lambda: correct_blanks(plate, mode)[0]) for mode in BLANK_MODES
+    }
+    plate = corrected[BLANK_MODES[0]]
+    stats = measure("group_stats", lambda: group_stats(plate))
+    measure("growth_summary", lambda: growth_summary(plate))
+    groups = sorted(stats["Group"].unique())
+    measure("downsample[LTTB]", lambda: downsample_stats(stats, groups, "mean", 1000))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--wells", type=int, nargs="+", default=[96, 384, 1536])
+    parser.add_argument("--hours", type=float, nargs="+", default=[24, 72])
+    parser.add_argument("--interval", type=int, default=120, help="측정 간격 (초)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 측정 생략")
+    parser.add_argument("--output", help="결과 저장 (.json 또는 .csv)")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_wells in args.wells:
+            for hours in args.hours:
+                rows += run_size(n_wells, hours, args.interval, args.repeat, not args.no_memory, tmp)
+                last = rows[-1]
+                print(f"{n_wells} wells x {last['timepoints']:,} timepoints ({last['file_mb']:.1f} MB) done", file=sys.stderr)
+
+    df = pd.DataFrame(rows)
+    with pd.option_context("display.width", 200, "display.max_rows", None, "display.float_format", "{:.3f}".format):
+        print(df.drop(columns=["file_mb"]).to_string(index=False))
+
+    if args.output:
+        if args.output.endswith(".csv"):
+            df.to_csv(args.output, index=False)
+        else:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump({"interval_s": args.interval, "repeat": args.repeat, "results": rows}, f, indent=2)
+        print(f"saved: {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+CSV 파싱(cold) vs Feather 디스크 캐시 memory-map 로드(warm) 벤치마크
+합성 SpectraMax 파일(기본: 240시간, 30초 간격, 384 well)로 측정
+
+    python benchmarks/bench_plate_cache.py --hours 240 --interval 30 --wells 384
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_parse_time import best_of
+from synthetic import PLATE_SHAPES, write_run
+from od_cache import CACHE_AVAILABLE, PlateCache
+from od_processing import read_plate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hours", type=float, default=240)
+    parser.add_argument("--interval", type=int, default=30, help="측정 간격 (초)")
+    parser.add_argument("--wells", type=int, choices=sorted(PLATE_SHAPES), default=384)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if not CACHE_AVAILABLE:
+        sys.exit("pyarrow가 설치되어 있지 않아 디스크 캐시를 사용할 수 없습니다.")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = os.path.join(tmp, "synthetic.csv")
+        layout_path = os.path.join(tmp, "layout.csv")
+        n_rows = write_run(layout_path, data_path, args.wells, args.hours, args.interval)["timepoints"]
+        cache = PlateCache(os.path.join(tmp, "cache"))
+
+        def cold():
+            with open(data_path, "rb") as data_file:
+                return read_plate(layout_path, data_file)
+
+        t_cold, plate = best_of(cold, args.repeat)
+        cache.save("bench", plate)
+        t_warm, cached = best_of(lambda: cache.load("bench"), args.repeat)
+
+        np.testing.assert_array_equal(cached.values, plate.values)
+        np.testing.assert_array_equal(cached.hours, plate.hours)
+        np.testing.assert_array_equal(cached.group_codes, plate.group_codes)
+
+        print(f"rows: {n_rows:,} x {len(plate.wells)} wells, CSV {os.path.getsize(data_path) / 1e6:.1f} MB, "
+              f"cache {cache.total_bytes() / 1e6:.1f} MB")
+        print(f"cold CSV parse:       {t_cold * 1000:8.1f} ms")
+        print(f"warm cache (mmap):    {t_warm * 1000:8.1f} ms  ({t_cold / t_warm:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+멀티 페이지 앱 시작 시간 / 페이지별 첫 렌더링 시간 벤치마크 (AppTest, 서버 없이)
+페이지마다 새 프로세스에서 측정하므로 첫 렌더링에는 그 페이지의 import 비용이 포함됨
+
+    python benchmarks/bench_startup.py --repeat 3 --output startup.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "streamlit_app.py")
+PAGES = ["bb.py", "faa.py", "modified-gam.py", "media-recipes.py", "media-planner.py", "bulk-rna-seq-protocol.py", "od-plotter-spectramax.py"]
+HEAVY_MODULES = ("numpy", "pandas", "matplotlib", "altair", "pyarrow", "yaml")
+
+
+def heavy_loaded():
+    return [name for name in HEAVY_MODULES if name in sys.modules]
+
+
+def measure(page):
+    """
+    (자식 프로세스) streamlit import -> Home 렌더링 -> page 첫 렌더링 -> page 재실행 시간
+    """
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+
+    result = {"page": page or "Home", "import_s": time.perf_counter() - start}
+
+    os.chdir(ROOT)
+    at = AppTest.from_file(APP, default_timeout=120)
+    start = time.perf_counter()
+    at.run()
+    result["home_s"] = time.perf_counter() - start
+    result["home_modules"] = heavy_loaded()
+
+    if page:
+        at.switch_page(page)
+        start = time.perf_counter()
+        at.run()
+        result["first_render_s"] = time.perf_counter() - start
+        start = time.perf_counter()
+        at.run()
+        result["rerun_s"] = time.perf_counter() - start
+        result["page_modules"] = heavy_loaded()
+        result["error"] = bool(at.exception)
+    return result
+
+
+def run_child(page):
+    args = [sys.executable, os.path.abspath(__file__), "--child"] + ([page] if page else [])
+    out = subprocess.run(args, capture_output=True, text=True, check=True, cwd=ROOT).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", nargs="+", default=PAGES)
+    parser.add_argument("--repeat", type=int, default=3, help="페이지별 반복 (최솟값 사용)")
+    parser.add_argument("--output", help="결과 저장 (.json 또는 .csv)")
+    parser.add_argument("--child", nargs="?", const="", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        print(json.dumps(measure(args.child or None)))
+        return
+
+    # 자식 프로세스의 모듈 측정에 섞이지 않도록 부모에서만 import
+    import pandas as pd
+
+    rows = []
+    for page in [None] + args.pages:
+        runs = [run_child(page) for _ in range(args.repeat)]
+        best = min(runs, key=lambda r: r.get("first_render_s", r["home_s"]))
+        rows.append(best)
+        print(f"{best['page']} done", file=sys.stderr)
+
+    df = pd.DataFrame(rows)
+    for column in ("home_modules", "page_modules"):
+        if column in df:
+            df[column] = df[column].map(lambda m: ",".join(m) if isinstance(m, list) else "")
+    with pd.option_context("display.width", 200, "display.float_format", "{:.3f}".format):
+        print(df.to_string(index=False))
+
+    if args.output:
+        if args.output.endswith(".csv"):
+            df.to_csv(args.output, index=False)
+        else:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump({"repeat": args.repeat, "results": rows}, f, indent=2)
+        print(f"saved: {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+벤치마크용 합성 SpectraMax export + Plate Layout 생성기
+- Time 헤더 앞 프리앰블, 24시간 이상은 d.hh:mm:ss, 끝에 ~End 꼬리 줄
+- 96 / 384 / 1536 well (1536은 A..Z, AA..AF 행)
+- strain x 배지 group + 배지별 blank-* group, 로지스틱 성장 곡선 + 노이즈
+
+    python benchmarks/synthetic.py out/ --wells 1536 --hours 72 --interval 120
+"""
+import argparse
+import os
+import string
+
+import numpy as np
+import pandas as pd
+
+PLATE_SHAPES = {96: (8, 12), 384: (16, 24), 1536: (32, 48)}
+DEFAULT_STRAINS = ("WT", "mut", "dko")
+DEFAULT_MEDIA = ("LB", "M9")
+PREAMBLE = "##BLOCKS= 1\nPlate:,Plate1,1.3,TimeFormat,Kinetic,Absorbance,Raw,FALSE,1,,,,,,1,600,1,12,{wells},,,\n\n"
+TRAILER = "\n~End\nOriginal Filename: synthetic; Date Last Saved: 1/1/2024 00:00:00 AM\n"
+
+
+def format_time(seconds):
+    """초 -> SpectraMax Time 문자열 (24시간 이상은 d.hh:mm:ss)"""
+    days, rem = divmod(int(seconds), 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes, secs = divmod(rem, 60)
+    if days:
+        return f"{days}.{hours:02d}:{minutes:02d}:{secs:02d}"
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+
+def row_labels(n_rows):
+    """A..Z 다음은 AA, AB, ... (1536 well 플레이트)"""
+    letters = string.ascii_uppercase
+    return [letters[i] if i < 26 else letters[i // 26 - 1] + letters[i % 26] for i in range(n_rows)]
+
+
+def plate_wells(n_wells):
+    """well 수 -> (행 이름 리스트, 열 수)"""
+    if n_wells not in PLATE_SHAPES:
+        raise ValueError(f"지원하는 well 수: {sorted(PLATE_SHAPES)}")
+    n_rows, n_cols = PLATE_SHAPES[n_wells]
+    return row_labels(n_rows), n_cols
+
+
+def layout_groups(strains=DEFAULT_STRAINS, media=DEFAULT_MEDIA):
+    """strain-배지 group + 배지별 blank group"""
+    return [f"{s}-{m}" for m in media for s in strains] + [f"blank-{m}" for m in media]
+
+
+def make_layout(n_wells=384, strains=DEFAULT_STRAINS, media=DEFAULT_MEDIA, replicates=3):
+    """
+    Plate Layout DataFrame (행 이름 + 1..N 열, 값은 <group>-<replicate>)
+    연속된 replicates개 well이 같은 group
+    """
+    rows, n_cols = plate_wells(n_wells)
+    groups = layout_groups(strains, media)
+    idx = np.arange(len(rows) * n_cols)
+    names = np.array([
+        f"{groups[(i // replicates) % len(groups)]}-{i % replicates + 1}" for i in idx
+    ], dtype=object).reshape(len(rows), n_cols)
+    df = pd.DataFrame(names, index=rows, columns=[str(c) for c in range(1, n_cols + 1)])
+    return df
+
+
+def simulate_od(hours, well_groups, seed=0):
+    """
+    로지스틱 성장 OD (T, W): group마다 µ / K / lag, well마다 약간의 편차
+    blank는 배경 OD(0.09 근처) + 노이즈
+    """
+    rng = np.random.default_rng(seed)
+    group_codes, groups = pd.factorize(pd.Index(well_groups))
+    n_groups = len(groups)
+    mu = rng.uniform(0.3, 0.8, n_groups)[group_codes] * rng.normal(1, 0.03, len(group_codes))
+    capacity = rng.uniform(0.8, 1.5, n_groups)[group_codes]
+    lag = rng.uniform(1, 6, n_groups)[group_codes]
+    n0 = 0.005
+
+    t = np.clip(hours[:, None] - lag, 0, None)
+    od = n0 * capacity / (n0 + (capacity - n0) * np.exp(-mu * t))
+    is_blank = np.asarray(pd.Index(groups).str.startswith("blank"))[group_codes]
+    od[:, is_blank] = 0.0
+    od += 0.09 + 0.003 * rng.standard_normal(od.shape)
+    return od
+
+
+def write_data(path, seconds, wells, od, overflow=0.0, trailer=True, seed=0):
+    """
+    SpectraMax Raw Data CSV 작성 (latin1, Temperature 열 포함)
+    overflow: OVRFLW 문자열로 바꿀 값의 비율
+    """
+    df = pd.DataFrame(od.round(4), columns=wells)
+    if overflow:
+        rng = np.random.default_rng(seed)
+        df = df.astype(object).mask(rng.random(od.shape) < overflow, "OVRFLW")
+    df.insert(0, "Temperature(°C)", 37.0)
+    df.insert(0, "Time", [format_time(s) for s in seconds])
+    with open(path, "w", encoding="latin1", newline="") as f:
+        f.write(PREAMBLE.format(wells=len(wells)))
+        df.to_csv(f, index=False, float_format="%.4f", lineterminator="\n")
+        if trailer:
+            f.write(TRAILER)
+
+
+def write_run(layout_path, data_path, n_wells=384, hours=72, interval=120, seed=0, overflow=0.0, replicates=3):
+    """
+    layout + data 파일 한 쌍 작성 -> {"timepoints", "wells", "bytes"}
+    """
+    layout = make_layout(n_wells, replicates=replicates)
+    layout.to_csv(layout_path)
+
+    wells = [f"{r}{c}" for r in layout.index for c in layout.columns]
+    well_groups = [name.rsplit("-", 1)[0] for name in layout.to_numpy().ravel()]
+    seconds = np.arange(0, hours * 3600 + 1, interval)
+    od = simulate_od(seconds / 3600, well_groups, seed)
+    write_data(data_path, seconds, wells, od, overflow=overflow, seed=seed)
+    return {"timepoints": len(seconds), "wells": len(wells), "bytes": os.path.getsize(data_path)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("output_dir")
+    parser.add_argument("--name", default="synthetic", help="<name>_layout.csv / <name>_data.csv")
+    parser.add_argument("--wells", type=int, choices=sorted(PLATE_SHAPES), default=384)
+    parser.add_argument("--hours", type=float, default=72)
+    parser.add_argument("--interval", type=int, default=120, help="측정 간격 (초)")
+    parser.add_argument("--plates", type=int, default=1, help="여러 플레이트 (seed만 다름, 배치 모드 테스트용)")
+    parser.add_argument("--overflow", type=float, default=0.0, help="OVRFLW 값 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for i in range(args.plates):
+        name = args.name if args.plates == 1 else f"{args.name}{i + 1}"
+        info = write_run(
+            os.path.join(args.output_dir, f"{name}_layout.csv"), os.path.join(args.output_dir, f"{name}_data.csv"),
+            args.wells, args.hours, args.interval, args.seed + i, args.overflow,
+        )
+        print(f"{name}: {info['timepoints']:,} timepoints x {info['wells']} wells, {info['bytes'] / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,393 @@
+import numpy as np
 import streamlit as st
 import pandas as pd
 
-def calculate_mix(components, num_samples, excess_pct):
+from checklist import checklist, run_settings
+
+# --- Protocol Data ---
+
+# 1. RNA Extraction
+MIX_RNA_SNAP = [
+    {"Reagent": "0.5M EDTA", "Volume per rxn (µL)": 18.0},
+    {"Reagent": "10% SDS", "Volume per rxn (µL)": 1.25},
+    {"Reagent": "B-mercaptoethanol", "Volume per rxn (µL)": 5.0},
+    {"Reagent": "Formamide", "Volume per rxn (µL)": 475.0},
+]
+STEPS_EXTRACTION = [
+    "Take 1mL of cell culture, spin 4,300g, 5min, 4°C.",
+    "Remove supernatant. Store pellets on dry ice or -80°C if needed.",
+    "Add ~200µl 0.1mm zirconia beads to frozen pellets.",
+    "**Prepare RNA-snap master mix** (Calculated above).",
+    "Resuspend cells in 500µl RNA-snap mix. Seal plate.",
+    "Place at -20°C for 10 min.",
+    "Bead beating: 2.5 min -> Cool 5 min -> Beat 2.5 min -> Cool 5 min -> Beat 2.5 min -> Cool 5 min.",
+    "Spin 4,300g, 5min, 4°C. Recover **200µL** supernatant to new plate.",
+    "**Zymo RNA Clean & Concentrate**:\n  - Add 600µl Ethanol (100%), mix.\n  - Bind to column, discard flow-through.\n  - Add 400µl RNA Prep Buffer, spin.\n  - Add 400µl RNA Prep Buffer (2nd time? check protocol), then 700µl Wash Buffer.\n  - Add 400µl Wash Buffer, spin 2 min dry.\n  - Elute in **30µl** nuclease-free water."
+]
+
+# 2. QC
+STEPS_QC = [
+    "Quantify using Qubit RNA Broad Range (BR) Assay kit (1-2µl input).",
+    "Target **15-20ug per pool** (or 400ng in 15µl if single sample).",
+    "Add 1µl SUPERase-IN if storing at -80°C (Optional)."
+]
+
+# 3. Frag & DNase
+MIX_FASTAP = [
+    {"Reagent": "Recombinant RNase Inhibitor; Takara, Cat.# 2313A", "Volume per rxn (µL)": 1.0},
+    {"Reagent": "Turbo DNase; Ambion/Applied Biosystems, Cat.# AM2239", "Volume per rxn (µL)": 4.0},
+    {"Reagent": "FastAP Thermosensitive Alkaline Phosphatase; Thermo Scientific, Cat.# EF0651", "Volume per rxn (µL)": 10.0},
+    {"Reagent": "Nuclease free water", "Volume per rxn (µL)": 5.0},
+]
+STEPS_FRAG = [
+    "Add 4µl FastAP buffer (10X) to each well (containing RNA). Mix.",
+    "Incubate: **94°C for 3 min** (or 92°C 2.5min for low integrity).",
+    "**Prepare FastAP Master Mix** (Calculated above).",
+    "Add **20µl** Master Mix to each well.",
+    "Incubate: **37°C for 30 min**. Place on ice immediately.",
+    "**2X SPRI Cleanup** (80µl beads). Elute in **7µl** water.",
+    "Move **5µl** to new tube for Ligation 1.",
+    "(Optional) Check remaining on Agilent Pico chip."
+]
+
+# 4. 3' Adapter Ligation
+MIX_LIG1 = [
+    {"Reagent": "10X T4 RNA Ligase buffer", "Volume per rxn (µL)": 2.0},
+    {"Reagent": "DMSO (100%)", "Volume per rxn (µL)": 1.8},
+    {"Reagent": "ATP (100mM)", "Volume per rxn (µL)": 0.2},
+    {"Reagent": "PEG 8000 (50%)", "Volume per rxn (µL)": 8.0},
+    {"Reagent": "Recombinant RNase Inhibitor; Takara, Cat.# 2313A", "Volume per rxn (µL)": 0.3},
+    {"Reagent": "T4 RNA Ligase 1; Enzynomics, Cat.# M042S", "Volume per rxn (µL)": 1.8},
+]
+STEPS_LIG1 = [
+    "Add 1µl of **Unique Adapter** (100uM) to 5µl RNA.",
+    "Heat **70°C for 2 min**, then cold block.",
+    "**Prepare Ligation Master Mix** (At RT, PEG is viscous!). *Protocol suggests 25% excess.*",
+    "Add **14.1 µl** Mix to RNA/Adapter.",
+    "Mix 10 times. Incubate **22°C for 1hr 30min**.",
+    "Add 60µl RLT buffer. Total 80µl.",
+    "**Pool samples** and clean up (Zymo C&C-5, 200nt cutoff):\n - Mix pooled sample 1:1 with (Binding Buffer+EtOH).\n - Bind, Wash steps.\n - Elute 2 times with 16µl (Final **32µl**).\n - Quantify with Qubit HS RNA."
+]
+
+# 5. rRNA Depletion
+# 현재 화면에는 표시하지 않음 (RNase H 단계 위주로 계산)
+MIX_HYBRIDIZATION = [
+     {"Reagent": "5M NaCl", "Volume per rxn (µL)": 0.6},
+     {"Reagent": "1M Tris-HCl (pH 7.5)", "Volume per rxn (µL)": 1.5},
+     {"Reagent": "Nuclease-free water (Adjust as needed)", "Volume per rxn (µL)": 12.9}, 
+     # Note: Protocol implies 15uL total reaction including 500ng RNA + Probe. 
+     # Assuming RNA+Probe volume is variable, this MM helps prep the buffer part.
+     # Simplified for scaling: creating a buffer mix to add to RNA+Probe.
+]
+
+MIX_RNASE_H = [
+    {"Reagent": "RNase H; Enzynomics, Cat.# M036S", "Volume per rxn (µL)": 3.0},
+    {"Reagent": "1M Tris-HCl (pH 7.5)", "Volume per rxn (µL)": 0.5},
+    {"Reagent": "5M NaCl", "Volume per rxn (µL)": 0.2},
+    {"Reagent": "1M MgCl2", "Volume per rxn (µL)": 0.4},
+    {"Reagent": "Nuclease-free water", "Volume per rxn (µL)": 0.9},
+]
+
+STEPS_RRNA = [
+    "**Hybridization**: Mix 500ng RNA, Probes, and Buffer components (Total 15µl).",
+    "Cycler: 95°C -> 45°C (-0.1°C/sec). Hold 45°C for 5 min.",
+    "**Prepare RNase H Master Mix** (Calculated above). Preheat to 45°C.",
+    "Add **5µl** RNase H Mix to reaction (Total 20µl).",
+    "Incubate **45°C for 30 min** (Lid 60°C).",
+    "Spin down, place on ice.",
+    "**2X SPRI Cleanup** (Part 1): Elute 26µl, take 25µl.",
+    "**2X SPRI Cleanup** (Part 2): Elute 15µl, take 14µl.",
+    "Store at -80°C or proceed."
+]
+
+# 6. Reverse Transcription
+MIX_RT = [
+    {"Reagent": "5X RT Buffer", "Volume per rxn (µL)": 4.0},
+    {"Reagent": "dNTP mix (10mM)", "Volume per rxn (µL)": 1.0},
+    {"Reagent": "100mM DTT", "Volume per rxn (µL)": 1.0},
+    {"Reagent": "Recombinant RNase Inhibitor; Takara, Cat.# 2313A", "Volume per rxn (µL)": 1.0},
+    {"Reagent": "Maxima H Minus Reverse Transcriptase (200 U/μL); Thermo Scientific, Cat.# EP0752", "Volume per rxn (µL)": 1.0},
+]
+STEPS_RT = [
+    "Take 10µl rRNA depleted RNA.",
+    "Add 2µl RT Primer (20uM). Heat **70°C for 2 min**, ice.",
+    "**Prepare RT Master Mix** (Calculated above).",
+    "Add **8µl** Master Mix (Total 20µl).",
+    "Incubate **55°C for 15 min**.",
+    "Add 1µl RNase H. Incubate **37°C for 20 min**.",
+    "**2X SPRI Cleanup**. Elute in **5µl** water. **KEEP BEADS**."
+]
+
+# 7. Adapter Ligation 2
+MIX_LIG2 = [
+    {"Reagent": "10X T4 Ligase Buffer", "Volume per rxn (µL)": 2.0},
+    {"Reagent": "DMSO (100%)", "Volume per rxn (µL)": 0.8},
+    {"Reagent": "ATP (100mM)", "Volume per rxn (µL)": 0.2},
+    {"Reagent": "PEG 8000 (50%)", "Volume per rxn (µL)": 8.5},
+    {"Reagent": "T4 RNA Ligase 1; Enzynomics, Cat.# M042S", "Volume per rxn (µL)": 1.5},
+]
+STEPS_LIG2 = [
+    "Add 2µl RS_2adap (40uM) to cDNA/bead mix.",
+    "Heat **75°C for 3 min**, ice.",
+    "**Prepare Ligation 2 Master Mix** (Calculated above).",
+    "Add **13µl** Mix to tube.",
+    "Incubate **22°C Overnight**.",
+    "**2X SPRI Cleanup**, elute 25µl.",
+    "**1.5X SPRI Cleanup**, elute 15µl."
+]
+
+# 8. PCR
+MIX_PCR = [
+    {"Reagent": "KOD ONE PCR MM; TOYOBO, Cat.# KMM-101", "Volume per rxn (µL)": 25.0},
+    {"Reagent": "Nuclease free water", "Volume per rxn (µL)": 10.0},
+    {"Reagent": "SYBR™ Gold Nucleic Acid Gel Stain (10,000X Concentrate in DMSO); Invitrogen, Cat.# S11494", "Volume per rxn (µL)": 1.0},
+]
+STEPS_PCR = [
+    "**Prepare PCR Master Mix** (KOD+Water+SYBR).",
+    "Combine: 10µl cDNA + 2.5µl Fwd Primer + 2.5µl Rev Primer + 36µl Master Mix.",
+    "**qPCR Cycling**:\n 1. 98°C 3m\n 2. 98°C 10s\n 3. 67°C 15s\n 4. 72°C 1m\n (Repeat 2-4)\n 5. 72°C 5min",
+    "Stop during exponential phase.",
+    "**2X SPRI Cleanup**, elute 22µl.",
+    "Run Egel (2%), Gel purify (Monarch).",
+    "Quantify (Qubit HS DNA). Load NextSeq."
+]
+
+
+# --- Sections (탭 이름, 제목, Master Mix, 절차, 메모, pooled) ---
+# pooled: Lig #1 끝에서 샘플을 pool로 합친 뒤의 섹션 (샘플 수 대신 pool 수로 계산)
+SECTIONS = [
+    {"tab": "1. Extraction", "title": "1. RNA Extraction (RNA-Snap)", "mix": MIX_RNA_SNAP, "steps": STEPS_EXTRACTION},
+    {"tab": "2. QC", "title": "2. RNA QC and Normalization", "mix": None, "steps": STEPS_QC},
+    {"tab": "3. Frag/DNase", "title": "3. Fragmentation and DNase Digestion", "mix": MIX_FASTAP, "steps": STEPS_FRAG},
+    {
+        "tab": "4. Lig #1", "title": "4. 3' DNA Adapter Ligation", "mix": MIX_LIG1, "steps": STEPS_LIG1,
+        "note": "*Note: Protocol recommends preparing reagent mix at RT and adding PEG slowly.*",
+    },
+    {
+        "tab": "5. Depletion", "title": "5. RNase H based rRNA Depletion", "mix": MIX_RNASE_H, "steps": STEPS_RRNA, "pooled": True,
+        "note": "*Note: Hybridization mix is calculated for the RNase H Step mainly. Check protocol for Probe mix specifics.*",
+    },
+    {"tab": "6. RT", "title": "6. Reverse Transcription", "mix": MIX_RT, "steps": STEPS_RT, "pooled": True},
+    {"tab": "7. Lig #2", "title": "7. Adapter Ligation #2", "mix": MIX_LIG2, "steps": STEPS_LIG2, "pooled": True},
+    {"tab": "8. PCR", "title": "8. PCR Amplification", "mix": MIX_PCR, "steps": STEPS_PCR, "pooled": True},
+]
+TAB_NAMES = [section["tab"] for section in SECTIONS]
+# 체크 상태 저장 파일 이름 (checklist.py)
+CHECKLIST_NAME = "rna-seq"
+POOLED = np.array([section.get("pooled", False) for section in SECTIONS])
+REAGENT_TAB = "🧾 Reagent Totals"
+PLANNER_TAB = "🗂️ Batch Planner"
+PLATE_COLUMNS = {"Plate": "", "Samples": 0, "Pools": 1}
+
+# 숫자가 없는 괄호 메모 (예: "(Adjust as needed)")는 키에서 제외, "(100mM)" 같은 농도는 유지
+REAGENT_NOTE = r"\s*\([^()\d]*\)"
+
+
+def build_reagent_table():
+    """
+    모든 섹션의 Master Mix를 한 번만 이어 붙인 테이블 + 정규화된 시약 키
+    키: ';' 뒤 제조사/카탈로그 제외, 괄호 메모 제외, 하이픈/공백 통일, 대소문자 무시
+    """
+    df = pd.concat(
+        [pd.DataFrame(sec["mix"]).assign(Section=i, Tab=sec["tab"]) for i, sec in enumerate(SECTIONS) if sec["mix"]],
+        ignore_index=True,
+    )
+    name = df["Reagent"].str.split(";", n=1)
+    df["Catalog"] = name.str[1].str.strip().fillna("")
+    df["Key"] = (
+        name.str[0].str.replace(REAGENT_NOTE, "", regex=True)
+        .str.replace(r"[\s\-]+", " ", regex=True).str.strip().str.casefold()
+    )
+    return df
+
+
+REAGENTS = build_reagent_table()
+
+MIX_COLUMN_CONFIG = {
+    "Volume per rxn (µL)": st.column_config.NumberColumn(format="%.2f"),
+    "Total Volume (µL)": st.column_config.NumberColumn(format="%.1f"),
+}
+TOTALS_COLUMN_CONFIG = {
+    "Per Sample (µL)": st.column_config.NumberColumn(format="%.2f"),
+    "Per Pool (µL)": st.column_config.NumberColumn(format="%.2f"),
+    "Total Volume (µL)": st.column_config.NumberColumn(format="%.1f"),
+    "Total Volume (mL)": st.column_config.NumberColumn(format="%.3f"),
+}
+
+
+@st.cache_data(max_entries=256)
+def calculate_mix(section, num_samples, excess_pct):
     """
-    Master Mix 계산 함수
+    Master Mix 계산 함수 ((section, num_samples, excess_pct) 별로 캐시)
     """
-    df = pd.DataFrame(components)
+    df = pd.DataFrame(SECTIONS[section]["mix"])
     factor = num_samples * (1 + excess_pct / 100)
     df['Total Volume (µL)'] = df['Volume per rxn (µL)'] * factor
     return df
 
-def display_section(title, mix_data, protocol_steps, num_samples, excess_pct):
+@st.cache_data(max_entries=256)
+def reagent_rollup(section_samples, excess_pct, split_pooled=False):
+    """
+    섹션별 샘플 수 (len(SECTIONS),) -> 시약별 총 사용량 (groupby 한 번)
+    같은 시약이 여러 Mix에 있으면 합산
+    split_pooled: pool 전 섹션 양은 Per Sample, pool 후 섹션 양은 Per Pool로 나눠서 합산
+    (섹션마다 반응 수가 다를 때 둘을 더한 값은 의미가 없음)
+    """
+    factor = np.asarray(section_samples, dtype=float)[REAGENTS["Section"]] * (1 + excess_pct / 100)
+    per_rxn = REAGENTS["Volume per rxn (µL)"]
+    df = REAGENTS.assign(**{"Total Volume (µL)": per_rxn.to_numpy() * factor})
+    per_rxn_columns = {"Per Sample (µL)": ("Volume per rxn (µL)", "sum")}
+    if split_pooled:
+        pooled = POOLED[REAGENTS["Section"]]
+        df["Per Sample (µL)"] = per_rxn.where(~pooled, 0.0)
+        df["Per Pool (µL)"] = per_rxn.where(pooled, 0.0)
+        per_rxn_columns = {column: (column, "sum") for column in ("Per Sample (µL)", "Per Pool (µL)")}
+    totals = df.groupby("Key", sort=False).agg(**{
+        "Reagent": ("Reagent", "first"),
+        "Catalog": ("Catalog", "first"),
+        "Used In": ("Tab", ", ".join),
+        **per_rxn_columns,
+        "Total Volume (µL)": ("Total Volume (µL)", "sum"),
+    })
+    totals["Reagent"] = totals["Reagent"].str.split(";", n=1).str[0]
+    totals["Total Volume (mL)"] = totals["Total Volume (µL)"] / 1000
+    return totals.sort_values("Total Volume (µL)", ascending=False).reset_index(drop=True)
+
+def display_reagents(num_samples, excess_pct):
+    """
+    전체 프로토콜 시약 합계 + Pick list 다운로드
+    """
+    st.header(REAGENT_TAB)
+    st.caption(f"All master mixes for n={num_samples}, +{excess_pct}% excess. Shared reagents are summed across sections.")
+    totals = reagent_rollup((num_samples,) * len(SECTIONS), excess_pct)
+    st.dataframe(totals, hide_index=True, width="stretch", column_config=TOTALS_COLUMN_CONFIG)
+    pick_list = totals.assign(Picked="")[["Picked", "Reagent", "Catalog", "Total Volume (µL)", "Used In"]]
+    st.download_button(
+        "📥 Pick List (CSV)", pick_list.to_csv(index=False, float_format="%.1f").encode("utf-8"),
+        f"rnaseq_pick_list_n{num_samples}.csv", "text/csv",
+    )
+
+@st.cache_data(max_entries=64)
+def plan_batches(plates, excess_pct):
+    """
+    plate/pool 표 (Plate, Samples, Pools) -> 모든 plate x 모든 Mix 시약을 한 번에 계산
+    pool 전 섹션은 샘플 수, pool 후 섹션은 pool 수로 scale
+    반환: (plate별 worksheet, 전체 합계)
+    """
+    names = plates["Plate"].to_numpy(dtype=object)
+    samples = plates["Samples"].to_numpy(dtype=float)
+    pools = plates["Pools"].to_numpy(dtype=float)
+
+    counts = np.where(POOLED, pools[:, None], samples[:, None])  # (P, S)
+    rxns = counts[:, REAGENTS["Section"]]  # (P, R)
+    volume = REAGENTS["Volume per rxn (µL)"].to_numpy()
+    total = rxns * volume * (1 + excess_pct / 100)
+
+    n_plates, n_reagents = rxns.shape
+    sheet = pd.DataFrame({
+        "Plate": np.repeat(names, n_reagents),
+        "Section": np.tile(REAGENTS["Tab"].to_numpy(), n_plates),
+        "Scale": np.tile(np.where(POOLED[REAGENTS["Section"]], "pools", "samples"), n_plates),
+        "Reactions": rxns.ravel().astype(int),
+        "Reagent": np.tile(REAGENTS["Reagent"].to_numpy(), n_plates),
+        "Volume per rxn (µL)": np.tile(volume, n_plates),
+        "Total Volume (µL)": total.ravel(),
+    })
+    totals = reagent_rollup(tuple(counts.sum(axis=0)), excess_pct, split_pooled=True)
+    return sheet, totals
+
+def batch_worksheet(sheet, totals):
+    """plate별 Mix + 전체 합계 (Plate = "TOTAL")를 한 시트로"""
+    total_rows = pd.DataFrame({
+        "Plate": "TOTAL",
+        "Section": totals["Used In"],
+        "Reagent": totals["Reagent"],
+        "Total Volume (µL)": totals["Total Volume (µL)"],
+    })
+    return pd.concat([sheet, total_rows], ignore_index=True)
+
+def remember_plates(key):
+    """
+    data_editor 변경 내용을 session_state.batch_plates에 반영 후 editor를 새로 시작
+    (탭이 렌더링되지 않아도 plate 표 유지)
+    """
+    edits = st.session_state[key]
+    df = st.session_state.batch_plates.copy()
+    for row, values in edits["edited_rows"].items():
+        for column, value in values.items():
+            df.loc[df.index[int(row)], column] = value
+    df = df.drop(df.index[edits["deleted_rows"]])
+    df = pd.concat([df, pd.DataFrame(edits["added_rows"], columns=list(PLATE_COLUMNS))], ignore_index=True)
+    df = df.fillna(PLATE_COLUMNS)
+    df["Plate"] = df["Plate"].where(df["Plate"] != "", [f"Plate {i}" for i in range(1, len(df) + 1)])
+    st.session_state.batch_plates = df.astype({"Samples": int, "Pools": int})
+    st.session_state.plates_version += 1
+
+def display_planner(num_samples, excess_pct):
+    """
+    여러 plate/pool의 Master Mix를 한 번에 계산하는 Batch Planner
+    """
+    st.header(PLANNER_TAB)
+    pooled = ", ".join(section["tab"] for section in SECTIONS if section.get("pooled"))
+    st.caption(f"Samples are pooled at the end of Lig #1. Pre-pool mixes scale with **Samples**, "
+               f"post-pool mixes ({pooled}) with **Pools**. +{excess_pct}% excess.")
+    st.session_state.setdefault("plates_version", 0)
+    if "batch_plates" not in st.session_state:
+        st.session_state.batch_plates = pd.DataFrame([{"Plate": "Plate 1", "Samples": num_samples, "Pools": 1}])
+
+    key = f"batch_plates_{st.session_state.plates_version}"
+    st.data_editor(
+        st.session_state.batch_plates, key=key, num_rows="dynamic", hide_index=True, width="stretch",
+        on_change=remember_plates, args=(key,),
+        column_config={
+            "Samples": st.column_config.NumberColumn(min_value=0, step=1),
+            "Pools": st.column_config.NumberColumn(min_value=0, step=1),
+        },
+    )
+    plates = st.session_state.batch_plates
+    if plates.empty:
+        return
+    if (plates["Pools"] > plates["Samples"]).any():
+        st.warning("Some plates have more pools than samples.")
+
+    sheet, totals = plan_batches(plates, excess_pct)
+    st.markdown(f"**{len(plates)} plates · {plates['Samples'].sum()} samples · {plates['Pools'].sum()} pools**")
+    st.subheader("🧾 Totals")
+    st.dataframe(totals, hide_index=True, width="stretch", column_config=TOTALS_COLUMN_CONFIG)
+    with st.expander("Per-plate mixes"):
+        st.dataframe(sheet, hide_index=True, width="stretch", column_config=MIX_COLUMN_CONFIG)
+    st.download_button(
+        "📥 Batch Worksheet (CSV)",
+        batch_worksheet(sheet, totals).to_csv(index=False, float_format="%.2f").encode("utf-8"),
+        "rnaseq_batch_worksheet.csv", "text/csv",
+    )
+
+def display_section(section, num_samples, excess_pct):
     """
     각 섹션별 UI 렌더링 (마스터믹스 + 체크리스트)
     """
+    title = SECTIONS[section]["title"]
     st.header(title)
     
     # 1. Master Mix Calculator
-    if mix_data:
+    if SECTIONS[section]["mix"]:
         st.subheader(f"🧪 Master Mix (n={num_samples}, +{excess_pct}%)")
-        df = calculate_mix(mix_data, num_samples, excess_pct)
-        st.dataframe(
-            df.style.format({"Volume per rxn (µL)": "{:.2f}", "Total Volume (µL)": "{:.1f}"}),
-            use_container_width=True,
-            hide_index=True
-        )
-        total_vol = df['Total Volume (µL)'].sum()
+        df = calculate_mix(section, num_samples, excess_pct)
+        st.dataframe(df, column_config=MIX_COLUMN_CONFIG, width="stretch", hide_index=True)
         one_rxn_vol = df['Volume per rxn (µL)'].sum()
         st.info(f"Dispense **{one_rxn_vol:.1f} µL** per well from this mix.")
 
-    # 2. Protocol Steps
+    # 2. Protocol Steps (fragment: 체크해도 마스터믹스 표는 다시 계산하지 않음)
     st.subheader("📋 Procedure")
-    for i, step in enumerate(protocol_steps, 1):
-        st.checkbox(step, key=f"{title}_{i}")
+    checklist(CHECKLIST_NAME, [(f"{title}_{i}", step) for i, step in enumerate(SECTIONS[section]["steps"], 1)])
     st.divider()
 
+    if "note" in SECTIONS[section]:
+        st.caption(SECTIONS[section]["note"])
+
+def open_section(tab):
+    st.session_state.section_tab = tab
+
 def main():
     st.set_page_config(page_title="RNA-seq Library Prep", page_icon="🧬", layout="wide")
     
@@ -46,197 +399,27 @@ def main():
         st.header("⚙️ Settings")
         num_samples = st.number_input("Number of Samples", min_value=1, value=12, step=1)
         excess_pct = st.slider("Dead Volume / Excess (%)", 0, 50, 10, help="Reagent waste margin")
+        run_settings(CHECKLIST_NAME)
         
         st.markdown("---")
         st.markdown("### 📚 Quick Links")
-        st.markdown("[1. RNA Extraction](#1-rna-extraction-rna-snap)")
-        st.markdown("[2. QC & Norm](#2-rna-qc-and-normalization)")
-        st.markdown("[3. Frag & DNase](#3-fragmentation-and-dnase-digestion)")
-        st.markdown("[4. 3' Adapter Ligation](#4-3-dna-adapter-ligation)")
-        st.markdown("[5. rRNA Depletion](#5-rnase-h-based-rrna-depletion)")
-        st.markdown("[6. Reverse Transcription](#6-reverse-transcription)")
-        st.markdown("[7. Adapter Ligation #2](#7-adapter-ligation-2)")
-        st.markdown("[8. PCR Amplification](#8-pcr-amplification)")
-
-    # --- Define Data ---
-    
-    # 1. RNA Extraction
-    mix_rna_snap = [
-        {"Reagent": "0.5M EDTA", "Volume per rxn (µL)": 18.0},
-        {"Reagent": "10% SDS", "Volume per rxn (µL)": 1.25},
-        {"Reagent": "B-mercaptoethanol", "Volume per rxn (µL)": 5.0},
-        {"Reagent": "Formamide", "Volume per rxn (µL)": 475.0},
-    ]
-    steps_extraction = [
-        "Take 1mL of cell culture, spin 4,300g, 5min, 4°C.",
-        "Remove supernatant. Store pellets on dry ice or -80°C if needed.",
-        "Add ~200µl 0.1mm zirconia beads to frozen pellets.",
-        "**Prepare RNA-snap master mix** (Calculated above).",
-        "Resuspend cells in 500µl RNA-snap mix. Seal plate.",
-        "Place at -20°C for 10 min.",
-        "Bead beating: 2.5 min -> Cool 5 min -> Beat 2.5 min -> Cool 5 min -> Beat 2.5 min -> Cool 5 min.",
-        "Spin 4,300g, 5min, 4°C. Recover **200µL** supernatant to new plate.",
-        "**Zymo RNA Clean & Concentrate**:\n  - Add 600µl Ethanol (100%), mix.\n  - Bind to column, discard flow-through.\n  - Add 400µl RNA Prep Buffer, spin.\n  - Add 400µl RNA Prep Buffer (2nd time? check protocol), then 700µl Wash Buffer.\n  - Add 400µl Wash Buffer, spin 2 min dry.\n  - Elute in **30µl** nuclease-free water."
-    ]
-
-    # 2. QC
-    steps_qc = [
-        "Quantify using Qubit RNA Broad Range (BR) Assay kit (1-2µl input).",
-        "Target **15-20ug per pool** (or 400ng in 15µl if single sample).",
-        "Add 1µl SUPERase-IN if storing at -80°C (Optional)."
-    ]
-
-    # 3. Frag & DNase
-    mix_fastap = [
-        {"Reagent": "Recombinant RNase Inhibitor; Takara, Cat.# 2313A", "Volume per rxn (µL)": 1.0},
-        {"Reagent": "Turbo DNase; Ambion/Applied Biosystems, Cat.# AM2239", "Volume per rxn (µL)": 4.0},
-        {"Reagent": "FastAP Thermosensitive Alkaline Phosphatase; Thermo Scientific, Cat.# EF0651", "Volume per rxn (µL)": 10.0},
-        {"Reagent": "Nuclease free water", "Volume per rxn (µL)": 5.0},
-    ]
-    steps_frag = [
-        "Add 4µl FastAP buffer (10X) to each well (containing RNA). Mix.",
-        "Incubate: **94°C for 3 min** (or 92°C 2.5min for low integrity).",
-        "**Prepare FastAP Master Mix** (Calculated above).",
-        "Add **20µl** Master Mix to each well.",
-        "Incubate: **37°C for 30 min**. Place on ice immediately.",
-        "**2X SPRI Cleanup** (80µl beads). Elute in **7µl** water.",
-        "Move **5µl** to new tube for Ligation 1.",
-        "(Optional) Check remaining on Agilent Pico chip."
-    ]
-
-    # 4. 3' Adapter Ligation
-    mix_lig1 = [
-        {"Reagent": "10X T4 RNA Ligase buffer", "Volume per rxn (µL)": 2.0},
-        {"Reagent": "DMSO (100%)", "Volume per rxn (µL)": 1.8},
-        {"Reagent": "ATP (100mM)", "Volume per rxn (µL)": 0.2},
-        {"Reagent": "PEG 8000 (50%)", "Volume per rxn (µL)": 8.0},
-        {"Reagent": "Recombinant RNase Inhibitor; Takara, Cat.# 2313A", "Volume per rxn (µL)": 0.3},
-        {"Reagent": "T4 RNA Ligase 1; Enzynomics, Cat.# M042S", "Volume per rxn (µL)": 1.8},
-    ]
-    steps_lig1 = [
-        "Add 1µl of **Unique Adapter** (100uM) to 5µl RNA.",
-        "Heat **70°C for 2 min**, then cold block.",
-        "**Prepare Ligation Master Mix** (At RT, PEG is viscous!). *Protocol suggests 25% excess.*",
-        "Add **14.1 µl** Mix to RNA/Adapter.",
-        "Mix 10 times. Incubate **22°C for 1hr 30min**.",
-        "Add 60µl RLT buffer. Total 80µl.",
-        "**Pool samples** and clean up (Zymo C&C-5, 200nt cutoff):\n - Mix pooled sample 1:1 with (Binding Buffer+EtOH).\n - Bind, Wash steps.\n - Elute 2 times with 16µl (Final **32µl**).\n - Quantify with Qubit HS RNA."
-    ]
-
-    # 5. rRNA Depletion
-    mix_hybridization = [
-         {"Reagent": "5M NaCl", "Volume per rxn (µL)": 0.6},
-         {"Reagent": "1M Tris-HCl (pH 7.5)", "Volume per rxn (µL)": 1.5},
-         {"Reagent": "Nuclease-free water (Adjust as needed)", "Volume per rxn (µL)": 12.9}, 
-         # Note: Protocol implies 15uL total reaction including 500ng RNA + Probe. 
-         # Assuming RNA+Probe volume is variable, this MM helps prep the buffer part.
-         # Simplified for scaling: creating a buffer mix to add to RNA+Probe.
-    ]
-    
-    mix_rnase_h = [
-        {"Reagent": "RNase H; Enzynomics, Cat.# M036S", "Volume per rxn (µL)": 3.0},
-        {"Reagent": "1M Tris-HCl (pH 7.5)", "Volume per rxn (µL)": 0.5},
-        {"Reagent": "5M NaCl", "Volume per rxn (µL)": 0.2},
-        {"Reagent": "1M MgCl2", "Volume per rxn (µL)": 0.4},
-        {"Reagent": "Nuclease-free water", "Volume per rxn (µL)": 0.9},
-    ]
-
-    steps_rrna = [
-        "**Hybridization**: Mix 500ng RNA, Probes, and Buffer components (Total 15µl).",
-        "Cycler: 95°C -> 45°C (-0.1°C/sec). Hold 45°C for 5 min.",
-        "**Prepare RNase H Master Mix** (Calculated above). Preheat to 45°C.",
-        "Add **5µl** RNase H Mix to reaction (Total 20µl).",
-        "Incubate **45°C for 30 min** (Lid 60°C).",
-        "Spin down, place on ice.",
-        "**2X SPRI Cleanup** (Part 1): Elute 26µl, take 25µl.",
-        "**2X SPRI Cleanup** (Part 2): Elute 15µl, take 14µl.",
-        "Store at -80°C or proceed."
-    ]
-
-    # 6. Reverse Transcription
-    mix_rt = [
-        {"Reagent": "5X RT Buffer", "Volume per rxn (µL)": 4.0},
-        {"Reagent": "dNTP mix (10mM)", "Volume per rxn (µL)": 1.0},
-        {"Reagent": "100mM DTT", "Volume per rxn (µL)": 1.0},
-        {"Reagent": "Recombinant RNase Inhibitor; Takara, Cat.# 2313A", "Volume per rxn (µL)": 1.0},
-        {"Reagent": "Maxima H Minus Reverse Transcriptase (200 U/μL); Thermo Scientific, Cat.# EP0752", "Volume per rxn (µL)": 1.0},
-    ]
-    steps_rt = [
-        "Take 10µl rRNA depleted RNA.",
-        "Add 2µl RT Primer (20uM). Heat **70°C for 2 min**, ice.",
-        "**Prepare RT Master Mix** (Calculated above).",
-        "Add **8µl** Master Mix (Total 20µl).",
-        "Incubate **55°C for 15 min**.",
-        "Add 1µl RNase H. Incubate **37°C for 20 min**.",
-        "**2X SPRI Cleanup**. Elute in **5µl** water. **KEEP BEADS**."
-    ]
-
-    # 7. Adapter Ligation 2
-    mix_lig2 = [
-        {"Reagent": "10X T4 Ligase Buffer", "Volume per rxn (µL)": 2.0},
-        {"Reagent": "DMSO (100%)", "Volume per rxn (µL)": 0.8},
-        {"Reagent": "ATP (100mM)", "Volume per rxn (µL)": 0.2},
-        {"Reagent": "PEG 8000 (50%)", "Volume per rxn (µL)": 8.5},
-        {"Reagent": "T4 RNA Ligase 1; Enzynomics, Cat.# M042S", "Volume per rxn (µL)": 1.5},
-    ]
-    steps_lig2 = [
-        "Add 2µl RS_2adap (40uM) to cDNA/bead mix.",
-        "Heat **75°C for 3 min**, ice.",
-        "**Prepare Ligation 2 Master Mix** (Calculated above).",
-        "Add **13µl** Mix to tube.",
-        "Incubate **22°C Overnight**.",
-        "**2X SPRI Cleanup**, elute 25µl.",
-        "**1.5X SPRI Cleanup**, elute 15µl."
-    ]
-
-    # 8. PCR
-    mix_pcr = [
-        {"Reagent": "KOD ONE PCR MM; TOYOBO, Cat.# KMM-101", "Volume per rxn (µL)": 25.0},
-        {"Reagent": "Nuclease free water", "Volume per rxn (µL)": 10.0},
-        {"Reagent": "SYBR™ Gold Nucleic Acid Gel Stain (10,000X Concentrate in DMSO); Invitrogen, Cat.# S11494", "Volume per rxn (µL)": 1.0},
-    ]
-    steps_pcr = [
-        "**Prepare PCR Master Mix** (KOD+Water+SYBR).",
-        "Combine: 10µl cDNA + 2.5µl Fwd Primer + 2.5µl Rev Primer + 36µl Master Mix.",
-        "**qPCR Cycling**:\n 1. 98°C 3m\n 2. 98°C 10s\n 3. 67°C 15s\n 4. 72°C 1m\n (Repeat 2-4)\n 5. 72°C 5min",
-        "Stop during exponential phase.",
-        "**2X SPRI Cleanup**, elute 22µl.",
-        "Run Egel (2%), Gel purify (Monarch).",
-        "Quantify (Qubit HS DNA). Load NextSeq."
-    ]
+        for section in SECTIONS:
+            st.button(section["title"], key=f"link_{section['tab']}", on_click=open_section, args=(section["tab"],),
+                      type="tertiary")
 
     # --- Render Sections ---
-    
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
-        "1. Extraction", "2. QC", "3. Frag/DNase", "4. Lig #1", 
-        "5. Depletion", "6. RT", "7. Lig #2", "8. PCR"
-    ])
-
-    with tab1:
-        display_section("1. RNA Extraction (RNA-Snap)", mix_rna_snap, steps_extraction, num_samples, excess_pct)
-    
-    with tab2:
-        display_section("2. RNA QC and Normalization", None, steps_qc, num_samples, excess_pct)
-
-    with tab3:
-        display_section("3. Fragmentation and DNase Digestion", mix_fastap, steps_frag, num_samples, excess_pct)
-        
-    with tab4:
-        display_section("4. 3' DNA Adapter Ligation", mix_lig1, steps_lig1, num_samples, excess_pct)
-        st.caption("*Note: Protocol recommends preparing reagent mix at RT and adding PEG slowly.*")
-
-    with tab5:
-        display_section("5. RNase H based rRNA Depletion", mix_rnase_h, steps_rrna, num_samples, excess_pct)
-        st.caption("*Note: Hybridization mix is calculated for the RNase H Step mainly. Check protocol for Probe mix specifics.*")
-
-    with tab6:
-        display_section("6. Reverse Transcription", mix_rt, steps_rt, num_samples, excess_pct)
-
-    with tab7:
-        display_section("7. Adapter Ligation #2", mix_lig2, steps_lig2, num_samples, excess_pct)
-
-    with tab8:
-        display_section("8. PCR Amplification", mix_pcr, steps_pcr, num_samples, excess_pct)
+    # 선택된 탭만 실행 (on_change="rerun"), 나머지 탭은 계산하지 않음
+    tabs = st.tabs(TAB_NAMES + [REAGENT_TAB, PLANNER_TAB], key="section_tab", on_change="rerun")
+    for section, tab in enumerate(tabs[:len(SECTIONS)]):
+        if tab.open:
+            with tab:
+                display_section(section, num_samples, excess_pct)
+    if tabs[-2].open:
+        with tabs[-2]:
+            display_reagents(num_samples, excess_pct)
+    if tabs[-1].open:
+        with tabs[-1]:
+            display_planner(num_samples, excess_pct)
 
     # --- Sidebar Appendix ---
     with st.sidebar:
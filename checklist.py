@@ -0,0 +1,149 @@
+"""
+배지 / RNA-seq 앱 공용 체크리스트
+- 체크리스트 하나 (phase / section)는 st.fragment로 렌더링 -> 체크하면 그 목록만 다시 실행
+  (부피 계산, 마스터믹스 표 등 페이지의 나머지는 다시 실행하지 않음)
+- 체크 상태는 session_state + 로컬 JSON 파일 (체크리스트 이름 + run ID별)에 저장 -> 새로고침해도 유지
+  저장 위치: PROTOCOL_CHECKLIST_DIR (기본 ~/.cache/protocols/checklists/<이름>-<run ID>.json)
+- run ID는 prep 한 번 단위: URL의 ?run=... 에 넣어 두므로 새로고침 / 같은 링크로 이어서 체크할 수 있고,
+  다른 사람 (다른 run ID)의 체크나 Reset과 섞이지 않음
+"""
+import json
+import os
+import re
+import tempfile
+import threading
+import uuid
+
+import streamlit as st
+
+CHECKLIST_DIR = os.environ.get(
+    "PROTOCOL_CHECKLIST_DIR", os.path.join(os.path.expanduser("~"), ".cache", "protocols", "checklists")
+)
+
+RUN_PARAM = "run"
+# 파일 이름에 쓰므로 run ID는 영문/숫자/-/_ 만 (최대 40자)
+RUN_ID_PATTERN = re.compile(r"[^A-Za-z0-9_-]+")
+
+# 같은 run ID를 여는 세션들이 같은 파일에 저장하므로 읽기-수정-쓰기를 lock으로 보호
+_file_lock = threading.Lock()
+
+
+def clean_run_id(text):
+    return RUN_ID_PATTERN.sub("-", str(text).strip()).strip("-")[:40]
+
+
+def run_id():
+    """
+    현재 prep의 run ID: URL ?run=... -> 이 세션에서 쓰던 ID -> 새로 만듦 (URL에도 기록)
+    """
+    run = clean_run_id(st.query_params.get(RUN_PARAM, ""))
+    if not run:
+        run = st.session_state.get("checklist_run") or uuid.uuid4().hex[:8]
+        st.query_params[RUN_PARAM] = run
+    st.session_state.checklist_run = run
+    return run
+
+
+def set_run(widget):
+    """Run ID 입력 (on_change) -> 비우면 새 run"""
+    run = clean_run_id(st.session_state[widget]) or uuid.uuid4().hex[:8]
+    st.session_state.checklist_run = run
+    st.query_params[RUN_PARAM] = run
+
+
+def checklist_doc(name):
+    """체크리스트 이름 + run ID -> 저장 단위 (파일 이름 / session_state 키)"""
+    return f"{name}-{run_id()}"
+
+
+def checklist_path(doc):
+    return os.path.join(CHECKLIST_DIR, f"{doc}.json")
+
+
+def read_checks(doc):
+    """저장된 체크 상태 {key: True} (파일이 없거나 읽을 수 없으면 빈 dict)"""
+    try:
+        with open(checklist_path(doc), encoding="utf-8") as f:
+            checks = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return checks if isinstance(checks, dict) else {}
+
+
+def write_checks(doc, updates=None, reset=False):
+    """
+    파일의 체크 상태에 updates를 합쳐서 저장 (다른 세션이 체크한 항목은 유지, 체크된 것만 기록)
+    반환: 저장 성공 여부 (읽기 전용 서버 등에서는 session_state에만 남음)
+    """
+    with _file_lock:
+        checks = {} if reset else read_checks(doc)
+        checks.update(updates or {})
+        checks = {key: True for key, value in checks.items() if value}
+        path = checklist_path(doc)
+        try:
+            os.makedirs(CHECKLIST_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=CHECKLIST_DIR)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(checks, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, path)
+        except OSError:
+            return False
+    return True
+
+
+def get_checks(doc):
+    """이 세션의 체크 상태 (처음 열 때 파일에서 읽음)"""
+    checklists = st.session_state.setdefault("checklists", {})
+    if doc not in checklists:
+        checklists[doc] = read_checks(doc)
+    return checklists[doc]
+
+
+def widget_key(doc, key):
+    return f"check_{doc}_{key}"
+
+
+def remember_check(doc, key):
+    """체크 상태를 위젯과 별도로 저장 (다른 탭이 렌더링되지 않아도 유지) + 파일에 기록"""
+    checked = st.session_state[widget_key(doc, key)]
+    get_checks(doc)[key] = checked
+    write_checks(doc, {key: checked})
+
+
+def reset_checklist(doc):
+    """이 run의 체크 상태 / 위젯 / 파일 초기화 (버튼 on_click, 다른 run은 그대로)"""
+    st.session_state.setdefault("checklists", {})[doc] = {}
+    prefix = widget_key(doc, "")
+    for key in [key for key in st.session_state if str(key).startswith(prefix)]:
+        del st.session_state[key]
+    write_checks(doc, reset=True)
+
+
+@st.fragment
+def checklist(name, items):
+    """
+    items: [(key, label)] -> 체크박스 목록 (fragment: 체크하면 이 목록만 다시 실행)
+    """
+    doc = checklist_doc(name)
+    checks = get_checks(doc)
+    for key, label in items:
+        st.checkbox(
+            label, value=checks.get(key, False), key=widget_key(doc, key), on_change=remember_check, args=(doc, key)
+        )
+
+
+def run_settings(name):
+    """
+    Run ID 입력 + Reset 버튼
+    같은 run ID (또는 ?run=... 링크)를 열면 다른 기기 / 새 세션에서 이어서 체크
+    """
+    doc = checklist_doc(name)
+    widget = f"run_input_{name}"
+    if st.session_state.get(widget) != st.session_state.checklist_run:
+        st.session_state[widget] = st.session_state.checklist_run
+    st.text_input(
+        "Checklist Run ID", key=widget, on_change=set_run, args=(widget,),
+        help="이 prep의 체크 상태 저장 이름 (URL ?run=...). 비우면 새 run으로 시작",
+    )
+    st.button("↺ Reset Checklist", key=f"reset_{name}", on_click=reset_checklist, args=(doc,),
+              help="이 run의 모든 체크 해제 (저장된 파일 포함)")
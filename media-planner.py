@@ -0,0 +1,98 @@
+"""
+일주일치 배지 주문 (BB / FAA / GAM ...)을 한 번에 계산하는 Media Production Planner
+- 배지별 재료 양 + 공통 재료 (Bacto Agar, sheep blood, hemin stock ...) 합계
+- 미리 만들어야 할 stock 용액 양과 절차
+"""
+import pandas as pd
+import streamlit as st
+
+from recipe_engine import get_recipes, plan_media, stock_steps
+
+ORDER_COLUMNS = {"Medium": None, "Plates": 0, "Vol/Plate (mL)": 25, "Margin (%)": 10}
+
+
+def default_orders(recipes):
+    return pd.DataFrame([
+        {"Medium": name, "Plates": 40, "Vol/Plate (mL)": 25, "Margin (%)": 10} for name in recipes
+    ])
+
+
+def remember_orders(key):
+    """
+    data_editor 변경 내용을 session_state.media_orders에 반영 후 editor를 새로 시작
+    (다른 페이지에 다녀와도 주문 표 유지)
+    """
+    edits = st.session_state[key]
+    df = st.session_state.media_orders.copy()
+    for row, values in edits["edited_rows"].items():
+        for column, value in values.items():
+            df.loc[df.index[int(row)], column] = value
+    df = df.drop(df.index[edits["deleted_rows"]])
+    df = pd.concat([df, pd.DataFrame(edits["added_rows"], columns=list(ORDER_COLUMNS))], ignore_index=True)
+    df = df.fillna(ORDER_COLUMNS).dropna(subset=["Medium"])
+    st.session_state.media_orders = df.astype({"Plates": int}).reset_index(drop=True)
+    st.session_state.orders_version += 1
+
+
+st.set_page_config(page_title="Media Production Planner", page_icon="🗓️", layout="wide")
+st.title("🗓️ Media Production Planner")
+st.caption("Plate orders for all media at once. Shared ingredients and stock solutions are summed across media.")
+
+recipes = get_recipes()
+st.session_state.setdefault("orders_version", 0)
+if "media_orders" not in st.session_state:
+    st.session_state.media_orders = default_orders(recipes)
+
+# --- 1. Orders ---
+st.header("1. Plate Orders")
+key = f"media_orders_{st.session_state.orders_version}"
+st.data_editor(
+    st.session_state.media_orders, key=key, num_rows="dynamic", hide_index=True, width="stretch",
+    on_change=remember_orders, args=(key,),
+    column_config={
+        "Medium": st.column_config.SelectboxColumn(options=list(recipes), required=True),
+        "Plates": st.column_config.NumberColumn(min_value=0, step=1),
+        "Vol/Plate (mL)": st.column_config.NumberColumn(min_value=0),
+        "Margin (%)": st.column_config.NumberColumn(min_value=0, max_value=100),
+    },
+)
+orders = st.session_state.media_orders
+table, totals, stocks = plan_media(recipes, orders)
+if table.empty:
+    st.stop()
+
+final_vol = orders["Plates"] * orders["Vol/Plate (mL)"] * (1 + orders["Margin (%)"] / 100)
+st.markdown(f"**{int(orders['Plates'].sum())} plates · {final_vol.sum() / 1000:.2f} L of media**")
+
+# --- 2. Ingredient totals ---
+st.header("2. Ingredient Totals")
+st.caption("Distilled water is the initial volume; make-up-to volumes are not counted.")
+st.dataframe(totals, hide_index=True, width="stretch",
+             column_config={"Total": st.column_config.NumberColumn(format="%.2f")})
+with st.expander("Per-medium amounts"):
+    st.dataframe(
+        table[["Medium", "Ingredient", "catalog", "total", "unit"]].rename(
+            columns={"catalog": "Catalog", "total": "Total", "unit": "Unit"}
+        ),
+        hide_index=True, width="stretch", column_config={"Total": st.column_config.NumberColumn(format="%.2f")},
+    )
+
+# --- 3. Stock solutions ---
+st.header("3. Stock Solutions to Prepare")
+stock_margin = st.slider("Stock Excess (%)", 0, 50, 10, help="Extra stock for filter/pipetting loss")
+for stock in stocks.itertuples():
+    make_vol = stock.volume_ml * (1 + stock_margin / 100)
+    with st.container(border=True):
+        st.markdown(f"**{stock.label}**: {stock.volume_ml:.2f} mL used → prepare **{make_vol:.2f} mL**")
+        st.markdown(stock_steps(recipes[stock.recipe]["stocks"][stock.stock], make_vol))
+
+worksheet = pd.concat([
+    table[["Medium", "Ingredient", "catalog", "total", "unit"]].set_axis(
+        ["Medium", "Ingredient", "Catalog", "Total", "Unit"], axis=1
+    ),
+    totals.drop(columns="Used In").assign(Medium="TOTAL"),
+], ignore_index=True)
+st.download_button(
+    "📥 Production Worksheet (CSV)", worksheet.to_csv(index=False, float_format="%.3f").encode("utf-8"),
+    "media_production.csv", "text/csv",
+)
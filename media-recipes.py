@@ -0,0 +1,14 @@
+"""
+recipes/ 폴더의 모든 배지 레시피를 한 앱에서 선택해서 보기
+새 배지는 recipes/에 YAML 파일만 추가하면 자동으로 목록에 나타남
+"""
+import streamlit as st
+
+from recipe_engine import get_recipes, render_recipe
+
+st.set_page_config(page_title="Media Recipes", page_icon="🧫")
+
+recipes = get_recipes()
+with st.sidebar:
+    name = st.selectbox("Recipe", list(recipes), format_func=lambda n: recipes[n]["title"])
+render_recipe(recipes[name])
@@ -1,59 +1,421 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
-import matplotlib.colors as mcolors
-import numpy as np
+import os
+import time
 from io import BytesIO
 
+from od_cache import FigureCache, PlateCache, cached_read_plate, content_hash, settings_key
+from od_growth import CURVE_QUANTITIES, SMOOTHING_METHODS, curve_stats, growth_summary
+from od_jobs import JobPool
+from od_live import LIVE_BLANK_MODES, latest_summary, live_stats, poll_live, start_live
+from od_multi import ALIGN_MODES, GROUP_BY, NORMALIZE_MODES, PlateStore, combine, pair_files, plate_name
+from od_plot import (
+    CENTRAL_COLUMNS, DOWNSAMPLE_METHODS, ERROR_TYPES, ROBUST_ERROR_TYPES, default_colors, default_groups, downsample_stats,
+    growth_chart, growth_png
+)
+from od_profile import Profiler, is_profiling, profile_meta, profile_stage
+from od_processing import (
+    BLANK_MODES, CSV_ENGINES, HeaderNotFoundError, build_plate, compile_layout, correct_blanks, exclude_wells, group_stats,
+    load_data, outlier_wells
+)
+
 # 페이지 설정
 st.set_page_config(page_title="OD600 Plotter Ultimate", page_icon="📈", layout="wide")
 
-def parse_time(t_str):
+# 화면 표시용 static plot 해상도 (st.pyplot 기본값과 같음)
+SCREEN_DPI = 200
+
+@st.cache_resource
+def disk_cache():
+    """세션 간 공유하는 파싱 결과 디스크 캐시 (Feather)"""
+    return PlateCache()
+
+@st.cache_resource
+def figure_cache():
+    """세션 간 공유하는 렌더링된 그림 캐시 (메모리 LRU)"""
+    return FigureCache()
+
+@st.cache_resource
+def job_pool():
+    """세션 간 공유하는 작업 풀 (파싱 / 보정 / 통계, 동시 실행 수 제한 + 결과 LRU)"""
+    return JobPool()
+
+LOAD_STAGES = ["Checking disk cache", "Reading layout", "Parsing CSV", "Building matrix"]
+PROCESS_STAGES = ["Screening outliers", "Blank correction", "Group statistics"]
+
+def load_job(job, cache, layout_key, data_key, layout_bytes, data_bytes, engine="c", source=None):
+    """
+    (작업 스레드) Layout + Raw Data 파싱 -> PlateMatrix (디스크 캐시에 있으면 파싱 생략)
+    """
+    def read():
+        job.advance("Reading layout")
+        with profile_stage("layout"):
+            layout = compile_layout(BytesIO(layout_bytes))
+        job.advance("Parsing CSV")
+        df_data = load_data(BytesIO(data_bytes), layout.index, engine)
+        job.advance("Building matrix")
+        with profile_stage("build matrix"):
+            return build_plate(df_data, layout)
+
+    job.advance("Checking disk cache")
+    plate, _ = cached_read_plate(cache, layout_key, data_key, read, source)
+    return plate
+
+def track_job(kind, key, fn, stages, *args):
+    """
+    이 세션의 kind 작업 -> Job (없거나 key가 바뀌면 새로 제출)
+    새 파일 / 설정 변경으로 key가 바뀌면 이전 작업은 놓아줌 (다른 세션도 안 기다리면 취소)
+    실패한 작업은 다시 제출 (같은 파일을 다시 올리거나 rerun하면 재시도)
+    """
+    pool = job_pool()
+    jobs = st.session_state.setdefault("od_jobs", {})
+    job = jobs.get(kind)
+    if job is not None and (job.key != key or job.failed):
+        pool.release(job)
+        job = None
+    if job is None or job.cancelled:
+        job = pool.submit(key, fn, stages, *args)
+        jobs[kind] = job
+    return job
+
+def release_stale_jobs(prefix, kinds):
+    """이 세션의 prefix로 시작하는 작업 중 kinds에 없는 것 (업로드에서 빠진 플레이트 등)을 놓아주고 목록에서 삭제"""
+    pool = job_pool()
+    jobs = st.session_state.get("od_jobs", {})
+    for kind in [kind for kind in jobs if kind.startswith(prefix) and kind not in kinds]:
+        pool.release(jobs.pop(kind))
+
+def job_result(job, label=""):
+    """
+    작업이 끝날 때까지 단계별 진행률 표시 후 결과 반환 (rerun되면 기다리기만 멈추고 작업은 계속)
+    Profiling 중이면 작업의 단계 기록을 이 세션의 Profiler에 합침
+    """
+    pool = job_pool()
+    if not job.done:
+        bar = st.progress(job.progress, text=f"{label}{job.status()}")
+        pool.wait(job, lambda j: bar.progress(j.progress, text=f"{label}{j.status()}"))
+        bar.empty()
+    pool.merge_profile(job)
+    return job.future.result()
+
+def plate_job(layout_key, data_key, layout_bytes, data_bytes, engine="c", source=None, kind="plate"):
+    """Layout + Raw Data 파싱 작업 -> Job (세션 간 공유, 파일 내용 해시로 key)"""
+    return track_job(
+        kind, ("plate", layout_key, data_key, engine), load_job, LOAD_STAGES,
+        disk_cache(), layout_key, data_key, layout_bytes, data_bytes, engine, source,
+    )
+
+def screen_outliers(plate, robust):
+    """
+    robust = (trim, z 기준, 최소 시점 비율, 제외 여부) 또는 None
+    -> (plate, outlier 테이블 또는 None), 제외 모드면 outlier well을 NaN으로 (blank 보정 전에 적용)
+    """
+    if robust is None:
+        return plate, None
+    trim, z_threshold, min_fraction, exclude = robust
+    outliers = outlier_wells(plate, z_threshold, min_fraction, trim)
+    if exclude:
+        plate = exclude_wells(plate, outliers["outlier"].to_numpy())
+    return plate, outliers
+
+def process_job(job, plate, blank_mode, blank_window, clip_negative, robust=None):
+    """
+    (작업 스레드) (Outlier 검출) + Blank 보정 + 통계 계산 (blank_mode=None 이면 보정 안 함)
+    """
+    job.advance("Screening outliers")
+    plate, outliers = screen_outliers(plate, robust)
+    job.advance("Blank correction")
+    plate, blank_found = correct_blanks(plate, blank_mode, blank_window, clip_negative)
+    job.advance("Group statistics")
+    stats = group_stats(plate, robust is not None, robust[0] if robust else 0.1)
+    return stats, blank_found, outliers
+
+def process_plate(layout_key, data_key, plate, blank_mode, blank_window, clip_negative, robust=None):
+    """(Outlier 검출) + Blank 보정 + 통계 작업 -> (stats, blank_found, outliers)"""
+    job = track_job(
+        "stats", ("stats", layout_key, data_key, blank_mode, blank_window, clip_negative, robust), process_job,
+        PROCESS_STAGES, plate, blank_mode, blank_window, clip_negative, robust,
+    )
+    return job_result(job)
+
+@st.cache_data(max_entries=4, ttl="2h", show_spinner=False)
+def combine_plates(store_key, _store, blank_mode, blank_window, clip_negative, align, step, normalize, reference, group_by):
+    """
+    저장소의 플레이트 합치기 (보정 + 정규화 + 시간축 정렬) + 통계 -> (combined, index, stats)
+    저장소 내용 (store_key)과 설정이 같으면 다시 계산하지 않음
+    """
+    combined, index = combine(
+        _store, blank_mode, blank_window, clip_negative, align, step, normalize, reference, group_by
+    )
+    return combined, index, group_stats(combined)
+
+@st.cache_data(max_entries=32, ttl="2h", show_spinner=False)
+def growth_tables(layout_key, data_key, _plate, blank_mode, blank_window, clip_negative, window_h, od_min, robust=None):
+    """
+    Well별 / Group별 성장 파라미터 (Blank 보정 후, 제외 모드면 outlier well 제외)
+    """
+    plate, _ = screen_outliers(_plate, robust)
+    plate, _ = correct_blanks(plate, blank_mode, blank_window, clip_negative)
+    return growth_summary(plate, window_h, od_min)
+
+@st.cache_data(max_entries=32, ttl="2h", show_spinner=False)
+def curve_table(layout_key, data_key, _plate, blank_mode, blank_window, clip_negative, curve, robust=None):
+    """
+    Smoothed OD / 성장 속도 곡선의 group 통계 (Blank 보정 후, 제외 모드면 outlier well 제외)
+    """
+    plate, _ = screen_outliers(_plate, robust)
+    plate, _ = correct_blanks(plate, blank_mode, blank_window, clip_negative)
+    return curve_stats(plate, *curve, robust=robust is not None, trim=robust[0] if robust else 0.1)
+
+def curve_settings():
+    """사이드바 그래프 값 설정 -> (quantity, method, window_h, polyorder, od_min) 또는 None (OD600 그대로)"""
+    quantity = st.sidebar.radio("Plot Quantity", CURVE_QUANTITIES, help="Growth rate: d(ln OD)/dt, diauxic shift 확인용")
+    if quantity == CURVE_QUANTITIES[0]:
+        return None
+    method = st.sidebar.selectbox("Smoothing Method", SMOOTHING_METHODS)
+    window_h = st.sidebar.number_input("Smoothing Window (h)", min_value=0.1, max_value=12.0, value=1.0, step=0.25)
+    polyorder = 2
+    if method == "Savitzky-Golay":
+        polyorder = st.sidebar.slider("Polynomial Order", 1, 5, 2)
+    od_min = 0.02
+    if quantity == CURVE_QUANTITIES[2]:
+        od_min = st.sidebar.number_input(
+            "Min OD for ln(OD)", min_value=0.001, max_value=1.0, value=0.02, step=0.005, format="%.3f", key="curve_od_min"
+        )
+    return quantity, method, window_h, polyorder, od_min
+
+def blank_settings():
+    """사이드바 Blank 보정 설정 -> (보정 여부, blank_mode, blank_window, clip_negative)"""
+    use_blank_correction = st.sidebar.checkbox("Apply Blank Correction", value=True)
+    clip_negative = st.sidebar.checkbox("Clip Negative Values to 0", value=True)
+
+    blank_mode, blank_window = None, 5
+    if use_blank_correction:
+        blank_mode = st.sidebar.selectbox("Blank Mode", BLANK_MODES)
+        if blank_mode == "Rolling median":
+            blank_window = st.sidebar.slider("Rolling Window (timepoints)", 3, 51, 5, step=2)
+    return use_blank_correction, blank_mode, blank_window, clip_negative
+
+def robust_settings():
+    """사이드바 Robust 통계 설정 -> (trim, z 기준, 최소 시점 비율, 제외 여부) 또는 None"""
+    if not st.sidebar.checkbox("Robust Statistics", help="trimmed mean / MAD / replicate z-score로 튀는 well 검출"):
+        return None
+    trim = st.sidebar.slider("Trim Fraction (each side)", 0.0, 0.4, 0.1, step=0.05)
+    z_threshold = st.sidebar.number_input("Outlier |z| Threshold", min_value=1.0, max_value=20.0, value=3.5, step=0.5)
+    min_fraction = st.sidebar.slider(
+        "Min Fraction of Timepoints", 0.05, 1.0, 0.2, step=0.05, help="|z|가 기준을 넘는 시점 비율이 이 이상이면 outlier"
+    )
+    exclude = st.sidebar.radio("Outlier Wells", ["Flag", "Exclude"], horizontal=True) == "Exclude"
+    return trim, z_threshold, min_fraction, exclude
+
+def multi_view():
     """
-    [수정됨] 24시간 이상 실험 포맷 지원 (d.hh:mm:ss)
-    예: 1.01:00:00 -> 1일 1시간 = 25시간으로 변환
+    여러 플레이트를 한 저장소에 모아 group별로 비교 (새로 올린 플레이트만 파싱)
     """
+    col1, col2 = st.columns(2)
+    layout_files = col1.file_uploader(
+        "1. Plate Layouts (CSV)", type="csv", accept_multiple_files=True, key="multi_layouts",
+        help="<plate>_layout.csv 이름으로 data 파일과 짝지음 (하나만 올리면 공용 layout)",
+    )
+    data_files = col2.file_uploader(
+        "2. OD600 Raw Data (CSV, multiple)", type="csv", accept_multiple_files=True, key="multi_data"
+    )
+    if not (layout_files and data_files):
+        release_stale_jobs("plate:", set())
+        return
     try:
-        t_str = str(t_str).strip()
-        parts = t_str.split(':')
-        
-        # hh:mm:ss 또는 d.hh:mm:ss 형식
-        if len(parts) == 3:
-            # 첫 번째 파트(시)에 마침표(.)가 있는지 확인 (예: 1.01)
-            time_part = parts[0]
-            if '.' in time_part:
-                day_str, hour_str = time_part.split('.')
-                days = float(day_str)
-                hours = float(hour_str)
-                # 날짜를 시간으로 변환하여 합산
-                total_hours = (days * 24) + hours
-            else:
-                total_hours = float(time_part)
-            
-            minutes = float(parts[1])
-            seconds = float(parts[2])
-            
-            return total_hours + minutes/60 + seconds/3600
-            
-        # mm:ss 또는 hh:mm (드문 경우)
-        elif len(parts) == 2:
-            p1, p2 = map(float, parts)
-            # 보통 2개면 분:초 일 확률이 높지만, 상황에 따라 다름.
-            # 여기서는 안전하게 분:초로 가정
-            return p1/60 + p2/3600
-            
+        multi_analysis(layout_files, data_files)
     except Exception as e:
-        # st.write(f"Error parsing {t_str}: {e}") # 디버깅용
-        return None
-    return None
+        st.error(f"오류가 발생했습니다: {e}")
+        st.write("Layout과 Raw Data 파일의 형식이 올바른지 확인해주세요.")
 
-def main():
-    st.title("📈 OD600 Growth Curve (Long-term Support)")
-    st.markdown("""
-    **업데이트:** 24시간 이상 데이터(`1.01:00:00`) 포맷을 지원합니다.
-    """)
+def multi_analysis(layout_files, data_files):
+    """multi_view의 파싱 -> 합치기 -> 그래프 (오류는 multi_view에서 표시)"""
+    st.sidebar.header("⚙️ Data Processing")
+    engine = st.sidebar.selectbox("CSV Engine", CSV_ENGINES, help="pyarrow: 대용량 파일에서 더 빠름")
+    use_blank_correction, blank_mode, blank_window, clip_negative = blank_settings()
+
+    # --- 플레이트 저장소: 새로 올라온 파일만 파싱해서 추가 ---
+    store = st.session_state.setdefault("plate_store", PlateStore())
+    layouts = {f.name: f for f in layout_files}
+    pairs = pair_files(list(layouts), [f.name for f in data_files])
+    unpaired = [f.name for f in data_files if f.name not in pairs]
+    if unpaired:
+        st.warning(f"⚠️ Layout을 찾지 못해 제외: {', '.join(unpaired)}")
+
+    # 모든 플레이트를 먼저 작업 풀에 제출해서 동시에 파싱한 뒤 순서대로 결과를 받음
+    jobs = []
+    for data_file in data_files:
+        if data_file.name not in pairs:
+            continue
+        name = plate_name(data_file.name)
+        layout_bytes = layouts[pairs[data_file.name]].getvalue()
+        data_bytes = data_file.getvalue()
+        layout_key, data_key = content_hash(layout_bytes), content_hash(data_bytes)
+        job = plate_job(layout_key, data_key, layout_bytes, data_bytes, engine, data_file.name, kind=f"plate:{name}")
+        jobs.append((data_file.name, name, f"{layout_key}-{data_key}", job))
+    # 제거된 플레이트의 작업은 놓아줌 (이 세션이 결과를 계속 붙잡지 않도록)
+    release_stale_jobs("plate:", {f"plate:{name}" for _, name, _, _ in jobs})
+
+    names = set()
+    for fname, name, key, job in jobs:
+        try:
+            with profile_stage(f"load {name}"):
+                plate = job_result(job, f"{fname}: ")
+        except HeaderNotFoundError as e:
+            st.error(f"❌ {fname}: {e}")
+            continue
+        store.add(name, key, plate)
+        names.add(name)
+    store.retain(names)
+    if not store.names:
+        return
+
+    st.sidebar.divider()
+    st.sidebar.header("🧫 Multi-plate")
+    group_by = st.sidebar.radio("Compare By", GROUP_BY)
+    align = st.sidebar.selectbox("Time Alignment", ALIGN_MODES, index=1)
+    step = None
+    if align == ALIGN_MODES[1]:
+        step_min = st.sidebar.number_input("Grid Step (min, 0 = auto)", min_value=0.0, max_value=120.0, value=0.0, step=1.0)
+        step = step_min / 60 if step_min > 0 else None
+    normalize = st.sidebar.selectbox("Per-plate Normalization", NORMALIZE_MODES)
+    reference = None
+    plate_groups = sorted(store.well_index()["Group"].unique())
+    if normalize == "Reference group max":
+        reference = st.sidebar.selectbox("Reference Group", plate_groups)
+
+    with profile_stage("combine plates"):
+        combined, index, stats = combine_plates(
+            store.content_key, store, blank_mode, blank_window, clip_negative, align, step, normalize, reference, group_by
+        )
+
+    st.write(f"**{len(store.names)} plates**, {len(index):,} wells, {len(combined.hours):,} timepoints")
+    with st.expander("📋 Plate / Group Index"):
+        st.dataframe(
+            index.groupby(["Plate", "Group"]).size().unstack("Plate", fill_value=0), width="stretch"
+        )
+
+    st.sidebar.divider()
+    st.sidebar.header("🎨 Graph Settings")
+    all_groups = list(combined.groups)
+    selected_groups = st.sidebar.multiselect(
+        "Select Samples", all_groups, default=default_groups(all_groups, use_blank_correction), key="multi_groups"
+    )
+    plot_mode = st.sidebar.radio("Central Tendency", ["Mean", "Median"], key="multi_plot_mode")
+    error_type = st.sidebar.selectbox("Error Bar", ERROR_TYPES, key="multi_error_type")
+
+    if not selected_groups:
+        st.warning("샘플을 선택해주세요.")
+        return
+    y_col = CENTRAL_COLUMNS[plot_mode]
+    plot_stats = downsample_stats(stats.dropna(subset=[y_col]), selected_groups, y_col, 1000, "LTTB")
+    st.altair_chart(
+        growth_chart(
+            plot_stats, selected_groups, default_colors(selected_groups), plot_mode, error_type, use_blank_correction
+        ),
+        width="stretch",
+    )
+    st.download_button(
+        "📥 Multi-plate Data (CSV)", stats.to_csv(index=False).encode('utf-8'), "multi_plate_growth.csv", "text/csv"
+    )
+
+def live_view():
+    """
+    측정 중인 파일을 경로로 지정해 새로 추가된 행만 주기적으로 읽어서 표시
+    """
+    col1, col2 = st.columns(2)
+    layout_file = col1.file_uploader("1. Plate Layout (CSV)", type="csv", key="live_layout")
+    data_path = col2.text_input("2. Data File Path (측정 중인 파일)", placeholder="/path/to/run.csv").strip()
+
+    st.sidebar.header("📡 Live Settings")
+    blank_mode = st.sidebar.selectbox(
+        "Blank Mode", LIVE_BLANK_MODES, index=1, help="Live 모드는 시점별로 독립적인 보정만 지원"
+    )
+    clip_negative = st.sidebar.checkbox("Clip Negative Values to 0", value=True, key="live_clip_negative")
+    refresh_s = st.sidebar.slider("Refresh Interval (s)", 5, 300, 30, step=5)
+    plot_mode = st.sidebar.radio("Central Tendency", ["Mean", "Median"], key="live_plot_mode")
+    error_type = st.sidebar.selectbox("Error Bar", ERROR_TYPES, key="live_error_type")
+
+    if not (layout_file and data_path):
+        return
+    if not os.path.isfile(data_path):
+        st.error(f"❌ 파일을 찾을 수 없습니다: {data_path}")
+        return
+
+    # 파일/레이아웃/보정 모드가 바뀌면 처음부터 다시 읽음
+    layout_bytes = layout_file.getvalue()
+    live_key = (data_path, content_hash(layout_bytes), blank_mode, clip_negative)
+    if st.session_state.get("live_key") != live_key:
+        try:
+            st.session_state.live_run = start_live(
+                data_path, compile_layout(BytesIO(layout_bytes)), blank_mode, clip_negative
+            )
+        except HeaderNotFoundError as e:
+            st.info(f"⏳ 아직 헤더가 없습니다. 측정이 시작되면 새로고침하세요. ({e})")
+            return
+        st.session_state.live_key = live_key
+    run = st.session_state.live_run
+
+    blank_corrected = blank_mode != "None"
+    all_groups = list(run.groups)
+    selected_groups = st.sidebar.multiselect(
+        "Select Samples", all_groups, default=default_groups(all_groups, blank_corrected), key="live_groups"
+    )
+    colors = default_colors(selected_groups)
+
+    @st.fragment(run_every=refresh_s)
+    def live_panel():
+        start = time.perf_counter()
+        try:
+            new_rows = poll_live(run)
+        except ValueError as e:
+            st.warning(f"⚠️ {e}")
+            return
+        elapsed = time.perf_counter() - start
 
+        st.caption(
+            f"🔄 {time.strftime('%H:%M:%S')} · {run.n_times} timepoints (+{new_rows} new in {elapsed * 1000:.0f} ms) · "
+            f"{run.offset:,} bytes read"
+        )
+        if not run.n_times:
+            st.info("⏳ 아직 데이터 행이 없습니다.")
+            return
+
+        if selected_groups:
+            # live_stats는 이미 LIVE_MAX_POINTS 정도로 솎아진 시점만 포함 (전체 다운샘플링 없음)
+            st.altair_chart(
+                growth_chart(live_stats(run), selected_groups, colors, plot_mode, error_type, blank_corrected),
+                width="stretch",
+            )
+        st.write("Latest Timepoint Group Statistics:")
+        st.dataframe(latest_summary(run), hide_index=True)
+
+    live_panel()
+
+def profiling_panel():
+    """
+    사이드바 Profiling 설정 -> (결과를 표시할 expander, Profiler 또는 None)
+    """
+    panel = st.sidebar.expander("⏱️ Profiling")
+    enabled = panel.checkbox("Enable Profiling", help="단계별 시간을 측정 (켜져 있으면 PNG도 바로 렌더링해서 측정)")
+    trace_memory = panel.checkbox("Track Peak Memory (tracemalloc)", disabled=not enabled, help="메모리 추적은 처리 속도를 늦춤")
+    return panel, (Profiler(trace_memory) if enabled else None)
+
+def show_profile(panel, profiler):
+    """단계별 측정 결과 표 + JSON 다운로드"""
+    table = profiler.table()
+    table["stage"] = ["\u2003" * depth + stage.split(" › ")[-1] for stage, depth in zip(table["stage"], table["depth"])]
+    panel.caption(f"Total: {profiler.meta['total_seconds']:.3f} s")
+    panel.dataframe(table.drop(columns="depth"), hide_index=True)
+    if profiler.trace_memory and table["peak_mb"].isna().any():
+        panel.caption("Empty peak_mb: another session or job was tracing memory during that stage.")
+    panel.download_button("📥 Profile (JSON)", profiler.to_json(), "od_profile.json", "application/json")
+
+def upload_view():
+    """
+    Layout + Raw Data 파일 한 쌍 분석
+    """
     # --- 1. 파일 업로드 ---
     col1, col2 = st.columns(2)
     layout_file = col1.file_uploader("1. Plate Layout (CSV)", type="csv")
@@ -61,174 +423,156 @@ def main():
 
     if layout_file and data_file:
         try:
-            # --- 2. Layout 파일 처리 ---
-            df_layout = pd.read_csv(layout_file)
-            if "Unnamed: 0" in df_layout.columns:
-                df_layout.rename(columns={"Unnamed: 0": "Row"}, inplace=True)
-            
-            df_layout_melt = df_layout.melt(id_vars="Row", var_name="Col", value_name="SampleName")
-            df_layout_melt.dropna(subset=["SampleName"], inplace=True) 
-            df_layout_melt["Well"] = df_layout_melt["Row"] + df_layout_melt["Col"].astype(str)
-            
-            def get_group(name):
-                parts = str(name).split('-')
-                if len(parts) > 1:
-                    return "-".join(parts[:-1]) 
-                return name
-            
-            df_layout_melt["Group"] = df_layout_melt["SampleName"].apply(get_group)
-            
-            # --- 3. Data 파일 처리 ---
-            data_file.seek(0)
-            content = data_file.read().decode('latin1', errors='ignore')
-            
-            header_row_idx = 0
-            lines = content.splitlines()
-            found_header = False
-            for i, line in enumerate(lines):
-                if line.strip().startswith("Time") and "," in line:
-                    header_row_idx = i
-                    found_header = True
-                    break
-            
-            if not found_header:
-                st.error("❌ 데이터 파일에서 'Time' 컬럼을 찾을 수 없습니다.")
+            # --- 2~4. 파일 파싱 및 병합 (파일 내용 해시로 캐시) ---
+            with profile_stage("read upload + hash"):
+                layout_bytes = layout_file.getvalue()
+                data_bytes = data_file.getvalue()
+                layout_key = content_hash(layout_bytes)
+                data_key = content_hash(data_bytes)
+            profile_meta(file=data_file.name, file_bytes=len(data_bytes))
+
+            st.sidebar.header("⚙️ Data Processing")
+            engine = st.sidebar.selectbox("CSV Engine", CSV_ENGINES, help="pyarrow: 대용량 파일에서 더 빠름")
+
+            try:
+                with profile_stage("load plate"):
+                    plate = job_result(plate_job(layout_key, data_key, layout_bytes, data_bytes, engine, data_file.name))
+            except HeaderNotFoundError as e:
+                st.error(f"❌ {e}")
                 st.stop()
-                
-            data_file.seek(0)
-            df_raw = pd.read_csv(data_file, skiprows=header_row_idx, encoding='latin1')
-            df_raw.columns = df_raw.columns.str.strip()
-            
-            valid_wells = set(df_layout_melt["Well"].unique())
-            cols_to_keep = ["Time"] + [c for c in df_raw.columns if c in valid_wells]
-            df_data = df_raw[cols_to_keep].copy()
-            
-            # [수정된 파싱 함수 적용]
-            df_data["Hours"] = df_data["Time"].apply(parse_time)
-            df_data.dropna(subset=["Hours"], inplace=True)
-            
-            # 시간 순서 정렬
-            df_data.sort_values("Hours", inplace=True)
-            
-            # Long Format 변환
-            df_data_long = df_data.melt(id_vars=["Time", "Hours"], var_name="Well", value_name="OD600")
-            
-            # --- 4. 데이터 병합 ---
-            df_merged = pd.merge(df_data_long, df_layout_melt, on="Well", how="inner")
+
+            cache = disk_cache()
+            if cache.enabled:
+                with st.sidebar.expander("💾 Disk Cache"):
+                    st.caption(f"{len(cache.read_index())} runs · {cache.total_bytes() / 1e6:.1f} MB · `{cache.cache_dir}`")
+                    if st.button("Clear Disk Cache"):
+                        cache.clear()
+            figures = figure_cache()
+            with st.sidebar.expander("🖼️ Figure Cache"):
+                st.caption(
+                    f"{len(figures)} figures · {figures.total_bytes / 1e6:.1f} / {figures.max_bytes / 1e6:.0f} MB · "
+                    f"{figures.hits} hits / {figures.misses} misses"
+                )
+                if st.button("Clear Figure Cache"):
+                    figures.clear()
+            pool = job_pool()
+            with st.sidebar.expander("🧵 Job Pool"):
+                st.caption(
+                    f"{pool.max_workers} workers · {pool.running} running · "
+                    f"{len(pool)} results kept ({pool.total_bytes / 1e6:.1f} / {pool.max_bytes / 1e6:.0f} MB)"
+                )
+                if st.button("Clear Job Results"):
+                    pool.clear()
 
             # --- 5. Blank Subtraction ---
-            st.sidebar.header("⚙️ Data Processing")
-            use_blank_correction = st.sidebar.checkbox("Apply Blank Correction", value=True)
-            clip_negative = st.sidebar.checkbox("Clip Negative Values to 0", value=True)
-            
+            use_blank_correction, blank_mode, blank_window, clip_negative = blank_settings()
+            robust = robust_settings()
+
+            with profile_stage("process plate"):
+                stats, blank_found, outliers = process_plate(
+                    layout_key, data_key, plate, blank_mode, blank_window, clip_negative, robust
+                )
+
             if use_blank_correction:
-                min_time = df_merged["Hours"].min()
-                df_blanks = df_merged[
-                    (df_merged["Group"].str.lower().str.startswith("blank")) & 
-                    (df_merged["Hours"] == min_time)
-                ].copy()
-                
-                if not df_blanks.empty:
-                    def get_condition(group_name):
-                        parts = group_name.split('-', 1)
-                        return parts[1] if len(parts) > 1 else "default"
-
-                    df_blanks["Condition"] = df_blanks["Group"].apply(get_condition)
-                    blank_map = df_blanks.groupby("Condition")["OD600"].mean().to_dict()
-                    
-                    def subtract_blank(row):
-                        group = row["Group"]
-                        parts = group.split('-', 1)
-                        condition = parts[1] if len(parts) > 1 else "default"
-                        
-                        val = row["OD600"]
-                        if condition in blank_map:
-                            val = val - blank_map[condition]
-                        return val
-
-                    df_merged["OD600"] = df_merged.apply(subtract_blank, axis=1)
-                    
-                    if clip_negative:
-                        df_merged["OD600"] = df_merged["OD600"].clip(lower=0)
-                    
-                    st.sidebar.success(f"✅ Corrected using T={min_time:.1f}h blanks.")
-                else:
+                if blank_found:
+                    if blank_mode == "First timepoint":
+                        st.sidebar.success(f"✅ Corrected using T={plate.hours[0]:.1f}h blanks.")
+                    elif blank_mode == "Rolling median":
+                        st.sidebar.success(f"✅ Corrected using rolling median blanks (window={blank_window}).")
+                    else:
+                        st.sidebar.success(f"✅ Corrected using {blank_mode.lower()} blanks.")
+                elif blank_mode == "First timepoint":
                     st.sidebar.warning("⚠️ No 'blank' samples found at start time.")
+                else:
+                    st.sidebar.warning("⚠️ No 'blank' samples found.")
 
-            # 통계 계산 및 정렬
-            stats = df_merged.groupby(["Group", "Hours"])["OD600"].agg(
-                ['mean', 'std', 'median', 'count']
-            ).reset_index()
-            stats['sem'] = stats['std'] / np.sqrt(stats['count'])
-            stats.sort_values("Hours", inplace=True)
+            if outliers is not None:
+                flagged = outliers[outliers["outlier"]]
+                action = "excluded" if robust[3] else "flagged"
+                if len(flagged):
+                    st.sidebar.warning(f"🚩 {len(flagged)} outlier wells {action}: {', '.join(flagged['Well'])}")
+                with st.expander(f"🚩 Outlier Wells ({len(flagged)} {action})"):
+                    st.dataframe(
+                        outliers.sort_values("outlier_fraction", ascending=False), hide_index=True,
+                        column_config={"outlier_fraction": st.column_config.ProgressColumn(min_value=0, max_value=1)},
+                    )
 
             # --- 6. 그래프 설정 ---
             st.sidebar.divider()
             st.sidebar.header("🎨 Graph Settings")
             
             all_groups = sorted(stats["Group"].unique())
-            non_blank_groups = [g for g in all_groups if not g.lower().startswith("blank")]
-            default_selection = non_blank_groups if use_blank_correction else all_groups
+            default_selection = default_groups(all_groups, use_blank_correction)
             
             selected_groups = st.sidebar.multiselect("Select Samples", all_groups, default=default_selection)
             
             st.sidebar.subheader("Colors")
             colors = {}
-            cmap = cm.get_cmap('tab10')
-            for i, group in enumerate(selected_groups):
-                default_color = mcolors.to_hex(cmap(i % 10))
+            for group, default_color in default_colors(selected_groups).items():
                 colors[group] = st.sidebar.color_picker(f"{group}", default_color)
             
             st.sidebar.divider()
-            plot_mode = st.sidebar.radio("Central Tendency", ["Mean", "Median"])
-            error_type = st.sidebar.selectbox("Error Bar", ["Standard Deviation (SD)", "Standard Error (SEM)", "None"])
+            plot_mode = st.sidebar.radio("Central Tendency", ["Mean", "Median"] + (["Trimmed Mean"] if robust else []))
+            error_type = st.sidebar.selectbox(
+                "Error Bar", ERROR_TYPES[:-1] + (ROBUST_ERROR_TYPES if robust else []) + ERROR_TYPES[-1:]
+            )
+
+            curve = curve_settings()
+            ylabel = None
+            if curve:
+                ylabel = "µ = d ln(OD)/dt (1/h)" if curve[0] == CURVE_QUANTITIES[2] else curve[0]
+                with profile_stage("curve stats"):
+                    stats = curve_table(
+                        layout_key, data_key, plate, blank_mode, blank_window, clip_negative, curve, robust
+                    )
+
+            plot_backend = st.sidebar.radio("Plot Backend", ["Interactive", "Static (matplotlib)"], horizontal=True)
+            downsample = st.sidebar.selectbox(
+                "Downsampling", DOWNSAMPLE_METHODS, help="긴 실험에서 그룹당 표시할 점 수를 줄여 렌더링 속도 향상"
+            )
+            max_points = 1000
+            downsample_export = False
+            if downsample != "None":
+                max_points = st.sidebar.number_input("Max Points per Sample", min_value=100, max_value=20000, value=1000, step=100)
+                downsample_export = st.sidebar.checkbox(
+                    "Downsample PNG Export", value=False,
+                    help="기본값은 다운로드 PNG를 전체 데이터로 렌더링 (체크하면 화면과 같은 다운샘플링 적용)",
+                )
             
             # --- 7. Plotting ---
             if selected_groups:
-                fig, ax = plt.subplots(figsize=(10, 6))
-                
-                filtered_stats = stats[stats["Group"].isin(selected_groups)]
-                
-                for group in selected_groups:
-                    subset = filtered_stats[filtered_stats["Group"] == group]
-                    
-                    x = subset["Hours"]
-                    y = subset["mean"] if plot_mode == "Mean" else subset["median"]
-                    
-                    yerr = None
-                    if error_type == "Standard Deviation (SD)":
-                        yerr = subset["std"]
-                    elif error_type == "Standard Error (SEM)":
-                        yerr = subset["sem"]
-                    
-                    ax.errorbar(
-                        x, y, yerr=yerr,
-                        label=group,
-                        color=colors[group],
-                        capsize=3,
-                        fmt='-o',
-                        markersize=4,
-                        linewidth=1.5,
-                        alpha=0.8
-                    )
-                
-                ax.set_xlabel("Time (Hours)", fontsize=12)
-                ylabel = "OD600 (Corrected)" if use_blank_correction else "OD600 (Raw)"
-                ax.set_ylabel(ylabel, fontsize=12)
-                ax.set_title(f"Growth Curve ({plot_mode})", fontsize=14)
-                ax.legend(bbox_to_anchor=(1.02, 1), loc='upper left')
-                ax.grid(True, linestyle='--', alpha=0.5)
-                
-                if use_blank_correction:
-                    ax.axhline(0, color='black', linewidth=0.8, linestyle='-')
+                y_col = CENTRAL_COLUMNS[plot_mode]
+
+                def plot_args(downsampled=True):
+                    """downsampled=False -> 전체 stats (다운로드용 PNG)"""
+                    plot_stats = stats
+                    if downsampled:
+                        with profile_stage("downsample"):
+                            plot_stats = downsample_stats(stats, selected_groups, y_col, max_points, downsample)
+                    return plot_stats, selected_groups, colors, plot_mode, error_type, use_blank_correction
+
+                # 같은 데이터 + 같은 그래프 설정이면 (다른 세션이어도) 이미 렌더링한 PNG 사용
+                figure_key = settings_key(
+                    layout_key, data_key, blank_mode, blank_window, clip_negative, robust,
+                    selected_groups, colors, plot_mode, error_type, use_blank_correction, curve,
+                )
+
+                def plot_png(dpi, downsampled=True):
+                    # 다운샘플링한 그림만 다운샘플링 설정을 key에 포함 (전체 데이터 PNG는 설정과 무관하게 공유)
+                    key = f"{figure_key}-{dpi}-" + (f"{downsample}-{max_points}" if downsampled else "full")
+                    return figures.get_or_render(key, lambda: growth_png(*plot_args(downsampled), dpi=dpi, ylabel=ylabel))
 
-                plt.tight_layout()
-                st.pyplot(fig)
+                # 다운샘플링은 화면에 그리는 그래프에만 적용
+                with profile_stage("plotting"):
+                    if plot_backend == "Interactive":
+                        st.altair_chart(growth_chart(*plot_args(), ylabel=ylabel), width="stretch")
+                    else:
+                        st.image(plot_png(SCREEN_DPI), width="stretch")
                 
                 # 데이터 확인용 (디버깅)
                 with st.expander("🔍 Debug: Time Check"):
                     st.write("24시간 이상 데이터 변환 확인:")
-                    debug_df = df_data[["Time", "Hours"]].drop_duplicates().sort_values("Hours")
+                    debug_df = pd.DataFrame({"Time": plate.times, "Hours": plate.hours}).drop_duplicates()
                     # 23시간 이후 데이터만 필터링해서 보여주기
                     st.dataframe(debug_df[debug_df["Hours"] > 23].head(10))
 
@@ -236,15 +580,61 @@ def main():
                 csv_buffer = stats.to_csv(index=False).encode('utf-8')
                 col_d1.download_button("📥 Data (CSV)", csv_buffer, "growth_data.csv", "text/csv")
                 
-                img_buf = BytesIO()
-                fig.savefig(img_buf, format='png', dpi=300, bbox_inches='tight')
-                col_d2.download_button("🖼️ Plot (PNG)", img_buf.getvalue(), "growth_plot.png", "image/png")
+                # 300 dpi PNG는 버튼을 눌렀을 때만 렌더링 (Profiling 중에는 측정을 위해 바로 렌더링)
+                # 기본은 전체 데이터, "Downsample PNG Export"를 체크했을 때만 화면과 같은 다운샘플링
+                def export_png():
+                    return plot_png(300, downsampled=downsample_export)
+
+                png_data = export_png() if is_profiling() else export_png
+                png_label = "🖼️ Plot (PNG, downsampled)" if downsample_export else "🖼️ Plot (PNG)"
+                col_d2.download_button(png_label, png_data, "growth_plot.png", "image/png")
             else:
                 st.warning("샘플을 선택해주세요.")
 
+            # --- 8. Growth Parameters ---
+            with st.expander("🧬 Growth Parameters (lag, µmax, doubling time, max OD, AUC)"):
+                col_g1, col_g2 = st.columns(2)
+                window_h = col_g1.number_input("µmax Window (h)", min_value=0.25, max_value=12.0, value=1.5, step=0.25)
+                od_min = col_g2.number_input(
+                    "Min OD for ln(OD) Fit", min_value=0.001, max_value=1.0, value=0.02, step=0.005, format="%.3f"
+                )
+                with profile_stage("growth tables"):
+                    per_well, per_group = growth_tables(
+                        layout_key, data_key, plate, blank_mode, blank_window, clip_negative, window_h, od_min, robust
+                    )
+                st.write("Group Summary (mean / std):")
+                st.dataframe(per_group, hide_index=True)
+                st.write("Per Well:")
+                st.dataframe(per_well, hide_index=True)
+
+                col_g3, col_g4 = st.columns(2)
+                col_g3.download_button(
+                    "📥 Group Summary (CSV)", per_group.to_csv(index=False).encode('utf-8'), "growth_params_groups.csv", "text/csv"
+                )
+                col_g4.download_button(
+                    "📥 Per Well (CSV)", per_well.to_csv(index=False).encode('utf-8'), "growth_params_wells.csv", "text/csv"
+                )
+
         except Exception as e:
             st.error(f"오류가 발생했습니다: {e}")
             st.write("Layout과 Raw Data 파일의 형식이 올바른지 확인해주세요.")
 
+def main():
+    st.title("📈 OD600 Growth Curve (Long-term Support)")
+    st.markdown("""
+    **업데이트:** 24시간 이상 데이터(`1.01:00:00`) 포맷을 지원합니다.
+    """)
+
+    source = st.radio("Data Source", ["Upload", "Multi-plate", "Live (local file)"], horizontal=True)
+    view = {"Upload": upload_view, "Multi-plate": multi_view, "Live (local file)": live_view}[source]
+
+    panel, profiler = profiling_panel()
+    if profiler is None:
+        view()
+        return
+    with profiler.activate():
+        view()
+    show_profile(panel, profiler)
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,185 @@
+"""
+OD600 Plotter 배치 모드 (Streamlit 없이 폴더 단위 처리)
+
+폴더 안의 <plate>_layout.csv + <plate>_data.csv 쌍을 찾아 프로세스 풀로 병렬 처리하고,
+플레이트마다 <plate>_stats.csv, <plate>_plot.png, 성장 파라미터(<plate>_growth_*.csv)를 저장함
+<plate>_layout.csv 가 없으면 폴더의 layout.csv 를 공용 layout으로 사용
+--cache-dir 를 주면 파싱 결과를 Feather로 저장해 두고 같은 파일은 다시 파싱하지 않음
+
+    python od_batch.py runs/ -o results/ --workers 4
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from io import BytesIO
+
+import matplotlib
+matplotlib.use("Agg")
+
+from od_cache import PlateCache, cached_read_plate, content_hash
+from od_growth import growth_summary
+from od_plot import ERROR_TYPES, default_colors, default_groups, growth_png
+from od_profile import Profiler
+from od_processing import BLANK_MODES, CSV_ENGINES, correct_blanks, group_stats, read_plate
+
+LAYOUT_SUFFIX = "_layout.csv"
+DATA_SUFFIX = "_data.csv"
+
+
+def find_plates(input_dir):
+    """(plate 이름, layout 경로, data 경로) 리스트"""
+    shared_layout = os.path.join(input_dir, "layout.csv")
+    plates = []
+    for fname in sorted(os.listdir(input_dir)):
+        if not fname.endswith(DATA_SUFFIX):
+            continue
+        name = fname[:-len(DATA_SUFFIX)]
+        layout_path = os.path.join(input_dir, name + LAYOUT_SUFFIX)
+        if not os.path.exists(layout_path):
+            if not os.path.exists(shared_layout):
+                print(f"⚠️ {name}: layout 파일이 없어 건너뜀", file=sys.stderr)
+                continue
+            layout_path = shared_layout
+        plates.append((name, layout_path, os.path.join(input_dir, fname)))
+    return plates
+
+
+def process_plate(name, layout_path, data_path, output_dir, options):
+    """
+    플레이트 하나 처리 (워커 프로세스에서 실행) -> 처리 결과 요약 dict
+    --profile 이면 단계별 시간(--profile-memory 면 최대 메모리도)을 <plate>_profile.json 으로 저장
+    """
+    if not options["profile"]:
+        return run_plate(name, layout_path, data_path, output_dir, options)
+
+    profiler = Profiler(trace_memory=options["profile_memory"])
+    profiler.meta.update(file=data_path, file_bytes=os.path.getsize(data_path))
+    with profiler.activate():
+        result = run_plate(name, layout_path, data_path, output_dir, options)
+    with open(os.path.join(output_dir, f"{name}_profile.json"), "w", encoding="utf-8") as f:
+        f.write(profiler.to_json())
+    return result
+
+
+def run_plate(name, layout_path, data_path, output_dir, options):
+    start = time.perf_counter()
+
+    with open(layout_path, "rb") as f:
+        layout_bytes = f.read()
+    with open(data_path, "rb") as f:
+        data_bytes = f.read()
+    cache = PlateCache(options["cache_dir"]) if options["cache_dir"] else None
+    plate, cache_hit = cached_read_plate(
+        cache, content_hash(layout_bytes), content_hash(data_bytes),
+        lambda: read_plate(BytesIO(layout_bytes), BytesIO(data_bytes), options["engine"]), data_path,
+    )
+    plate, blank_found = correct_blanks(
+        plate, options["blank_mode"], options["blank_window"], options["clip_negative"]
+    )
+    stats = group_stats(plate)
+    per_well, per_group = growth_summary(plate, options["growth_window"], options["od_min"])
+
+    stats.to_csv(os.path.join(output_dir, f"{name}_stats.csv"), index=False)
+    per_well.to_csv(os.path.join(output_dir, f"{name}_growth_wells.csv"), index=False)
+    per_group.to_csv(os.path.join(output_dir, f"{name}_growth_groups.csv"), index=False)
+
+    blank_corrected = options["blank_mode"] is not None
+    groups = default_groups(sorted(stats["Group"].unique()), blank_corrected)
+    if groups:
+        png = growth_png(
+            stats, groups, default_colors(groups), options["plot_mode"], options["error_type"], blank_corrected,
+            dpi=options["dpi"],
+        )
+        with open(os.path.join(output_dir, f"{name}_plot.png"), "wb") as f:
+            f.write(png)
+
+    return {
+        "name": name,
+        "timepoints": len(plate.hours),
+        "wells": len(plate.wells),
+        "rows": plate.values.size,
+        "bytes": os.path.getsize(data_path),
+        "blank_found": blank_found,
+        "cache_hit": cache_hit,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="OD600 Plotter batch mode")
+    parser.add_argument("input_dir", help="<plate>_layout.csv / <plate>_data.csv 가 있는 폴더")
+    parser.add_argument("-o", "--output-dir", default=None, help="결과 폴더 (기본: input_dir/results)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--engine", choices=CSV_ENGINES, default="c")
+    parser.add_argument("--blank-mode", choices=BLANK_MODES + ["None"], default=BLANK_MODES[0])
+    parser.add_argument("--blank-window", type=int, default=5)
+    parser.add_argument("--no-clip", action="store_true", help="음수 값을 0으로 자르지 않음")
+    parser.add_argument("--plot-mode", choices=["Mean", "Median"], default="Mean")
+    parser.add_argument("--error-bar", choices=["SD", "SEM", "None"], default="SD")
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--growth-window", type=float, default=1.5, help="µmax 계산 window (시간)")
+    parser.add_argument("--od-min", type=float, default=0.02, help="ln(OD) fit에 사용할 최소 OD")
+    parser.add_argument("--cache-dir", default=None, help="파싱 결과 Feather 캐시 폴더 (기본: 사용 안 함)")
+    parser.add_argument("--profile", action="store_true", help="플레이트별 단계 시간을 JSON으로 저장")
+    parser.add_argument("--profile-memory", action="store_true", help="--profile에 tracemalloc 최대 메모리 추가 (느림)")
+    args = parser.parse_args(argv)
+
+    output_dir = args.output_dir or os.path.join(args.input_dir, "results")
+    os.makedirs(output_dir, exist_ok=True)
+    options = {
+        "engine": args.engine,
+        "blank_mode": None if args.blank_mode == "None" else args.blank_mode,
+        "blank_window": args.blank_window,
+        "clip_negative": not args.no_clip,
+        "plot_mode": args.plot_mode,
+        "error_type": ERROR_TYPES[["SD", "SEM", "None"].index(args.error_bar)],
+        "dpi": args.dpi,
+        "growth_window": args.growth_window,
+        "od_min": args.od_min,
+        "cache_dir": args.cache_dir,
+        "profile": args.profile or args.profile_memory,
+        "profile_memory": args.profile_memory,
+    }
+
+    plates = find_plates(args.input_dir)
+    if not plates:
+        print(f"❌ {args.input_dir} 에서 *{DATA_SUFFIX} 파일을 찾을 수 없습니다.", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    results, failed = [], 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(process_plate, name, layout_path, data_path, output_dir, options): name
+            for name, layout_path, data_path in plates
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"❌ {futures[future]}: {e}", file=sys.stderr)
+                continue
+            results.append(result)
+            blank_note = "" if result["blank_found"] or options["blank_mode"] is None else " (no blanks)"
+            cache_note = " (cached)" if result["cache_hit"] else ""
+            print(
+                f"✅ {result['name']}: {result['timepoints']} timepoints x {result['wells']} wells "
+                f"in {result['seconds']:.2f}s{cache_note}{blank_note}"
+            )
+    total = time.perf_counter() - start
+
+    total_rows = sum(r["rows"] for r in results)
+    total_mb = sum(r["bytes"] for r in results) / 1e6
+    print(
+        f"\n{len(results)} plates ({failed} failed) in {total:.2f}s: "
+        f"{len(results) / total:.2f} plates/s, {total_mb / total:.1f} MB/s, {total_rows / total:,.0f} rows/s"
+    )
+    print(f"결과: {output_dir}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+"""
+파싱된 플레이트 데이터를 로컬 Feather(Arrow IPC) 파일로 저장하는 디스크 캐시
+SpectraMax CSV는 측정이 끝나면 바뀌지 않으므로 파일 내용 해시를 키로 사용
+다시 열 때는 memory-map으로 읽어서 (T, W) 행렬을 복사 없이 가져옴
+
+FigureCache: 렌더링된 그림 (PNG bytes)을 세션 간 공유하는 메모리 LRU
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from importlib.util import find_spec
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 lock 없이 스레드 lock만 사용
+    fcntl = None
+
+from od_processing import PlateMatrix
+from od_profile import profile_stage
+
+CACHE_AVAILABLE = find_spec("pyarrow") is not None
+DEFAULT_CACHE_DIR = os.environ.get("OD_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "od-plotter"))
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+INDEX_FILE = "index.json"
+LOCK_FILE = "index.lock"
+# 캐시 적중 시 last_used를 이 간격(초)보다 자주 기록하지 않음 (적중할 때마다 index 재작성 방지)
+LAST_USED_RESOLUTION = 60
+# 쓰다가 죽은 프로세스가 남긴 임시 파일은 이 시간(초)이 지나면 정리
+STALE_TMP_SECONDS = 3600
+_index_lock = threading.Lock()
+DEFAULT_FIGURE_BYTES = int(os.environ.get("OD_FIGURE_CACHE_MB", 256)) * 1024 ** 2
+
+
+def content_hash(data):
+    """파일 내용 해시 (캐시 키)"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class PlateCache:
+    """
+    <cache_dir>/<key>.feather + index.json (키, 크기, 마지막 사용 시각)
+    전체 크기가 max_bytes를 넘으면 오래 안 쓴 것부터 삭제
+    pyarrow가 없으면 아무것도 저장하지 않음
+    Streamlit 세션 / JobPool 스레드와 od_batch 프로세스가 같이 쓰므로
+    임시 파일은 mkstemp로 만들고, index 읽기-수정-쓰기는 locked() 안에서만 함
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.enabled = CACHE_AVAILABLE
+
+    # --- index ---
+    @property
+    def index_path(self):
+        return os.path.join(self.cache_dir, INDEX_FILE)
+
+    def read_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def write_index(self, index):
+        # 임시 파일에 쓰고 교체 (깨진 JSON이 남지 않게), locked() 안에서 호출
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=1)
+        os.replace(tmp_path, self.index_path)
+
+    @contextmanager
+    def locked(self):
+        """index 읽기-수정-쓰기 lock (같은 프로세스의 스레드 + flock으로 다른 프로세스)"""
+        with _index_lock:
+            if fcntl is None:
+                yield
+                return
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(os.path.join(self.cache_dir, LOCK_FILE), "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.feather")
+
+    # --- load / save ---
+    def load(self, key):
+        """캐시된 PlateMatrix (없으면 None)"""
+        if not self.enabled or not os.path.exists(self.path(key)):
+            return None
+        import pyarrow as pa
+
+        try:
+            table = pa.ipc.open_file(pa.memory_map(self.path(key), "r")).read_all()
+        except (OSError, pa.ArrowInvalid):
+            return None
+        meta = json.loads(table.schema.metadata[b"od_plate"])
+
+        n_wells = len(meta["wells"])
+        flat = table.column("values").combine_chunks().flatten().to_numpy()
+        plate = PlateMatrix(
+            hours=table.column("Hours").to_numpy(),
+            times=table.column("Time").to_numpy(zero_copy_only=False).astype(object),
+            wells=np.asarray(meta["wells"], dtype=object),
+            values=flat.reshape(-1, n_wells),
+            groups=np.asarray(meta["groups"], dtype=object),
+            group_codes=np.asarray(meta["group_codes"], dtype=np.intp),
+        )
+
+        now = time.time()
+        with self.locked():
+            index = self.read_index()
+            if key in index and now - index[key]["last_used"] > LAST_USED_RESOLUTION:
+                index[key]["last_used"] = now
+                self.write_index(index)
+        return plate
+
+    def save(self, key, plate, source=None):
+        """PlateMatrix 저장 (압축 없는 Feather -> memory-map 가능) 후 크기 기준 정리"""
+        if not self.enabled:
+            return
+        import pyarrow as pa
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        values = pa.FixedSizeListArray.from_arrays(
+            pa.array(np.ascontiguousarray(plate.values, dtype=np.float32).ravel()), len(plate.wells)
+        )
+        meta = {
+            "wells": [str(w) for w in plate.wells],
+            "groups": [str(g) for g in plate.groups],
+            "group_codes": plate.group_codes.tolist(),
+        }
+        table = pa.table(
+            {"Hours": plate.hours, "Time": plate.times.astype(str), "values": values},
+            metadata={"od_plate": json.dumps(meta)},
+        )
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+        os.close(fd)
+        try:
+            with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            os.replace(tmp_path, self.path(key))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        now = time.time()
+        with self.locked():
+            index = self.read_index()
+            index[key] = {
+                "source": source,
+                "bytes": os.path.getsize(self.path(key)),
+                "timepoints": len(plate.hours),
+                "wells": len(plate.wells),
+                "created": now,
+                "last_used": now,
+            }
+            self.write_index(self.evict(index))
+
+    def evict(self, index):
+        """
+        디스크의 *.feather 파일 기준으로 index를 맞춘 뒤 (index에 없는 파일은 수정 시각으로 추가,
+        파일이 없는 항목은 삭제) 전체 크기가 max_bytes 이하가 될 때까지 마지막 사용이 오래된 것부터 삭제
+        locked() 안에서 호출
+        """
+        now = time.time()
+        on_disk = {}
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".feather"):
+                on_disk[entry.name[:-len(".feather")]] = entry.stat()
+            elif entry.name.endswith(".tmp") and now - entry.stat().st_mtime > STALE_TMP_SECONDS:
+                os.remove(entry.path)
+
+        index = {k: v for k, v in index.items() if k in on_disk}
+        for key, stat in on_disk.items():
+            if key not in index:
+                index[key] = {"source": None, "bytes": stat.st_size, "created": stat.st_mtime, "last_used": stat.st_mtime}
+
+        total = sum(entry["bytes"] for entry in index.values())
+        for key in sorted(index, key=lambda k: index[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            total -= index[key]["bytes"]
+            os.remove(self.path(key))
+            del index[key]
+        return index
+
+    def clear(self):
+        if not os.path.isdir(self.cache_dir):
+            return
+        with self.locked():
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith((".feather", ".tmp")) or entry.name == INDEX_FILE:
+                    os.remove(entry.path)
+
+    def total_bytes(self):
+        return sum(entry["bytes"] for entry in self.read_index().values())
+
+
+def plate_key(layout_key, data_key):
+    return f"{layout_key}-{data_key}"
+
+
+def cached_read_plate(cache, layout_key, data_key, read, source=None):
+    """
+    디스크 캐시에 있으면 memory-map으로 읽고, 없으면 read()로 파싱 후 저장
+    반환: (PlateMatrix, 캐시 적중 여부)
+    """
+    if cache is None:
+        return read(), False
+
+    key = plate_key(layout_key, data_key)
+    with profile_stage("disk cache load"):
+        plate = cache.load(key)
+    if plate is not None:
+        return plate, True
+    plate = read()
+    with profile_stage("disk cache save"):
+        cache.save(key, plate, source)
+    return plate, False
+
+
+def settings_key(*parts):
+    """데이터 키 + 그래프 설정 -> 그림 캐시 키 (repr 해시)"""
+    return content_hash(repr(parts).encode("utf-8"))
+
+
+class FigureCache:
+    """
+    key -> PNG bytes, 전체 크기가 max_bytes를 넘으면 오래 안 쓴 것부터 삭제
+    Streamlit 세션 (스레드) 여러 개가 같이 쓰므로 lock으로 보호
+    """
+
+    def __init__(self, max_bytes=DEFAULT_FIGURE_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            data = self._items.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._items:
+                self._bytes -= len(self._items.pop(key))
+            self._items[key] = data
+            self._bytes += len(data)
+            while self._bytes > self.max_bytes:
+                _, old = self._items.popitem(last=False)
+                self._bytes -= len(old)
+
+    def get_or_render(self, key, render):
+        """캐시에 있으면 그대로, 없으면 render()로 만들어서 저장"""
+        with profile_stage("figure cache lookup"):
+            data = self.get(key)
+        if data is None:
+            data = render()
+            self.put(key, data)
+        return data
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    @property
+    def total_bytes(self):
+        return self._bytes
@@ -0,0 +1,222 @@
+import warnings
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+
+from od_processing import group_stats
+from od_profile import profile_stage
+
+CURVE_QUANTITIES = ["OD600", "Smoothed OD600", "Growth rate (d ln OD/dt)"]
+SMOOTHING_METHODS = ["Savitzky-Golay", "Moving linear fit"]
+# lag 계산용 초기 OD (N0): 처음 N0_POINTS 점의 평균, blank 보정 후 0 이하가 되지 않게 N0_FLOOR 이상으로
+N0_POINTS = 3
+N0_FLOOR = 1e-3
+
+
+def window_sums(a, window):
+    """axis 0 방향 길이 window 구간 합 (누적합 차이, 구간 길이와 무관하게 O(T))"""
+    c = np.cumsum(a, axis=0)
+    c = np.concatenate([np.zeros((1,) + a.shape[1:]), c])
+    return c[window:] - c[:-window]
+
+
+def sliding_slopes(x, y, window):
+    """
+    모든 well에 대해 길이 window 구간별 선형회귀 기울기를 한 번에 계산
+    x: (T,), y: (T, W) -> slopes, y_mean: (T-window+1, W), x_mean: (T-window+1,)
+    구간 안에 NaN이 있으면 NaN
+    """
+    n = len(x) - window + 1
+    if n <= 0:
+        return np.empty((0, y.shape[1])), np.empty((0, y.shape[1])), np.empty(0)
+
+    x_win = np.lib.stride_tricks.sliding_window_view(x, window)
+    x_mean = x_win.mean(axis=1)
+    sxx = ((x_win - x_mean[:, None]) ** 2).sum(axis=1)
+
+    missing = np.isnan(y)
+    y0 = np.where(missing, 0.0, y)
+    # 자릿수 손실을 줄이기 위해 x를 가운데 기준으로 이동
+    xc = (x - x[len(x) // 2])[:, None]
+    sy = window_sums(y0, window)
+    sxy = window_sums(xc * y0, window)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slopes = (sxy - (x_mean - x[len(x) // 2])[:, None] * sy) / sxx[:, None]
+    incomplete = window_sums(missing.astype(float), window) > 0
+    slopes[incomplete] = np.nan
+    y_mean = np.where(incomplete, np.nan, sy / window)
+    return slopes, y_mean, x_mean
+
+
+def window_points(hours, window_h):
+    """시간 단위 window -> 측정 간격 기준 점 개수 (최소 3)"""
+    if len(hours) < 2:
+        return 3
+    return max(3, int(round(window_h / np.median(np.diff(hours)))) + 1)
+
+
+def growth_parameters(hours, od, window_h=1.5, od_min=0.02):
+    """
+    (timepoints x wells) OD 행렬에서 well별 성장 파라미터를 벡터화 계산
+    - µmax: ln(OD)의 sliding window(window_h 시간) 선형회귀 기울기 최댓값 (od_min 미만 구간은 제외)
+    - lag: µmax 접선이 초기 ln(OD) = ln(N0)와 만나는 시간 (tangent method)
+      N0는 od_min과 무관하게 처음 N0_POINTS 점의 평균 (N0_FLOOR 이상)
+    - doubling time: ln2 / µmax
+    - max OD (carrying capacity 추정), AUC (사다리꼴 적분)
+    반환: {파라미터: (wells,) 배열}
+    """
+    n_wells = od.shape[1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_od = np.log(np.where(od >= od_min, od, np.nan))
+
+    slopes, y_center, x_center = sliding_slopes(hours, log_od, window_points(hours, window_h))
+    cols = np.arange(n_wells)
+    if len(slopes):
+        finite = np.isfinite(slopes)
+        valid = finite.any(axis=0)
+        best = np.argmax(np.where(finite, slopes, -np.inf), axis=0)
+        mu_max = np.where(valid, slopes[best, cols], np.nan)
+        t_mu = np.where(valid, x_center[best], np.nan)
+        y_mu = np.where(valid, y_center[best, cols], np.nan)
+    else:
+        mu_max = t_mu = y_mu = np.full(n_wells, np.nan)
+
+    # 초기 ln(OD): od_min 미만인 접종 직후 값도 포함 (od_min 이상인 첫 값을 쓰면 lag가 od_min 도달 시간이 됨)
+    with np.errstate(invalid="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # 처음 점들이 전부 NaN인 well
+        od0 = np.nanmean(od[:N0_POINTS], axis=0)
+    log_od0 = np.log(np.fmax(np.nan_to_num(od0, nan=N0_FLOOR), N0_FLOOR))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lag = np.where(mu_max > 0, t_mu - (y_mu - log_od0) / mu_max, np.nan)
+        doubling = np.where(mu_max > 0, np.log(2) / mu_max, np.nan)
+    lag = np.clip(lag, hours[0] if len(hours) else 0, None)
+
+    dt = np.diff(hours)[:, None]
+    auc = np.nansum((od[1:] + od[:-1]) / 2 * dt, axis=0)
+    max_od = np.fmax.reduce(od, axis=0)
+
+    return {
+        "lag_h": lag,
+        "mu_max": mu_max,
+        "doubling_time_h": doubling,
+        "t_mu_max_h": t_mu,
+        "max_od": max_od,
+        "auc": auc,
+    }
+
+
+def growth_summary(plate, window_h=1.5, od_min=0.02):
+    """
+    PlateMatrix의 성장 파라미터 요약 -> (well별 테이블, group별 mean/std 테이블)
+    """
+    with profile_stage("growth parameters"):
+        params = growth_parameters(plate.hours, plate.values.astype(np.float64), window_h, od_min)
+
+    per_well = pd.DataFrame({"Well": plate.wells, "Group": plate.well_groups, **params})
+    per_group = per_well.groupby("Group")[list(params)].agg(["mean", "std"])
+    per_group.columns = [f"{param}_{agg}" for param, agg in per_group.columns]
+    per_group.insert(0, "n_wells", per_well.groupby("Group")["Well"].count())
+    return per_well, per_group.reset_index()
+
+
+# --- Smoothing / 순간 성장 속도 ---
+def odd_window(hours, window_h):
+    """시간 단위 window -> 가운데가 있는 홀수 점 개수 (최소 3)"""
+    window = window_points(hours, window_h)
+    return window + 1 if window % 2 == 0 else window
+
+
+def savgol_coeffs(window, polyorder, deriv=0, delta=1.0):
+    """
+    길이 window 구간에 polyorder차 다항식을 least squares로 맞춘 필터 계수 (window, window)
+    i번째 행 @ 구간 값 = 구간 i번째 위치의 다항식 값 (deriv=1 이면 기울기, 단위는 1/delta)
+    가운데 행이 보통의 Savitzky-Golay 계수
+    """
+    pos = np.arange(window) - window // 2
+    powers = np.arange(polyorder + 1)
+    fit = np.linalg.pinv(pos[:, None] ** powers)  # 구간 값 -> 다항식 계수
+    if deriv == 0:
+        evaluate = pos[:, None] ** powers
+    else:
+        evaluate = np.where(powers > 0, powers * pos[:, None] ** np.maximum(powers - 1, 0), 0.0)
+    return evaluate @ fit / delta ** deriv
+
+
+def savgol_filter(y, window, polyorder, deriv=0, delta=1.0):
+    """
+    (T, W) 행렬의 모든 well을 한 번에 Savitzky-Golay 필터 (측정 간격이 일정하다고 가정)
+    가운데 구간은 window번의 (T, W) 곱셈-누적 (큰 (T, W, window) 배열을 만들지 않음)
+    양 끝 window // 2 점은 첫/마지막 구간 다항식 값으로 채움 (scipy mode="interp"와 같음)
+    구간 안에 NaN이 있으면 NaN
+    """
+    n_times = len(y)
+    if n_times < window:
+        return np.full(y.shape, np.nan)
+    coeffs = savgol_coeffs(window, min(polyorder, window - 1), deriv, delta)
+    half = window // 2
+    n = n_times - window + 1
+
+    out = np.empty(y.shape)
+    center = np.zeros((n,) + y.shape[1:])
+    for k, c in enumerate(coeffs[half]):
+        center += c * y[k:k + n]
+    out[half:half + n] = center
+    out[:half] = coeffs[:half] @ y[:window]
+    out[half + n:] = coeffs[half + 1:] @ y[-window:]
+    return out
+
+
+def moving_fit(hours, y, window):
+    """
+    길이 window 구간 선형회귀 -> 가운데 시점의 (적합값, 기울기) (T, W), 양 끝은 NaN
+    """
+    slopes, y_mean, x_mean = sliding_slopes(hours, y, window)
+    half = window // 2
+    fitted = np.full(y.shape, np.nan)
+    slope = np.full(y.shape, np.nan)
+    if len(slopes):
+        center = hours[half:half + len(slopes)]
+        fitted[half:half + len(slopes)] = y_mean + slopes * (center - x_mean)[:, None]
+        slope[half:half + len(slopes)] = slopes
+    return fitted, slope
+
+
+def smooth_od(hours, od, method=SMOOTHING_METHODS[0], window_h=1.0, polyorder=2):
+    """모든 well의 smoothing OD (T, W)"""
+    window = odd_window(hours, window_h)
+    if method == "Moving linear fit":
+        return moving_fit(hours, od, window)[0]
+    return savgol_filter(od, window, polyorder, delta=np.median(np.diff(hours)) if len(hours) > 1 else 1.0)
+
+
+def growth_rate(hours, od, method=SMOOTHING_METHODS[0], window_h=1.0, polyorder=2, od_min=0.02):
+    """
+    모든 well의 비성장속도 µ(t) = d(ln OD)/dt (1/h) (T, W)
+    od_min 미만은 ln(OD)가 불안정하므로 NaN (그 점이 들어간 구간도 NaN)
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_od = np.log(np.where(od >= od_min, od, np.nan))
+    window = odd_window(hours, window_h)
+    if method == "Moving linear fit":
+        return moving_fit(hours, log_od, window)[1]
+    delta = np.median(np.diff(hours)) if len(hours) > 1 else 1.0
+    return savgol_filter(log_od, window, polyorder, deriv=1, delta=delta)
+
+
+def curve_stats(plate, quantity, method=SMOOTHING_METHODS[0], window_h=1.0, polyorder=2, od_min=0.02,
+                robust=False, trim=0.1):
+    """
+    Smoothed OD 또는 성장 속도 곡선 -> group_stats와 같은 형식 (mean / std / median / count / sem)
+    """
+    if quantity == CURVE_QUANTITIES[0]:
+        return group_stats(plate, robust, trim)
+    od = plate.values.astype(np.float64)
+    with profile_stage(f"{quantity.lower()} ({method})"):
+        if quantity == CURVE_QUANTITIES[1]:
+            values = smooth_od(plate.hours, od, method, window_h, polyorder)
+        else:
+            values = growth_rate(plate.hours, od, method, window_h, polyorder, od_min)
+    return group_stats(replace(plate, values=values.astype(np.float32)), robust, trim)
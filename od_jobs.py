@@ -0,0 +1,228 @@
+"""
+무거운 처리 (파싱 / blank 보정 / 통계)를 Streamlit 스크립트 스레드 밖의 작업 풀에서 실행
+- 세션 수와 상관없이 동시에 실행되는 작업은 max_workers개로 제한 (공용 lab 서버 CPU 보호)
+- 같은 key의 작업은 한 번만 실행하고, 기다리는 세션들이 결과를 공유
+- 끝난 결과는 풀의 LRU (전체 크기 max_bytes 이하)에 남겨서 다음 rerun / 다른 세션은 바로 가져감
+  실패한 작업은 남기지 않으므로 같은 key로 다시 제출하면 다시 실행
+- 작업 함수가 job.advance(stage)로 단계를 알리면 진행률 표시 + 취소 확인 (단계 경계에서 멈춤)
+- 제출한 세션이 Profiling 중이면 작업마다 전용 Profiler에 기록하고, 기다린 세션이 끝난 뒤 합침 (merge_profile)
+
+pandas C 파서 / pyarrow / numpy 연산은 GIL을 풀기 때문에 스레드 풀로도 여러 플레이트가 동시에 처리됨
+(프로세스 풀은 PlateMatrix를 pickle로 주고받는 비용이 듦)
+"""
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import fields, is_dataclass
+
+import numpy as np
+import pandas as pd
+
+from od_profile import Profiler, active_profiler
+
+DEFAULT_WORKERS = int(os.environ.get("OD_WORKERS", min(4, os.cpu_count() or 1)))
+DEFAULT_RESULT_BYTES = int(os.environ.get("OD_JOB_RESULTS_MB", 512)) * 1024 ** 2
+
+
+class JobCancelled(Exception):
+    """취소된 작업 (다음 단계로 넘어갈 때 발생)"""
+
+
+def result_nbytes(result):
+    """
+    작업 결과의 대략적인 메모리 크기 (numpy 배열 / DataFrame / PlateMatrix 같은 dataclass / tuple, list, dict)
+    object 배열 (Time 문자열 등)은 원소 크기까지 포함
+    """
+    if isinstance(result, np.ndarray):
+        if result.dtype == object:
+            return result.nbytes + sum(sys.getsizeof(item) for item in result.ravel())
+        return result.nbytes
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return int(np.sum(result.memory_usage(index=True, deep=True)))
+    if is_dataclass(result) and not isinstance(result, type):
+        return sum(result_nbytes(getattr(result, f.name)) for f in fields(result))
+    if isinstance(result, (tuple, list)):
+        return sum(result_nbytes(item) for item in result)
+    if isinstance(result, dict):
+        return sum(result_nbytes(item) for item in result.values())
+    return sys.getsizeof(result)
+
+
+class Job:
+    """
+    작업 하나의 상태: 단계 목록 중 현재 단계, 취소 요청, 결과 Future
+    waiters: 이 작업 결과를 기다리는 세션 수 (0이 되면 취소)
+    profiler: 이 작업 전용 Profiler (제출한 세션이 Profiling 중일 때만), finished: 끝난 시각 (perf_counter)
+    """
+
+    def __init__(self, key, stages, profiler=None):
+        self.key = key
+        self.stages = list(stages)
+        self.stage = None
+        self.waiters = 0
+        self.profiler = profiler
+        self.finished = None
+        self.future = Future()
+        self._cancel = threading.Event()
+
+    def advance(self, stage):
+        """(작업 스레드) 다음 단계 시작, 취소 요청이 있으면 JobCancelled"""
+        if self._cancel.is_set():
+            raise JobCancelled(self.key)
+        self.stage = stage
+
+    def cancel(self):
+        self._cancel.set()
+        self.future.cancel()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def done(self):
+        return self.future.done()
+
+    @property
+    def failed(self):
+        """예외로 끝난 작업 (취소 제외)"""
+        return self.done and not self.future.cancelled() and self.future.exception() is not None
+
+    @property
+    def progress(self):
+        """완료한 단계 비율 (0 ~ 1)"""
+        if self.done:
+            return 1.0
+        if self.stage not in self.stages:
+            return 0.0
+        return self.stages.index(self.stage) / len(self.stages)
+
+    def status(self):
+        if self.done:
+            return "Done"
+        if self.stage is None:
+            return "Waiting for a free worker..."
+        return f"{self.stage} ({self.stages.index(self.stage) + 1}/{len(self.stages)})"
+
+
+class JobPool:
+    """
+    key -> Job (실행 중) + key -> 결과 (성공한 작업만, 전체 크기가 max_bytes를 넘으면 오래 안 쓴 것부터 삭제)
+    Streamlit 세션 (스레드) 여러 개가 같이 쓰므로 lock으로 보호
+    """
+
+    def __init__(self, max_workers=DEFAULT_WORKERS, max_bytes=DEFAULT_RESULT_BYTES):
+        self.max_workers = max_workers
+        self.max_bytes = max_bytes
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="od-job")
+        self._jobs = {}
+        self._results = OrderedDict()
+        self._sizes = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def submit(self, key, fn, stages, *args):
+        """
+        결과가 있으면 끝난 Job, 같은 key가 실행 중이면 그 Job, 아니면 fn(job, *args)를 새로 제출
+        """
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                job = Job(key, stages)
+                job.future.set_result(self._results[key])
+                return job
+            job = self._jobs.get(key)
+            if job is None or job.cancelled:
+                parent = active_profiler()
+                job = Job(key, stages, Profiler(parent.trace_memory) if parent is not None else None)
+                self._jobs[key] = job
+                self._executor.submit(self._run, job, fn, args)
+            job.waiters += 1
+            return job
+
+    def _run(self, job, fn, args):
+        if not job.future.set_running_or_notify_cancel():
+            self._forget(job)
+            return
+        try:
+            if job.profiler is None:
+                result = fn(job, *args)
+            else:
+                with job.profiler.activate():
+                    result = fn(job, *args)
+        except BaseException as e:
+            job.finished = time.perf_counter()
+            self._forget(job)
+            job.future.set_exception(e)
+            return
+        job.finished = time.perf_counter()
+        self._keep(job.key, result)
+        self._forget(job)
+        job.future.set_result(result)
+
+    def _keep(self, key, result):
+        """결과를 LRU에 저장 (max_bytes보다 큰 결과는 저장하지 않음)"""
+        size = result_nbytes(result)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._results:
+                del self._results[key]
+                self._bytes -= self._sizes.pop(key)
+            self._results[key] = result
+            self._sizes[key] = size
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                old, _ = self._results.popitem(last=False)
+                self._bytes -= self._sizes.pop(old)
+
+    def _forget(self, job):
+        with self._lock:
+            if self._jobs.get(job.key) is job:
+                del self._jobs[job.key]
+
+    def release(self, job):
+        """세션이 더 이상 기다리지 않음 -> 아무도 안 기다리면 취소"""
+        with self._lock:
+            job.waiters = max(job.waiters - 1, 0)
+            if job.waiters == 0 and not job.done:
+                job.cancel()
+                if self._jobs.get(job.key) is job:
+                    del self._jobs[job.key]
+
+    def wait(self, job, on_progress=None, interval=0.1):
+        """끝날 때까지 interval마다 on_progress(job) 호출 후 결과 반환 (작업의 예외는 그대로 전달)"""
+        while not wait([job.future], timeout=interval).done:
+            if on_progress is not None:
+                on_progress(job)
+        return job.future.result()
+
+    def merge_profile(self, job):
+        """
+        (기다린 스레드) 작업의 단계 기록을 현재 Profiler의 현재 단계 아래에 합침
+        이번 측정이 시작된 뒤에 끝난 작업만 (이전 rerun에서 끝난 작업 / 캐시된 결과는 제외)
+        """
+        profiler = active_profiler()
+        if profiler is None or job.profiler is None or job.finished is None or job.finished < profiler.started:
+            return
+        profiler.merge(job.profiler)
+
+    @property
+    def running(self):
+        return len(self._jobs)
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self._sizes.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        return len(self._results)
+
+    @property
+    def total_bytes(self):
+        return self._bytes
@@ -0,0 +1,237 @@
+"""
+진행 중인 SpectraMax export 파일을 따라가며(tail) 새로 추가된 행만 파싱하는 Live 모드
+"""
+import csv
+import os
+from dataclasses import dataclass, field
+from operator import itemgetter
+
+import numpy as np
+import pandas as pd
+
+from od_processing import (
+    HeaderNotFoundError, PlateMatrix, blank_offsets, find_header, group_reduce, parse_time_series
+)
+
+LIVE_BLANK_MODES = ["None", "First timepoint", "Per timepoint"]
+# 그래프에 그리는 시점 수 (group당): stride 간격으로 솎아서 LIVE_MAX_POINTS ~ 2배 사이로 유지
+LIVE_MAX_POINTS = 1000
+
+
+class GrowingArray:
+    """행 방향으로 계속 추가되는 배열 (용량 2배씩 증가 -> 추가 비용은 새 행 수에 비례)"""
+
+    def __init__(self, n_cols, dtype=np.float64, capacity=256):
+        self._data = np.empty((capacity, n_cols), dtype=dtype)
+        self.n = 0
+
+    def append(self, rows):
+        needed = self.n + len(rows)
+        if needed > len(self._data):
+            grown = np.empty((max(needed, 2 * len(self._data)), self._data.shape[1]), dtype=self._data.dtype)
+            grown[:self.n] = self._data[:self.n]
+            self._data = grown
+        self._data[self.n:needed] = rows
+        self.n = needed
+
+    @property
+    def array(self):
+        return self._data[:self.n]
+
+
+@dataclass
+class LiveRun:
+    """
+    Live 파일 상태: 마지막 byte 위치, 파싱한 행 수, 누적 행렬과 시점 x group 통계
+    kept: 그래프에 그릴 시점 index (stride 간격), plot_table: kept 시점의 Long Format 통계 (새 시점만 이어 붙임)
+    """
+    path: str
+    header: list
+    usecols: np.ndarray
+    wells: np.ndarray
+    groups: np.ndarray
+    group_codes: np.ndarray
+    blank_mode: str = "None"
+    clip_negative: bool = True
+    offset: int = 0
+    rows_parsed: int = 0
+    hours: GrowingArray = None
+    values: GrowingArray = None
+    stats: dict = field(default_factory=dict)
+    first_offsets: np.ndarray = None
+    stride: int = 1
+    kept: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    plot_table: pd.DataFrame = None
+
+    @property
+    def n_times(self):
+        return self.hours.n
+
+
+def start_live(path, layout, blank_mode="None", clip_negative=True):
+    """
+    헤더까지만 읽고 LiveRun 생성 (데이터 행은 poll_live에서 읽음)
+    헤더 줄이 아직 '\n'으로 끝나지 않았으면 (쓰는 중) HeaderNotFoundError -> 다음에 다시 시도
+    """
+    with open(path, "rb") as f:
+        pos, header = find_header(f)
+        f.seek(pos)
+        if not f.readline().endswith(b"\n"):
+            raise HeaderNotFoundError("헤더 줄을 아직 쓰는 중입니다.")
+        offset = f.tell()
+
+    names = [c.strip() for c in header]
+    columns, wells, groups, group_codes = layout.select(names)
+    usecols = np.concatenate([[names.index("Time")], columns])
+
+    n_groups = len(groups)
+    return LiveRun(
+        path=path,
+        header=header,
+        usecols=usecols,
+        wells=wells,
+        groups=groups,
+        group_codes=group_codes,
+        blank_mode=blank_mode,
+        clip_negative=clip_negative,
+        offset=offset,
+        hours=GrowingArray(1),
+        values=GrowingArray(len(wells), dtype=np.float32),
+        stats={key: GrowingArray(n_groups) for key in ("mean", "std", "median", "count")},
+    )
+
+
+def poll_live(run):
+    """
+    마지막 위치 이후에 추가된 '완성된 줄'만 파싱해서 누적 -> 새로 추가된 시점 수
+    파일이 줄어들면(새 실험으로 덮어쓰기) ValueError
+    """
+    size = os.path.getsize(run.path)
+    if size < run.offset:
+        raise ValueError("파일 크기가 줄었습니다. 새 실험이면 Live 모드를 다시 시작하세요.")
+    if size == run.offset:
+        return 0
+
+    with open(run.path, "rb") as f:
+        f.seek(run.offset)
+        chunk = f.read(size - run.offset)
+    end = chunk.rfind(b"\n") + 1
+    if end == 0:
+        return 0  # 아직 쓰는 중인 줄
+    chunk = chunk[:end]
+    run.offset += end
+
+    times, values = parse_rows(run, chunk)
+    hours = parse_time_series(pd.Series(times, dtype=object)).to_numpy()
+    keep = ~np.isnan(hours)
+    if not keep.any():
+        return 0
+    hours, values = hours[keep], correct_live_block(run, hours[keep], values[keep])
+
+    first_new = run.n_times
+    run.hours.append(hours[:, None])
+    run.values.append(values)
+    run.rows_parsed += len(hours)
+
+    # 새 행의 (시점, group) 통계만 계산해서 이어 붙임
+    reduced = group_reduce(values, run.group_codes, len(run.groups))
+    for key in run.stats:
+        run.stats[key].append(reduced[key])
+    keep_timepoints(run, first_new)
+    return len(hours)
+
+
+def keep_timepoints(run, first_new):
+    """
+    새 시점 (first_new 이후) 중 stride 배수만 그래프용으로 추가
+    2 * LIVE_MAX_POINTS를 넘으면 stride를 2배로 늘리고 절반만 남김 -> 새 행 수에 비례하는 비용 (분할 상환)
+    """
+    new = np.arange(first_new + (-first_new) % run.stride, run.n_times, run.stride)
+    run.kept = np.concatenate([run.kept, new])
+    run.plot_table = pd.concat([run.plot_table, timepoint_table(run, new)])
+    while len(run.kept) > 2 * LIVE_MAX_POINTS:
+        run.stride *= 2
+        run.kept = run.kept[run.kept % run.stride == 0]
+        run.plot_table = run.plot_table[run.plot_table.index % run.stride == 0]
+
+
+def timepoint_table(run, rows):
+    """시점 index rows의 group 통계 -> group_stats와 같은 Long Format 테이블 (index = 시점 index)"""
+    n_groups = len(run.groups)
+    stats = pd.DataFrame({
+        "Group": np.tile(run.groups, len(rows)),
+        "Hours": np.repeat(run.hours.array[rows, 0], n_groups),
+        **{key: run.stats[key].array[rows].ravel() for key in ("mean", "std", "median", "count")},
+    }, index=np.repeat(rows, n_groups))
+    stats["sem"] = stats["std"] / np.sqrt(stats["count"])
+    return stats
+
+
+def parse_rows(run, chunk):
+    """
+    새로 추가된 줄 -> (Time 문자열, (rows, wells) float32)
+    몇 줄 안 되는 chunk에서는 read_csv의 컬럼별 고정 비용이 커서 한 번에 변환
+    컬럼 수가 모자란 줄(빈 줄, ~End 등)은 건너뜀
+    """
+    n_fields = run.usecols.max() + 1
+    rows = [r for r in csv.reader(chunk.decode("latin1").splitlines()) if len(r) >= n_fields]
+    if not rows:
+        return np.empty(0, dtype=object), np.empty((0, len(run.wells)), dtype=np.float32)
+
+    pick = itemgetter(*run.usecols)
+    cells = np.array([pick(r) for r in rows], dtype=object)
+    values = pd.to_numeric(cells[:, 1:].ravel(), errors="coerce").astype(np.float32)
+    return cells[:, 0], values.reshape(len(rows), -1)
+
+
+def correct_live_block(run, hours, values):
+    """
+    새 블록에 Blank 보정 적용 (행 단위로 독립적인 모드만 지원)
+    First timepoint는 첫 블록의 첫 행에서 한 번만 계산해 고정
+    """
+    if run.blank_mode == "None":
+        return values
+
+    block = PlateMatrix(
+        hours=hours, times=np.empty(len(hours), dtype=object), wells=run.wells,
+        values=values, groups=run.groups, group_codes=run.group_codes,
+    )
+    if run.blank_mode == "First timepoint":
+        if run.first_offsets is None:
+            run.first_offsets = blank_offsets(block, "First timepoint")
+        offsets = run.first_offsets
+    else:
+        offsets = blank_offsets(block, run.blank_mode)
+
+    if offsets is None:
+        return values
+    values = (values - offsets).astype(np.float32)
+    if run.clip_negative:
+        np.clip(values, 0, None, out=values)
+    return values
+
+
+def live_stats(run):
+    """
+    그래프용 group 통계: 이어 붙여 둔 kept 시점 + 마지막 시점 (곡선이 현재 시각까지 이어지도록)
+    행 수는 LIVE_MAX_POINTS 정도로 제한되므로 실행 길이와 상관없는 비용
+    """
+    last = run.n_times - 1
+    if last < 0 or (len(run.kept) and run.kept[-1] == last):
+        return run.plot_table
+    return pd.concat([run.plot_table, timepoint_table(run, np.array([last]))])
+
+
+def latest_summary(run):
+    """group별 마지막 시점의 mean/SD/median/n (시점마다 새로 계산한 값, 시점을 합치지 않음)"""
+    if not run.n_times:
+        return pd.DataFrame(columns=["Group", "Hours", "Mean", "SD", "Median", "n"])
+    last = run.n_times - 1
+    return pd.DataFrame({
+        "Group": run.groups,
+        "Hours": run.hours.array[last, 0],
+        "Mean": run.stats["mean"].array[last],
+        "SD": run.stats["std"].array[last],
+        "Median": run.stats["median"].array[last],
+        "n": run.stats["count"].array[last].astype(int),
+    })
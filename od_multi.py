@@ -0,0 +1,183 @@
+"""
+여러 플레이트를 하나의 저장소에 모아서 비교 (plate / group / well 인덱스)
+모든 플레이트를 공통 시간축의 (T, 전체 well) 행렬로 합친 뒤 group_reduce 한 번으로 통계 계산
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from od_processing import PlateMatrix, correct_blanks, group_stats
+
+ALIGN_MODES = ["Exact timepoints", "Interpolate to common grid"]
+NORMALIZE_MODES = ["None", "Plate max", "Reference group max"]
+GROUP_BY = ["Group (pool plates)", "Plate + Group"]
+
+
+def plate_name(file_name):
+    """run1_data.csv -> run1"""
+    stem = os.path.splitext(os.path.basename(file_name))[0]
+    for suffix in ("_data", "_layout"):
+        if stem.endswith(suffix):
+            return stem[:-len(suffix)]
+    return stem
+
+
+def pair_files(layout_names, data_names):
+    """
+    data 파일마다 layout 파일 짝 찾기 -> {data 이름: layout 이름}
+    <plate>_layout.csv 가 없으면 layout이 하나뿐일 때 공용으로 사용
+    """
+    by_plate = {plate_name(name): name for name in layout_names}
+    shared = layout_names[0] if len(layout_names) == 1 else None
+    pairs = {}
+    for name in data_names:
+        layout = by_plate.get(plate_name(name), shared)
+        if layout is not None:
+            pairs[name] = layout
+    return pairs
+
+
+class PlateStore:
+    """
+    플레이트 이름 -> 원본 PlateMatrix
+    플레이트 추가 시 그 플레이트만 파싱하면 되고, blank 보정 결과는 현재 설정 하나에 대해서만 기억함
+    (설정이 바뀌면 이전 보정 결과는 버림 -> 플레이트마다 보정본은 최대 한 개)
+    """
+
+    def __init__(self):
+        self.plates = {}
+        self.keys = {}
+        self._corrected = {}
+        self._settings = None
+
+    def add(self, name, key, plate):
+        """같은 이름에 같은 내용이면 아무것도 안 함"""
+        if self.keys.get(name) == key:
+            return False
+        self.plates[name] = plate
+        self.keys[name] = key
+        self._corrected.pop(name, None)
+        return True
+
+    def remove(self, name):
+        self.plates.pop(name, None)
+        self.keys.pop(name, None)
+        self._corrected.pop(name, None)
+
+    def retain(self, names):
+        for name in list(self.plates):
+            if name not in names:
+                self.remove(name)
+
+    @property
+    def names(self):
+        return sorted(self.plates)
+
+    @property
+    def content_key(self):
+        """(플레이트 이름, 파일 내용 키) 튜플 -> 저장소 내용이 같으면 같은 값 (캐시 키)"""
+        return tuple(sorted(self.keys.items()))
+
+    def corrected(self, name, blank_mode, blank_window, clip_negative):
+        settings = (blank_mode, blank_window, clip_negative)
+        if settings != self._settings:
+            self._corrected = {}
+            self._settings = settings
+        if name not in self._corrected:
+            self._corrected[name] = correct_blanks(self.plates[name], blank_mode, blank_window, clip_negative)[0]
+        return self._corrected[name]
+
+    def well_index(self):
+        """(Plate, Group, Well) 인덱스 테이블 (combine 결과의 열 순서와 같음)"""
+        parts = [
+            pd.DataFrame({"Plate": name, "Group": self.plates[name].well_groups, "Well": self.plates[name].wells})
+            for name in self.names
+        ]
+        if not parts:
+            return pd.DataFrame(columns=["Plate", "Group", "Well"])
+        return pd.concat(parts, ignore_index=True)
+
+
+def common_grid(hours_list, step=None):
+    """
+    모든 플레이트를 덮는 등간격 시간축 (step 기본값: 플레이트별 측정 간격의 중앙값)
+    """
+    hours_list = [h for h in hours_list if len(h)]
+    if not hours_list:
+        return np.empty(0)
+    if step is None:
+        step = float(np.median([np.median(np.diff(h)) for h in hours_list if len(h) > 1] or [1.0]))
+    start = min(h[0] for h in hours_list)
+    end = max(h[-1] for h in hours_list)
+    return start + np.arange(int(np.floor((end - start) / step + 1e-9)) + 1) * step
+
+
+def interp_matrix(hours, values, grid):
+    """
+    (T, W) 행렬의 모든 well을 grid 시간으로 선형 보간 (한 번의 searchsorted)
+    플레이트 측정 범위 밖은 NaN
+    """
+    out = np.full((len(grid), values.shape[1]), np.nan, dtype=np.float32)
+    if len(hours) < 2:
+        return out
+    inside = (grid >= hours[0]) & (grid <= hours[-1])
+    g = grid[inside]
+    right = np.clip(np.searchsorted(hours, g, side="right"), 1, len(hours) - 1)
+    left = right - 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w = ((g - hours[left]) / (hours[right] - hours[left]))[:, None]
+    out[inside] = values[left] * (1 - w) + values[right] * w
+    return out
+
+
+def place_matrix(hours, values, grid):
+    """정확히 같은 시간에만 값을 넣음 (grid는 모든 플레이트 시간의 합집합)"""
+    out = np.full((len(grid), values.shape[1]), np.nan, dtype=np.float32)
+    out[np.searchsorted(grid, hours)] = values
+    return out
+
+
+def normalize_plate(plate, mode="None", reference=None):
+    """
+    플레이트 간 리더 편차 보정용 스케일링
+    - Plate max: 플레이트 전체 group mean 곡선의 최댓값이 1이 되도록
+    - Reference group max: 기준 group mean 곡선의 최댓값이 1이 되도록 (기준 group이 없으면 그대로)
+    """
+    if mode == "None":
+        return plate.values
+    with np.errstate(invalid="ignore"):
+        stats = group_stats(plate)
+    if mode == "Reference group max":
+        stats = stats[stats["Group"] == reference]
+    scale = stats["mean"].max()
+    if not np.isfinite(scale) or scale <= 0:
+        return plate.values
+    return (plate.values / scale).astype(np.float32)
+
+
+def combine(store, blank_mode=None, blank_window=5, clip_negative=True, align=ALIGN_MODES[0], step=None,
+            normalize="None", reference=None, group_by=GROUP_BY[0]):
+    """
+    저장소의 모든 플레이트 -> 하나의 PlateMatrix (공통 시간축, 열 = 모든 플레이트의 well)
+    group_by에 따라 group 코드를 group 이름 또는 "plate / group" 단위로 매김
+    """
+    plates = [store.corrected(name, blank_mode, blank_window, clip_negative) for name in store.names]
+    if align == ALIGN_MODES[0]:
+        grid = np.unique(np.concatenate([p.hours for p in plates])) if plates else np.empty(0)
+        matrices = [place_matrix(p.hours, normalize_plate(p, normalize, reference), grid) for p in plates]
+    else:
+        grid = common_grid([p.hours for p in plates], step)
+        matrices = [interp_matrix(p.hours, normalize_plate(p, normalize, reference), grid) for p in plates]
+
+    index = store.well_index()
+    labels = index["Group"] if group_by == GROUP_BY[0] else index["Plate"] + " / " + index["Group"]
+    group_codes, groups = pd.factorize(labels.to_numpy(), sort=True)
+    return PlateMatrix(
+        hours=grid,
+        times=np.empty(len(grid), dtype=object),
+        wells=(index["Plate"] + ":" + index["Well"]).to_numpy(dtype=object),
+        values=np.hstack(matrices) if matrices else np.empty((0, 0), dtype=np.float32),
+        groups=np.asarray(groups, dtype=object),
+        group_codes=group_codes.astype(np.intp),
+    ), index
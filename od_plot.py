@@ -0,0 +1,193 @@
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from od_profile import profile_stage
+
+ERROR_TYPES = ["Standard Deviation (SD)", "Standard Error (SEM)", "None"]
+ROBUST_ERROR_TYPES = ["MAD (robust)"]
+ERROR_COLUMNS = {"Standard Deviation (SD)": "std", "Standard Error (SEM)": "sem", "MAD (robust)": "mad"}
+CENTRAL_COLUMNS = {"Mean": "mean", "Median": "median", "Trimmed Mean": "trimmed_mean"}
+DOWNSAMPLE_METHODS = ["LTTB", "Min/Max", "None"]
+# matplotlib tab10 (matplotlib은 static plot / PNG를 그릴 때만 import)
+TAB10 = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"]
+
+
+def default_colors(groups):
+    """그룹 순서대로 tab10 색상 할당"""
+    return {group: TAB10[i % 10] for i, group in enumerate(groups)}
+
+
+def od_label(blank_corrected):
+    return "OD600 (Corrected)" if blank_corrected else "OD600 (Raw)"
+
+
+def default_groups(all_groups, blank_corrected):
+    """Blank 보정 시에는 blank 그룹을 기본 선택에서 제외"""
+    if blank_corrected:
+        return [g for g in all_groups if not g.lower().startswith("blank")]
+    return list(all_groups)
+
+
+# --- Downsampling ---
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets: 곡선 모양을 유지하면서 n_out개 점의 인덱스 선택
+    (첫/마지막 점은 항상 포함, 버킷 안 계산은 벡터화)
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        nxt_end = edges[i + 2] if i + 2 < len(edges) else n
+        # 다음 버킷의 평균점
+        avg_x = x[end:nxt_end].mean() if nxt_end > end else x[-1]
+        avg_y = y[end:nxt_end].mean() if nxt_end > end else y[-1]
+        area = np.abs(
+            (x[prev] - avg_x) * (y[start:end] - y[prev]) - (x[prev] - x[start:end]) * (avg_y - y[prev])
+        )
+        prev = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        selected[i + 1] = prev
+    return selected
+
+
+def minmax_indices(y, n_out):
+    """
+    버킷마다 최솟값/최댓값 두 점을 남김 (약 n_out개, 피크 보존, 완전 벡터화)
+    """
+    n = len(y)
+    n_buckets = n_out // 2
+    if n_buckets < 1 or n <= n_out:
+        return np.arange(n)
+
+    bucket = n // n_buckets
+    usable = bucket * n_buckets
+    blocks = np.nan_to_num(y[:usable], nan=np.nanmean(y)).reshape(n_buckets, bucket)
+    offsets = np.arange(n_buckets) * bucket
+    idx = np.concatenate([offsets + blocks.argmin(axis=1), offsets + blocks.argmax(axis=1), np.arange(usable, n)])
+    return np.unique(idx)
+
+
+def downsample_stats(stats, selected_groups, y_col, max_points=1000, method="LTTB"):
+    """
+    Group별로 max_points 이하가 되도록 통계 테이블 행을 줄임 (표시용)
+    """
+    if method == "None":
+        return stats[stats["Group"].isin(selected_groups)]
+
+    parts = []
+    for group in selected_groups:
+        subset = stats[stats["Group"] == group]
+        x = subset["Hours"].to_numpy(dtype=float)
+        y = subset[y_col].to_numpy(dtype=float)
+        if method == "LTTB":
+            idx = lttb_indices(x, y, max_points)
+        else:
+            idx = minmax_indices(y, max_points)
+        parts.append(subset.iloc[idx])
+    return stats.iloc[:0] if not parts else pd.concat(parts)
+
+
+def plot_growth(stats, selected_groups, colors, plot_mode="Mean", error_type=ERROR_TYPES[0], blank_corrected=True,
+                ylabel=None):
+    """
+    Group별 성장 곡선 (mean/median/trimmed mean + SD/SEM/MAD 에러바) Figure 생성
+    pyplot 대신 Figure를 직접 만들어서 plt.close() 없이 정리됨
+    """
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+
+    filtered_stats = stats[stats["Group"].isin(selected_groups)]
+
+    for group in selected_groups:
+        subset = filtered_stats[filtered_stats["Group"] == group]
+
+        x = subset["Hours"]
+        y = subset[CENTRAL_COLUMNS[plot_mode]]
+
+        yerr = subset[ERROR_COLUMNS[error_type]] if error_type in ERROR_COLUMNS else None
+
+        ax.errorbar(
+            x, y, yerr=yerr,
+            label=group,
+            color=colors[group],
+            capsize=3,
+            fmt='-o',
+            markersize=4,
+            linewidth=1.5,
+            alpha=0.8
+        )
+
+    ax.set_xlabel("Time (Hours)", fontsize=12)
+    ylabel = ylabel or od_label(blank_corrected)
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.set_title(f"Growth Curve ({plot_mode})", fontsize=14)
+    ax.legend(bbox_to_anchor=(1.02, 1), loc='upper left')
+    ax.grid(True, linestyle='--', alpha=0.5)
+
+    if blank_corrected:
+        ax.axhline(0, color='black', linewidth=0.8, linestyle='-')
+
+    fig.tight_layout()
+    return fig
+
+
+def growth_chart(stats, selected_groups, colors, plot_mode="Mean", error_type=ERROR_TYPES[0], blank_corrected=True,
+                 ylabel=None):
+    """
+    인터랙티브 성장 곡선 (Vega-Lite / Altair, 줌/툴팁 지원)
+    stats는 downsample_stats로 미리 줄여서 넘길 것
+    """
+    import altair as alt
+
+    y_col = CENTRAL_COLUMNS[plot_mode]
+    err_col = ERROR_COLUMNS.get(error_type)
+    data = stats[stats["Group"].isin(selected_groups)][["Group", "Hours", y_col] + ([err_col] if err_col else [])].rename(
+        columns={y_col: "y"}
+    )
+    ylabel = ylabel or od_label(blank_corrected)
+
+    color = alt.Color(
+        "Group:N",
+        scale=alt.Scale(domain=list(selected_groups), range=[colors[g] for g in selected_groups]),
+        legend=alt.Legend(title=None),
+    )
+    base = alt.Chart(data).encode(x=alt.X("Hours:Q", title="Time (Hours)"), color=color)
+    line = base.mark_line(strokeWidth=1.5).encode(
+        y=alt.Y("y:Q", title=ylabel),
+        tooltip=["Group", alt.Tooltip("Hours:Q", format=".2f"), alt.Tooltip("y:Q", title=plot_mode, format=".4f")],
+    )
+    layers = [line]
+    if err_col:
+        band = base.transform_calculate(
+            lower=f"datum.y - datum.{err_col}", upper=f"datum.y + datum.{err_col}"
+        ).mark_area(opacity=0.2).encode(y="lower:Q", y2="upper:Q")
+        layers.insert(0, band)
+    if blank_corrected:
+        layers.append(alt.Chart(pd.DataFrame({"y": [0]})).mark_rule(color="black", strokeWidth=0.8).encode(y="y:Q"))
+
+    return alt.layer(*layers).properties(title=f"Growth Curve ({plot_mode})", height=450).interactive()
+
+
+def figure_png(fig, dpi=300):
+    """Figure -> PNG bytes"""
+    img_buf = BytesIO()
+    fig.savefig(img_buf, format='png', dpi=dpi, bbox_inches='tight')
+    return img_buf.getvalue()
+
+
+def growth_png(stats, selected_groups, colors, plot_mode="Mean", error_type=ERROR_TYPES[0], blank_corrected=True, dpi=300,
+               ylabel=None):
+    """PNG 렌더링 (다운로드는 300 dpi, 화면 표시용 static plot은 낮은 dpi)"""
+    with profile_stage(f"PNG export ({dpi} dpi)"):
+        fig = plot_growth(stats, selected_groups, colors, plot_mode, error_type, blank_corrected, ylabel)
+        return figure_png(fig, dpi=dpi)
@@ -0,0 +1,545 @@
+import csv
+import hashlib
+import os
+import threading
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from importlib.util import find_spec
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from od_profile import profile_stage
+
+
+def parse_time(t_str):
+    """
+    [수정됨] 24시간 이상 실험 포맷 지원 (d.hh:mm:ss)
+    예: 1.01:00:00 -> 1일 1시간 = 25시간으로 변환
+    """
+    try:
+        t_str = str(t_str).strip()
+        parts = t_str.split(':')
+
+        # hh:mm:ss 또는 d.hh:mm:ss 형식
+        if len(parts) == 3:
+            # 첫 번째 파트(시)에 마침표(.)가 있는지 확인 (예: 1.01)
+            time_part = parts[0]
+            if '.' in time_part:
+                day_str, hour_str = time_part.split('.')
+                days = float(day_str)
+                hours = float(hour_str)
+                # 날짜를 시간으로 변환하여 합산
+                total_hours = (days * 24) + hours
+            else:
+                total_hours = float(time_part)
+
+            minutes = float(parts[1])
+            seconds = float(parts[2])
+
+            return total_hours + minutes/60 + seconds/3600
+
+        # mm:ss 또는 hh:mm (드문 경우)
+        elif len(parts) == 2:
+            p1, p2 = map(float, parts)
+            # 보통 2개면 분:초 일 확률이 높지만, 상황에 따라 다름.
+            # 여기서는 안전하게 분:초로 가정
+            return p1/60 + p2/3600
+
+    except Exception:
+        return None
+    return None
+
+
+MAX_TIME_CHARS = 16
+
+
+def parse_time_series(times):
+    """
+    parse_time의 벡터화 버전
+    문자열을 (행 x 글자) 코드 배열로 바꿔 글자 위치별로 한 번에 파싱함 (d.hh:mm:ss / hh:mm:ss / mm:ss)
+    소수점 등 예외적인 값만 parse_time으로 다시 계산하므로 결과는 parse_time과 동일함
+    """
+    times = pd.Series(times)
+    n = len(times)
+    if n == 0:
+        return pd.Series(np.nan, index=times.index)
+
+    text = np.char.strip(times.to_numpy(dtype=str))
+    # ~End, Original Filename 같은 긴 꼬리 줄 때문에 글자 루프가 길어지지 않게 비워두고 parse_time으로 처리
+    lengths = np.char.str_len(text)
+    too_long = lengths > MAX_TIME_CHARS
+    if too_long.any():
+        width = max(int(lengths[~too_long].max(initial=1)), 1)
+        text = np.where(too_long, "", text).astype(f"U{width}")
+    chars = text.view(np.uint32).reshape(n, -1).astype(np.int64)
+
+    n_colon = (chars == ord(':')).sum(axis=1)
+    ok = (n_colon == 1) | (n_colon == 2)
+    rows = np.arange(n)
+    fields = np.zeros((n, 3))
+    days = np.zeros(n)
+    cur = np.zeros(n)
+    n_digits = np.zeros(n, dtype=np.int64)
+    part = np.zeros(n, dtype=np.int64)
+    day_seen = np.zeros(n, dtype=bool)
+
+    for c in chars.T:
+        is_digit = (c >= ord('0')) & (c <= ord('9'))
+        is_colon = c == ord(':')
+        # d.hh:mm:ss 의 날짜 구분자 (첫 번째 파트의 마침표)
+        is_day = (c == ord('.')) & (part == 0) & (n_colon == 2)
+        ok &= is_digit | is_colon | is_day | (c == 0)
+        ok &= ~is_day | ((n_digits > 0) & ~day_seen)
+        ok &= ~is_colon | (n_digits > 0)
+
+        cur = np.where(is_digit, cur * 10 + (c - ord('0')), cur)
+        n_digits += is_digit
+
+        days = np.where(is_day, cur, days)
+        day_seen |= is_day
+
+        fields[rows[is_colon], np.minimum(part[is_colon], 2)] = cur[is_colon]
+        reset = is_day | is_colon
+        cur[reset] = 0
+        n_digits[reset] = 0
+        part += is_colon
+
+    ok &= n_digits > 0
+    fields[rows, np.minimum(part, 2)] = cur
+
+    # parse_time과 같은 연산 순서
+    three = (days * 24 + fields[:, 0]) + fields[:, 1] / 60 + fields[:, 2] / 3600
+    two = fields[:, 0] / 60 + fields[:, 1] / 3600
+    hours = np.where(n_colon == 2, three, two)
+
+    # 소수점, 공백 등은 기존 함수로 처리
+    if not ok.all():
+        bad = np.flatnonzero(~ok)
+        hours[bad] = np.array([parse_time(t) for t in times.iloc[bad]], dtype=float)
+    return pd.Series(hours, index=times.index)
+
+
+# --- Plate Loading ---
+CSV_ENGINES = ["c", "pyarrow"] if find_spec("pyarrow") else ["c"]
+
+
+class HeaderNotFoundError(ValueError):
+    pass
+
+
+# --- Plate Layout ---
+PLATE_FORMATS = {96: (8, 12), 384: (16, 24), 1536: (32, 48)}
+LAYOUT_CACHE_SIZE = 32
+
+
+def row_number(label):
+    """행 이름 -> 0부터 시작하는 행 번호 (A=0, Z=25, AA=26, ..., AF=31), 알파벳이 아니면 -1"""
+    label = str(label).strip().upper()
+    if not label.isalpha() or not label.isascii():
+        return -1
+    number = 0
+    for ch in label:
+        number = number * 26 + ord(ch) - ord("A") + 1
+    return number - 1
+
+
+def sample_groups(names):
+    """샘플 이름 -> group (A1-1 -> A1, 마지막 '-' 뒤는 replicate 번호)"""
+    head, sep, _ = (names.str.rpartition("-")[i] for i in range(3))
+    return head.where(sep != "", names)
+
+
+def group_conditions(groups):
+    """
+    group 이름 (G,) -> (group -> 조건 코드, 조건 이름, blank 여부)
+    조건은 첫 '-' 뒤 (blank-LB -> LB, WT-LB -> LB), 없으면 default
+    """
+    groups = pd.Series(groups, dtype=object).astype(str)
+    parts = groups.str.partition("-")
+    condition = parts[2].where(parts[1] != "", "default")
+    condition_codes, conditions = pd.factorize(condition)
+    is_blank = groups.str.lower().str.startswith("blank").to_numpy()
+    return condition_codes.astype(np.intp), np.asarray(conditions, dtype=object), is_blank
+
+
+@dataclass
+class CompiledLayout:
+    """
+    Plate Layout CSV를 정수 배열로 컴파일한 결과
+    데이터 헤더와는 well 이름 -> 위치 dict 한 번으로 맞추고, 나머지는 모두 정수 인덱싱
+    96 / 384 / 1536 well (AA..AF 행) 지원
+    """
+    wells: np.ndarray            # (N,) well 이름 (값이 있는 칸만)
+    rows: np.ndarray             # (N,) 행 번호 (A=0, AA=26)
+    cols: np.ndarray             # (N,) 열 번호 (1부터, 숫자가 아니면 -1)
+    group_codes: np.ndarray      # (N,) well -> groups 인덱스
+    groups: np.ndarray           # (G,) group 이름 (정렬)
+    condition_codes: np.ndarray  # (G,) group -> conditions 인덱스
+    conditions: np.ndarray       # (C,) blank 조건 이름
+    is_blank: np.ndarray         # (G,) blank group 여부
+    plate_format: object = None  # 96 / 384 / 1536 (행/열이 들어가는 가장 작은 포맷), 아니면 None
+    index: dict = field(default_factory=dict, repr=False)  # well 이름 -> 위치
+
+    def __post_init__(self):
+        if not self.index:
+            self.index = {well: i for i, well in enumerate(self.wells)}
+
+    def select(self, names):
+        """
+        데이터 헤더 -> (헤더 열 위치, well 이름, group 이름, well -> group 코드)
+        layout에 있는 well만 헤더 순서대로, 데이터에 없는 group은 빠지도록 코드를 다시 매김
+        """
+        matched = [(i, self.index[name]) for i, name in enumerate(names) if name in self.index]
+        columns = np.array([i for i, _ in matched], dtype=np.intp)
+        positions = np.array([j for _, j in matched], dtype=np.intp)
+        present, group_codes = np.unique(self.group_codes[positions], return_inverse=True)
+        return columns, self.wells[positions], self.groups[present], group_codes.astype(np.intp)
+
+
+def compile_layout_table(df_layout):
+    """
+    Layout DataFrame (첫 열 = 행 이름, 나머지 열 = 1..N, 값 = <group>-<replicate>) -> CompiledLayout
+    """
+    row_labels = df_layout.iloc[:, 0].astype(str).str.strip().to_numpy()
+    col_labels = np.array([str(c).strip() for c in df_layout.columns[1:]])
+    names = df_layout.iloc[:, 1:].to_numpy(dtype=object)
+    filled = pd.notna(names)
+    r, c = np.nonzero(filled)
+
+    wells = np.char.add(row_labels[r].astype(str), col_labels[c]).astype(object)
+    group_codes, groups = pd.factorize(sample_groups(pd.Series(names[filled]).astype(str)), sort=True)
+    condition_codes, conditions, is_blank = group_conditions(groups)
+
+    row_numbers = np.array([row_number(label) for label in row_labels], dtype=np.intp)[r]
+    col_numbers = pd.to_numeric(pd.Series(col_labels), errors="coerce").fillna(-1).astype(np.intp).to_numpy()[c]
+    plate_format = None
+    if len(wells) and row_numbers.min() >= 0 and col_numbers.min() >= 1:
+        plate_format = next(
+            (n for n, (n_rows, n_cols) in PLATE_FORMATS.items()
+             if row_numbers.max() < n_rows and col_numbers.max() <= n_cols),
+            None,
+        )
+
+    return CompiledLayout(
+        wells=wells,
+        rows=row_numbers,
+        cols=col_numbers,
+        group_codes=group_codes.astype(np.intp),
+        groups=np.asarray(groups, dtype=object),
+        condition_codes=condition_codes,
+        conditions=conditions,
+        is_blank=is_blank,
+        plate_format=plate_format,
+    )
+
+
+_compiled_layouts = OrderedDict()
+_layout_lock = threading.Lock()
+
+
+def compile_layout(layout_file):
+    """
+    Plate Layout CSV (경로 또는 파일 객체) -> CompiledLayout
+    파일 내용 해시로 캐시 (최근 LAYOUT_CACHE_SIZE개), 같은 layout을 쓰는 플레이트끼리 재사용
+    """
+    if isinstance(layout_file, (str, os.PathLike)):
+        with open(layout_file, "rb") as f:
+            data = f.read()
+    else:
+        layout_file.seek(0)
+        data = layout_file.read()
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+    key = hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    with _layout_lock:
+        if key in _compiled_layouts:
+            _compiled_layouts.move_to_end(key)
+            return _compiled_layouts[key]
+    layout = compile_layout_table(pd.read_csv(BytesIO(data)))
+    with _layout_lock:
+        _compiled_layouts[key] = layout
+        while len(_compiled_layouts) > LAYOUT_CACHE_SIZE:
+            _compiled_layouts.popitem(last=False)
+    return layout
+
+
+def find_header(data_file):
+    """
+    'Time' 헤더가 나올 때까지 한 줄씩 읽음 (파일 전체를 디코딩하지 않음)
+    반환: (헤더 줄의 byte 위치, 헤더 컬럼 리스트)
+    """
+    data_file.seek(0)
+    while True:
+        pos = data_file.tell()
+        raw = data_file.readline()
+        if not raw:
+            raise HeaderNotFoundError("데이터 파일에서 'Time' 컬럼을 찾을 수 없습니다.")
+        line = raw.decode('latin1', errors='ignore')
+        if line.strip().startswith("Time") and "," in line:
+            return pos, next(csv.reader([line.strip()]))
+
+
+def load_data(data_file, valid_wells, engine="c"):
+    """
+    SpectraMax Raw Data -> Time, Hours + well 컬럼 (시간순 정렬)
+    헤더 위치에서 바로 read_csv를 시작하고, layout에 있는 well만 float32로 읽음
+    engine: "c" 또는 "pyarrow"
+    """
+    with profile_stage("header scan"):
+        pos, header = find_header(data_file)
+    usecols = [c for c in header if c.strip() == "Time" or c.strip() in valid_wells]
+    dtype = {c: ("str" if c.strip() == "Time" else "float32") for c in usecols}
+    # pyarrow는 컬럼 수가 다른 꼬리 줄(~End 등)에서 에러가 나므로 건너뜀
+    options = {"on_bad_lines": "skip"} if engine == "pyarrow" else {}
+
+    with profile_stage("read_csv (decode)"):
+        data_file.seek(pos)
+        try:
+            df_raw = pd.read_csv(data_file, encoding='latin1', usecols=usecols, dtype=dtype, engine=engine, **options)
+        except ValueError:
+            # OVRFLW 같은 문자열 값이 섞인 경우: 타입 없이 읽고 숫자로 변환
+            data_file.seek(pos)
+            df_raw = pd.read_csv(data_file, encoding='latin1', usecols=usecols, dtype=str, engine=engine, **options)
+            wells = [c for c in usecols if c.strip() != "Time"]
+            df_raw[wells] = df_raw[wells].apply(pd.to_numeric, errors="coerce").astype("float32")
+    df_raw.columns = df_raw.columns.str.strip()
+
+    df_data = df_raw[["Time"] + [c for c in df_raw.columns if c in valid_wells]].copy()
+    with profile_stage("parse_time"):
+        df_data["Hours"] = parse_time_series(df_data["Time"])
+    df_data.dropna(subset=["Hours"], inplace=True)
+    df_data.sort_values("Hours", inplace=True)
+    return df_data
+
+
+# --- Wide Matrix Data Model ---
+@dataclass
+class PlateMatrix:
+    """
+    (timepoints x wells) float32 OD 행렬 + well -> group 정수 코드
+    Long Format 대신 이 구조로 보정/통계를 계산하고, 최종 통계 테이블만 Long Format으로 만듦
+    """
+    hours: np.ndarray        # (T,) 시간순 정렬
+    times: np.ndarray        # (T,) 원본 Time 문자열
+    wells: np.ndarray        # (W,) 데이터 파일의 well 순서
+    values: np.ndarray       # (T, W) float32
+    groups: np.ndarray       # (G,) group 이름 (정렬)
+    group_codes: np.ndarray  # (W,) well -> groups 인덱스
+
+    @property
+    def well_groups(self):
+        return self.groups[self.group_codes]
+
+
+def build_plate(df_data, layout):
+    """
+    load_data 결과 + CompiledLayout -> PlateMatrix (layout에 있는 well만)
+    """
+    columns, wells, groups, group_codes = layout.select(list(df_data.columns))
+
+    return PlateMatrix(
+        hours=df_data["Hours"].to_numpy(dtype=np.float64),
+        times=df_data["Time"].to_numpy(dtype=object),
+        wells=wells,
+        values=np.ascontiguousarray(df_data.iloc[:, columns].to_numpy(dtype=np.float32)),
+        groups=groups,
+        group_codes=group_codes,
+    )
+
+
+def read_plate(layout_file, data_file, engine="c"):
+    """Layout + Raw Data 파일 -> PlateMatrix"""
+    with profile_stage("layout"):
+        layout = compile_layout(layout_file)
+    df_data = load_data(data_file, layout.index, engine)
+    with profile_stage("build matrix"):
+        return build_plate(df_data, layout)
+
+
+def group_buckets(group_codes, n_groups):
+    """
+    replicate 수가 같은 group끼리 묶어 (T, G_n, n) 블록으로 꺼낼 수 있게 인덱스 생성
+    반환: [(group 인덱스 (G_n,), well 인덱스 (G_n, n)), ...]  (replicate 수 종류만큼)
+    """
+    order = np.argsort(group_codes, kind="stable")
+    counts = np.bincount(group_codes, minlength=n_groups)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    buckets = []
+    for n in np.unique(counts[counts > 0]):
+        group_idx = np.flatnonzero(counts == n)
+        buckets.append((group_idx, order[starts[group_idx][:, None] + np.arange(n)]))
+    return buckets
+
+
+def sorted_median(srt, count):
+    """NaN이 뒤로 정렬된 (..., n) 배열의 중앙값 (유효 개수 count 기준, 0개면 NaN)"""
+    lo = np.clip((count - 1) // 2, 0, None)[..., None]
+    hi = np.clip(count // 2, 0, srt.shape[-1] - 1)[..., None]
+    median = (np.take_along_axis(srt, lo, -1) + np.take_along_axis(srt, hi, -1))[..., 0] / 2
+    return np.where(count > 0, median, np.nan)
+
+
+def group_reduce(values, group_codes, n_groups, robust=False, trim=0.1, mad_floor=0.01):
+    """
+    (T, W) 행렬을 group별로 한 번에 집계 -> mean/std/median/count 각각 (T, G)
+    NaN은 제외 (pandas groupby와 같은 기준, std는 ddof=1)
+    robust=True 이면 같은 패스에서 블록을 한 번 정렬해 추가 계산
+    - trimmed_mean: 양쪽에서 trim 비율만큼 replicate를 뺀 평균 (T, G)
+    - mad: 중앙값 절대편차 x 1.4826 (정규분포 SD 스케일) (T, G)
+    - z: replicate별 robust z-score (x - median) / max(mad, mad_floor) (T, W), replicate 3개 미만이면 NaN
+    """
+    n_times = values.shape[0]
+    keys = ("mean", "std", "median") + (("trimmed_mean", "mad") if robust else ())
+    out = {key: np.full((n_times, n_groups), np.nan) for key in keys}
+    out["count"] = np.zeros((n_times, n_groups), dtype=np.int64)
+    if robust:
+        out["z"] = np.full(values.shape, np.nan)
+
+    for group_idx, cols in group_buckets(group_codes, n_groups):
+        block = values[:, cols].astype(np.float64)  # (T, G_n, n)
+        valid = ~np.isnan(block)
+        count = valid.sum(axis=2)
+        filled = np.where(valid, block, 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = filled.sum(axis=2) / count
+            sq = np.where(valid, (block - mean[..., None]) ** 2, 0.0).sum(axis=2)
+            std = np.sqrt(sq / (count - 1))
+
+        if robust:
+            srt = np.sort(block, axis=2)  # NaN은 뒤로
+            median = sorted_median(srt, count)
+
+            cut = np.floor(trim * count).astype(np.int64)[..., None]
+            pos = np.arange(block.shape[2])
+            kept = (pos >= cut) & (pos < count[..., None] - cut)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                trimmed = np.where(kept, srt, 0.0).sum(axis=2) / kept.sum(axis=2)
+
+            mad = sorted_median(np.sort(np.abs(block - median[..., None]), axis=2), count) * 1.4826
+            z = (block - median[..., None]) / np.maximum(mad, mad_floor)[..., None]
+            out["trimmed_mean"][:, group_idx] = trimmed
+            out["mad"][:, group_idx] = mad
+            out["z"][:, cols] = np.where((count >= 3)[..., None], z, np.nan)
+        elif valid.all():
+            median = np.median(block, axis=2)
+        else:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                median = np.nanmedian(block, axis=2)
+
+        out["mean"][:, group_idx] = np.where(count > 0, mean, np.nan)
+        out["std"][:, group_idx] = np.where(count > 1, std, np.nan)
+        out["median"][:, group_idx] = median
+        out["count"][:, group_idx] = count
+    return out
+
+
+# --- Outlier Replicates ---
+def outlier_wells(plate, z_threshold=3.5, min_fraction=0.2, trim=0.1, mad_floor=0.01):
+    """
+    replicate별 robust z-score로 튀는 well 찾기 (기포, 결로 등)
+    |z| > z_threshold 인 시점 비율이 min_fraction 이상이면 outlier
+    반환: well별 테이블 (Well, Group, outlier_fraction, max_abs_z, outlier)
+    """
+    z = group_reduce(plate.values, plate.group_codes, len(plate.groups), True, trim, mad_floor)["z"]
+    abs_z = np.abs(z)
+    measured = (~np.isnan(z)).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraction = np.where(measured > 0, (abs_z > z_threshold).sum(axis=0) / measured, 0.0)
+    return pd.DataFrame({
+        "Well": plate.wells,
+        "Group": plate.well_groups,
+        "outlier_fraction": fraction,
+        "max_abs_z": np.fmax.reduce(abs_z, axis=0),
+        "outlier": fraction >= min_fraction,
+    })
+
+
+def exclude_wells(plate, mask):
+    """mask(W,)가 True인 well을 NaN으로 (통계/보정에서 제외)"""
+    if not mask.any():
+        return plate
+    values = plate.values.copy()
+    values[:, mask] = np.nan
+    return replace(plate, values=values)
+
+
+# --- Blank Correction ---
+BLANK_MODES = ["First timepoint", "Per timepoint", "Rolling median", "Per plate"]
+
+
+def blank_offsets(plate, mode="First timepoint", window=5):
+    """
+    well마다 빼야 할 blank 값을 한 번에 계산 -> (T 또는 1, W) 배열 (blank가 없으면 None)
+    - First timepoint: 조건별 첫 시점 blank 평균
+    - Per timepoint: 조건별, 시점별 blank 평균
+    - Rolling median: 시점별 blank 평균의 이동 중앙값 (window = 시점 수)
+    - Per plate: 플레이트 전체 blank 평균 하나를 모든 well에 적용
+    조건(Group의 '-' 뒤)은 group당 한 번만 계산하고, well에는 정수 코드로 매핑함
+    """
+    cond_codes, conditions, blank_groups = group_conditions(plate.groups)
+    well_cond = cond_codes[plate.group_codes]
+    is_blank = blank_groups[plate.group_codes]
+    if not is_blank.any() or len(plate.hours) == 0:
+        return None
+
+    blank_values = plate.values[:, is_blank].astype(np.float64)
+    if mode == "Per plate":
+        return np.full((1, len(plate.wells)), np.nanmean(blank_values))
+    if mode == "First timepoint":
+        blank_values = blank_values[:1]
+
+    # (시점, 조건)별 blank 평균: one-hot 행렬곱으로 조건별 합/개수 계산
+    onehot = np.zeros((is_blank.sum(), len(conditions)))
+    onehot[np.arange(len(onehot)), well_cond[is_blank]] = 1
+    valid = ~np.isnan(blank_values)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        table = (np.where(valid, blank_values, 0.0) @ onehot) / (valid @ onehot)
+
+    if mode == "Rolling median":
+        table = pd.DataFrame(table).rolling(window, center=True, min_periods=1).median().to_numpy()
+
+    # blank가 없는 조건은 보정하지 않음
+    return np.nan_to_num(table[:, well_cond], nan=0.0)
+
+
+def correct_blanks(plate, blank_mode="First timepoint", blank_window=5, clip_negative=True):
+    """
+    blank_offsets를 빼서 보정한 PlateMatrix 반환 -> (plate, blank 발견 여부)
+    blank_mode=None 이면 보정하지 않음
+    """
+    if blank_mode is None:
+        return plate, False
+    with profile_stage("blank correction"):
+        offsets = blank_offsets(plate, blank_mode, blank_window)
+        if offsets is None:
+            return plate, False
+
+        values = (plate.values - offsets).astype(np.float32)
+        if clip_negative:
+            np.clip(values, 0, None, out=values)
+        return replace(plate, values=values), True
+
+
+# --- Statistics ---
+def group_stats(plate, robust=False, trim=0.1):
+    """
+    Group x Hours 별 mean / std / median / count / sem (시간순 정렬, Long Format)
+    robust=True 이면 trimmed_mean / mad 열 추가
+    """
+    with profile_stage("group stats"):
+        reduced = group_reduce(plate.values, plate.group_codes, len(plate.groups), robust, trim)
+        n_times, n_groups = len(plate.hours), len(plate.groups)
+        keys = ("mean", "std", "median", "count") + (("trimmed_mean", "mad") if robust else ())
+
+        stats = pd.DataFrame({
+            "Group": np.tile(plate.groups, n_times),
+            "Hours": np.repeat(plate.hours, n_groups),
+            **{key: reduced[key].ravel() for key in keys},
+        })
+        stats['sem'] = stats['std'] / np.sqrt(stats['count'])
+        return stats
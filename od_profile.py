@@ -0,0 +1,169 @@
+"""
+OD 파이프라인 단계별 시간 / 최대 메모리 측정 (opt-in)
+profile_stage()는 활성화된 Profiler가 없으면 아무것도 하지 않으므로 처리 코드에 그대로 둬도 됨
+
+    profiler = Profiler(trace_memory=True)
+    with profiler.activate():
+        plate = read_plate(...)
+    print(profiler.table())
+"""
+import json
+import platform
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+_active = ContextVar("od_profiler", default=None)
+
+# tracemalloc은 프로세스 전체에 하나 -> 여러 세션 / 작업 풀 스레드의 Profiler가 같이 씀
+# 처음 activate한 Profiler가 start, 마지막으로 끝나는 Profiler가 stop (refcount)
+# reset_peak는 memory를 추적하는 Profiler가 하나뿐일 때만 호출하고,
+# 단계 도중 다른 Profiler가 같이 추적했으면 그 단계의 peak_mb는 기록하지 않음 (None)
+_trace_lock = threading.Lock()
+_tracers = 0
+_trace_generation = 0
+_owns_tracing = False
+
+
+def _start_tracing():
+    global _tracers, _trace_generation, _owns_tracing
+    with _trace_lock:
+        if _tracers == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _owns_tracing = True
+        _tracers += 1
+        _trace_generation += 1
+
+
+def _stop_tracing():
+    global _tracers, _owns_tracing
+    with _trace_lock:
+        _tracers -= 1
+        if _tracers == 0 and _owns_tracing:
+            tracemalloc.stop()
+            _owns_tracing = False
+
+
+class Profiler:
+    """
+    단계(stage)별 경과 시간과 tracemalloc 최대 메모리(단계 시작 시점 대비 증가분) 기록
+    단계는 중첩 가능하며, 이름은 "바깥 › 안쪽" 경로로 기록됨
+    다른 Profiler가 같이 메모리를 추적한 단계는 peak_mb = None (측정 불가)
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.records = []
+        self.meta = {}
+        self.started = None
+        self._stack = []
+
+    @contextmanager
+    def activate(self):
+        if self.trace_memory:
+            _start_tracing()
+        token = _active.set(self)
+        start = self.started = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.meta["total_seconds"] = time.perf_counter() - start
+            _active.reset(token)
+            if self.trace_memory:
+                _stop_tracing()
+
+    @contextmanager
+    def stage(self, name):
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        frame = {"name": name, "base": 0, "peak": 0, "generation": None}
+        if tracing:
+            with _trace_lock:
+                if _tracers == 1:
+                    current, peak = tracemalloc.get_traced_memory()
+                    if self._stack:
+                        # 안쪽 단계가 reset_peak 하기 전까지의 바깥 단계 최댓값 보존
+                        self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+                    tracemalloc.reset_peak()
+                    frame["base"] = current
+                    frame["generation"] = _trace_generation
+        path = " › ".join([f["name"] for f in self._stack] + [name])
+        self._stack.append(frame)
+        record = {"stage": path, "depth": len(self._stack) - 1}
+        self.records.append(record)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            self._stack.pop()
+            if tracing:
+                with _trace_lock:
+                    # 단계 시작부터 혼자 추적했을 때만 (중간에 다른 Profiler가 activate하면 generation이 바뀜)
+                    exclusive = _tracers == 1 and frame["generation"] == _trace_generation
+                    peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+                record["peak_mb"] = (peak - frame["base"]) / 1e6 if exclusive else None
+                if self._stack:
+                    self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+
+    def merge(self, other):
+        """
+        다른 스레드에서 따로 기록한 Profiler (작업 풀의 Job)의 단계를 현재 단계 아래에 추가
+        Profiler 하나는 한 스레드에서만 기록하므로 작업마다 따로 만들고 끝난 뒤 합침
+        """
+        prefix = [f["name"] for f in self._stack]
+        for record in other.records:
+            self.records.append(
+                dict(record, stage=" › ".join(prefix + [record["stage"]]), depth=record["depth"] + len(prefix))
+            )
+
+    def table(self):
+        """단계별 기록 DataFrame (실행 순서)"""
+        columns = ["stage", "depth", "seconds"] + (["peak_mb"] if self.trace_memory else [])
+        return pd.DataFrame(self.records, columns=columns)
+
+    def to_json(self):
+        report = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            **self.meta,
+            "trace_memory": self.trace_memory,
+            "versions": {
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "pandas": pd.__version__,
+            },
+            "stages": self.records,
+        }
+        return json.dumps(report, indent=2, ensure_ascii=False, default=str)
+
+
+@contextmanager
+def profile_stage(name):
+    """활성화된 Profiler가 있을 때만 단계 기록"""
+    profiler = _active.get()
+    if profiler is None:
+        yield
+        return
+    with profiler.stage(name):
+        yield
+
+
+def is_profiling():
+    return _active.get() is not None
+
+
+def active_profiler():
+    """현재 스레드 (context)의 Profiler 또는 None"""
+    return _active.get()
+
+
+def profile_meta(**meta):
+    """활성화된 Profiler 보고서에 파일 이름/크기 등 기록"""
+    profiler = _active.get()
+    if profiler is not None:
+        profiler.meta.update(meta)
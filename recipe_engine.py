@@ -0,0 +1,355 @@
+"""
+배지 레시피 공용 엔진
+recipes/*.yaml (또는 .json)에 적힌 레시피를 읽고 검증해서 캐시한 뒤, 어떤 레시피든 같은 UI로 렌더링
+새 배지는 recipes/에 파일 하나만 추가하면 됨
+
+레시피 파일:
+    title, page_title, caption, icon, per_volume (mL, 기본 1000), checklist_title
+    stocks:      id, name, concentration + unit (g/L, mg/mL, %), label, format,
+                 ingredients (stock 1 mL 기준), steps ({solute}, {volume}, {<id>})
+    ingredients: id, name, catalog, amount (per_volume 기준), unit, format, stock (stock id), target
+    phases:      title, info, warning, steps ({<id>} -> scale된 양, {<id>.label} -> 이름)
+"""
+import json
+import os
+import string
+
+import pandas as pd
+import streamlit as st
+
+from checklist import checklist, run_settings
+
+RECIPE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "recipes")
+RECIPE_EXTENSIONS = (".yaml", ".yml", ".json")
+UNITS = ("g", "mg", "mL", "µL", "L")
+# 농도 단위 -> stock 1 mL에 녹일 g
+CONCENTRATION_UNITS = {"g/L": 1e-3, "mg/mL": 1e-3, "%": 1e-2}
+DEFAULT_FORMAT = ".2f"
+# 같은 단위끼리 합산할 때 mL로 변환
+TO_ML = {"mL": 1.0, "µL": 1e-3, "L": 1e3}
+
+
+class RecipeError(ValueError):
+    """레시피 파일 형식 오류 (파일 이름 포함)"""
+
+
+class Amount(str):
+    """step 문자열에 들어가는 양 ("12.34 mL"), {id.label}로 이름도 사용 가능"""
+
+    def __new__(cls, text, label):
+        amount = super().__new__(cls, text)
+        amount.label = label
+        return amount
+
+
+def read_recipe_file(path):
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".json"):
+            return json.load(f)
+        import yaml
+
+        return yaml.safe_load(f)
+
+
+def concentration_label(concentration, unit):
+    return f"{concentration:g}%" if unit == "%" else f"{concentration:g} {unit}"
+
+
+def ingredient_table(items, where, stocks=None):
+    """
+    ingredients 리스트 -> DataFrame (id, name, catalog, amount, unit, format, stock, label, target)
+    stock을 참조하면 name/label은 stock에서 가져옴
+    """
+    rows = []
+    for item in items:
+        missing = {"id", "amount", "unit"} - set(item)
+        if missing:
+            raise RecipeError(f"{where}: ingredient {item} is missing {sorted(missing)}")
+        if item["unit"] not in UNITS:
+            raise RecipeError(f"{where}: unknown unit {item['unit']!r} (use one of {UNITS})")
+        stock_id = item.get("stock")
+        if stock_id is not None:
+            if not stocks or stock_id not in stocks:
+                raise RecipeError(f"{where}: ingredient {item['id']!r} refers to unknown stock {stock_id!r}")
+            stock = stocks[stock_id]
+            name = item.get("name", f"{stock['name']} stock")
+            label = stock.get("label") or f"{stock['name']} stock ({stock['concentration_label']})"
+        else:
+            if "name" not in item:
+                raise RecipeError(f"{where}: ingredient {item['id']!r} needs a name or a stock")
+            name = item["name"]
+            label = name
+        rows.append({
+            "id": item["id"],
+            "name": name,
+            "catalog": item.get("catalog", ""),
+            "amount": float(item["amount"]),
+            "unit": item["unit"],
+            "format": item.get("format", DEFAULT_FORMAT),
+            "stock": stock_id or "",
+            "label": label,
+            "target": bool(item.get("target", False)),
+        })
+    table = pd.DataFrame(rows, columns=["id", "name", "catalog", "amount", "unit", "format", "stock", "label", "target"])
+    duplicated = table["id"][table["id"].duplicated()]
+    if len(duplicated):
+        raise RecipeError(f"{where}: duplicated ingredient ids {sorted(set(duplicated))}")
+    table["key"] = ingredient_keys(table)
+    return table
+
+
+def ingredient_keys(table):
+    """
+    여러 배지에서 같은 재료를 합치기 위한 키
+    stock은 이름 + 농도 (Vitamin K1 5 g/L와 10 g/L는 다름), 나머지는 카탈로그 번호, 없으면 이름
+    """
+    code = table["catalog"].str.split(",").str[0].str.strip()
+    name = table["name"].str.casefold().str.strip()
+    key = ("name:" + name).where(code == "", "cat:" + code)
+    return key.where(table["stock"] == "", "stock:" + table["label"])
+
+
+def check_steps(steps, ids, where):
+    """step의 {id} / {id.label}이 모두 정의돼 있는지 확인"""
+    for step in steps:
+        try:
+            fields = [field for _, field, _, _ in string.Formatter().parse(step) if field is not None]
+        except ValueError as e:
+            raise RecipeError(f"{where}: {e} in step {step!r}") from None
+        for field in fields:
+            key, _, attr = field.partition(".")
+            if key not in ids or attr not in ("", "label"):
+                raise RecipeError(f"{where}: unknown placeholder {{{field}}} in step {step!r}")
+
+
+def validate_stock(stock, where):
+    for field in ("id", "name", "concentration", "unit", "steps"):
+        if field not in stock:
+            raise RecipeError(f"{where}: stock is missing {field!r}")
+    if stock["unit"] not in CONCENTRATION_UNITS:
+        raise RecipeError(f"{where}: stock {stock['id']!r} unit must be one of {list(CONCENTRATION_UNITS)}")
+    where = f"{where} stock {stock['id']!r}"
+    stock = dict(stock)
+    stock["concentration_label"] = concentration_label(stock["concentration"], stock["unit"])
+    stock.setdefault("label", None)
+    # 농도에서 바로 계산하는 용질 + 만들 부피 (stock 1 mL 기준)
+    solute = {
+        "id": "solute", "name": stock["name"], "amount": stock["concentration"] * CONCENTRATION_UNITS[stock["unit"]],
+        "unit": "g", "format": stock.get("format", DEFAULT_FORMAT),
+    }
+    volume = {"id": "volume", "name": "Total volume", "amount": 1, "unit": "mL", "format": "g", "target": True}
+    stock["ingredients"] = ingredient_table([solute, volume] + stock.get("ingredients", []), where)
+    check_steps(stock["steps"], set(stock["ingredients"]["id"]), where)
+    return stock
+
+
+def validate_recipe(name, recipe):
+    """파일에서 읽은 dict -> 검증 + 정리된 레시피 (ingredients는 DataFrame)"""
+    where = f"recipes/{name}"
+    if not isinstance(recipe, dict):
+        raise RecipeError(f"{where}: expected a mapping at the top level")
+    for field in ("title", "ingredients", "phases"):
+        if field not in recipe:
+            raise RecipeError(f"{where}: missing {field!r}")
+
+    stocks = {}
+    for stock in recipe.get("stocks", []):
+        stock = validate_stock(stock, where)
+        if stock["id"] in stocks:
+            raise RecipeError(f"{where}: duplicated stock id {stock['id']!r}")
+        stocks[stock["id"]] = stock
+
+    ingredients = ingredient_table(recipe["ingredients"], where, stocks)
+    ids = set(ingredients["id"])
+    for phase in recipe["phases"]:
+        if "title" not in phase or "steps" not in phase:
+            raise RecipeError(f"{where}: each phase needs a title and steps")
+        check_steps(phase["steps"], ids, f"{where} {phase['title']!r}")
+
+    return {
+        "name": name,
+        "title": recipe["title"],
+        "page_title": recipe.get("page_title", recipe["title"]),
+        "icon": recipe.get("icon", "🧫"),
+        "caption": recipe.get("caption"),
+        "per_volume": float(recipe.get("per_volume", 1000)),
+        "checklist_title": recipe.get("checklist_title", "Step-by-Step Checklist"),
+        "stocks": stocks,
+        "ingredients": ingredients,
+        "phases": recipe["phases"],
+    }
+
+
+def recipe_files(recipe_dir=RECIPE_DIR):
+    """(파일 이름, 수정 시각) 튜플 -> 파일이 바뀌면 캐시 키가 바뀜"""
+    return tuple(
+        (entry.name, entry.stat().st_mtime_ns)
+        for entry in sorted(os.scandir(recipe_dir), key=lambda e: e.name)
+        if entry.name.endswith(RECIPE_EXTENSIONS)
+    )
+
+
+@st.cache_resource
+def load_recipes(recipe_dir, files):
+    """
+    레시피 폴더 전체를 읽고 검증 (files가 같으면 캐시된 결과 사용)
+    반환: {이름 (확장자 제외): 레시피}
+    """
+    recipes = {}
+    for file_name, _ in files:
+        name = os.path.splitext(file_name)[0]
+        try:
+            data = read_recipe_file(os.path.join(recipe_dir, file_name))
+        except Exception as e:
+            raise RecipeError(f"recipes/{file_name}: {e}") from e
+        recipes[name] = validate_recipe(name, data)
+    return recipes
+
+
+def get_recipes(recipe_dir=RECIPE_DIR):
+    return load_recipes(recipe_dir, recipe_files(recipe_dir))
+
+
+def scale_amounts(table, factor):
+    """
+    ingredient 표 전체를 한 번에 scale -> {id: Amount("12.34 mL")}
+    """
+    amounts = table["amount"].to_numpy() * factor
+    return {
+        ingredient_id: Amount(f"{amount:{fmt}} {unit}", label)
+        for ingredient_id, amount, fmt, unit, label in zip(
+            table["id"], amounts, table["format"], table["unit"], table["label"]
+        )
+    }
+
+
+def media_table(recipes):
+    """모든 레시피 ingredient 표를 하나로 (recipe 열 추가)"""
+    return pd.concat(
+        [recipe["ingredients"].assign(recipe=name) for name, recipe in recipes.items()], ignore_index=True
+    )
+
+
+def plan_media(recipes, orders):
+    """
+    주문 표 (Medium, Plates, Vol/Plate (mL), Margin (%)) -> 모든 배지 재료를 한 번에 계산
+    반환: (배지별 재료 양, 공통 재료 합계, stock 총 사용량)
+    같은 배지 주문이 여러 줄이면 합산, target (make up to 부피)은 합계에서 제외
+    """
+    orders = orders[orders["Medium"].isin(list(recipes))]
+    final_vol = orders["Plates"] * orders["Vol/Plate (mL)"] * (1 + orders["Margin (%)"] / 100)
+    per_volume = orders["Medium"].map({name: recipe["per_volume"] for name, recipe in recipes.items()})
+    factor = (final_vol / per_volume).groupby(orders["Medium"]).sum()
+
+    table = media_table(recipes)
+    table = table[table["recipe"].isin(factor.index)].copy()
+    table["total"] = table["amount"].to_numpy() * factor.reindex(table["recipe"]).to_numpy()
+    table["Medium"] = table["recipe"].map({name: recipe["title"] for name, recipe in recipes.items()})
+    table["Ingredient"] = table["name"].where(table["stock"] == "", table["label"])
+
+    used = table[~table["target"]]
+    totals = used.groupby(["key", "unit"], sort=False).agg(
+        Ingredient=("Ingredient", "first"),
+        Catalog=("catalog", "first"),
+        Total=("total", "sum"),
+        **{"Used In": ("Medium", lambda media: ", ".join(dict.fromkeys(media)))},
+    ).reset_index().rename(columns={"unit": "Unit"})
+
+    stock_rows = used[used["stock"] != ""]
+    stocks = stock_rows.assign(volume_ml=stock_rows["total"] * stock_rows["unit"].map(TO_ML)).groupby(
+        "key", sort=False
+    ).agg(recipe=("recipe", "first"), stock=("stock", "first"), label=("label", "first"), volume_ml=("volume_ml", "sum"))
+    return table, totals[["Ingredient", "Catalog", "Total", "Unit", "Used In"]], stocks.reset_index(drop=True)
+
+
+# --- UI ---
+def volume_settings():
+    """
+    부피 / plate 수 + safety margin 설정 -> 최종 부피 (mL)
+    """
+    with st.expander("⚙️ Calculation Settings", expanded=True):
+        col1, col2 = st.columns(2)
+        with col1:
+            calc_mode = st.radio("Mode:", ["Total Volume (mL)", "Plate Count"], horizontal=True)
+
+        with col2:
+            margin_pct = st.slider("Safety Margin (%)", 0, 20, 10)
+
+        if calc_mode == "Total Volume (mL)":
+            base_volume = st.number_input("Target Volume (mL)", value=1000, step=100)
+        else:
+            num_plates = st.number_input("Number of Plates", value=40)
+            vol_per_plate = st.number_input("Vol/Plate (mL)", value=25)
+            base_volume = num_plates * vol_per_plate
+
+        final_vol = base_volume * (1 + margin_pct / 100)
+        st.metric(label="Final Volume to Prepare", value=f"{final_vol:.1f} mL")
+    return final_vol
+
+
+def render_stocks(recipe):
+    """스톡 용액 제조 계산기"""
+    st.header("1. Stock Solution Calculator")
+
+    stocks = list(recipe["stocks"].values())
+    labels = [stock["label"] or f"{stock['name']} ({stock['concentration_label']})" for stock in stocks]
+    choice = st.selectbox("Select Stock Solution", range(len(stocks)), format_func=labels.__getitem__)
+    make_vol = st.number_input("Volume to prepare (mL)", value=50, step=10)
+
+    st.divider()
+    st.write(f"### Recipe for {make_vol} mL of {labels[choice]}")
+    st.markdown(stock_steps(stocks[choice], make_vol))
+
+
+def stock_steps(stock, make_vol):
+    """make_vol (mL) 만큼 stock을 만드는 번호 매긴 절차 (markdown)"""
+    amounts = scale_amounts(stock["ingredients"], make_vol)
+    return "\n".join(f"{i}. {step.format(**amounts)}" for i, step in enumerate(stock["steps"], 1))
+
+
+def render_medium(recipe):
+    """
+    배지 제조: 설정 -> phase별 체크리스트 (번호는 phase를 넘어 이어짐)
+    체크 상태는 단계 번호로 저장 (부피를 바꿔도 유지), phase마다 fragment라 체크해도 양을 다시 계산하지 않음
+    """
+    final_vol = volume_settings()
+    amounts = scale_amounts(recipe["ingredients"], final_vol / recipe["per_volume"])
+    run_settings(recipe["name"])
+
+    number = 0
+    for phase in recipe["phases"]:
+        st.divider()
+        st.header(phase["title"])
+        if phase.get("info"):
+            st.info(phase["info"])
+        if phase.get("warning"):
+            st.warning(phase["warning"])
+
+        st.markdown(f"#### 📝 {recipe['checklist_title']}")
+        items = []
+        for step in phase["steps"]:
+            number += 1
+            items.append((str(number), f"{number}. {step.format(**amounts)}"))
+        checklist(recipe["name"], items)
+
+
+def render_recipe(recipe):
+    st.title(f"{recipe['icon']} {recipe['title']}")
+    if recipe["caption"]:
+        st.caption(recipe["caption"])
+
+    if recipe["stocks"]:
+        stock_tab, medium_tab = st.tabs(["🧪 Stock Solutions", "🥣 Media Preparation"])
+        with stock_tab:
+            render_stocks(recipe)
+    else:
+        [medium_tab] = st.tabs(["🥣 Media Preparation"])
+    with medium_tab:
+        render_medium(recipe)
+
+
+def run_recipe(name):
+    """단일 레시피 앱 (bb.py 등에서 호출)"""
+    recipe = get_recipes()[name]
+    st.set_page_config(page_title=recipe["page_title"], page_icon=recipe["icon"])
+    render_recipe(recipe)
@@ -0,0 +1,38 @@
+"""
+모든 프로토콜 / 분석 앱을 하나의 Streamlit 서버에서 여러 페이지로 실행
+
+    streamlit run streamlit_app.py
+
+페이지 스크립트는 열릴 때만 실행되므로 pandas / numpy / matplotlib 같은 무거운 모듈은
+그 페이지를 처음 열 때 import됨 (Home은 streamlit만 사용)
+각 스크립트는 지금처럼 따로 실행해도 됨 (streamlit run bb.py)
+"""
+import streamlit as st
+
+PAGES = {
+    "Media": [
+        st.Page("bb.py", title="BB Agar", icon="🧫"),
+        st.Page("faa.py", title="FAA", icon="🧫"),
+        st.Page("modified-gam.py", title="GAM Modified + Vitamin K1", icon="🧫"),
+        st.Page("media-recipes.py", title="All Media Recipes", icon="📚"),
+        st.Page("media-planner.py", title="Media Production Planner", icon="🗓️"),
+    ],
+    "Protocols": [
+        st.Page("bulk-rna-seq-protocol.py", title="RNA-seq Library Prep", icon="🧬"),
+    ],
+    "Analysis": [
+        st.Page("od-plotter-spectramax.py", title="OD Plotter (SpectraMax)", icon="📈"),
+    ],
+}
+
+
+def home():
+    st.title("🧪 Protocols")
+    st.caption("protocol.io is overpriced and i am broke.")
+    for section, pages in PAGES.items():
+        st.subheader(section)
+        for page in pages:
+            st.page_link(page)
+
+
+st.navigation({"": [st.Page(home, title="Home", icon="🏠", default=True)], **PAGES}).run()